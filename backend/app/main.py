@@ -4,16 +4,23 @@ import argparse
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Tuple
 
+import anyio.to_thread
 from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.routes import router as app_router
+from app.services.transcript_service import transcript_service
+from app.services.webhook_service import webhook_service
 from app.websockets import websocket_router
+from core.process import fill_standby_pool, shutdown_standby_pool
 from meetingbaas_pipecat.utils.logger import configure_logger
+from scripts.meetingbaas_api import close_session as close_meetingbaas_session
 from utils.ngrok import LOCAL_DEV_MODE, NGROK_URL_INDEX, NGROK_URLS, load_ngrok_urls
 
 # Configure logging with the prettier logger
@@ -43,6 +50,37 @@ async def api_key_middleware(request: Request, call_next):
     return await call_next(request)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background services in dependency order and stop them in reverse."""
+    # Size the threadpool used for blocking work inside async routes
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.getenv("THREAD_POOL_SIZE", 100))
+
+    # Load stored transcript metadata without blocking the event loop
+    await transcript_service.ensure_loaded()
+
+    # Pre-start Pipecat processes so new clients skip their import time
+    await run_in_threadpool(fill_standby_pool)
+
+    # Start the background worker that processes queued webhook events
+    webhook_service.start()
+
+    yield
+
+    # Finish queued webhook events; these may start recording downloads
+    await webhook_service.stop()
+
+    # Terminate standby Pipecat processes that never got a client
+    await run_in_threadpool(shutdown_standby_pool)
+
+    # Wait for recording downloads, flush metadata and close the download session
+    await transcript_service.close()
+
+    # Close the pooled MeetingBaas HTTP session
+    await close_meetingbaas_session()
+
+
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -61,6 +99,8 @@ def create_app() -> FastAPI:
         openapi_url="/openapi.json",  # Explicitly set the OpenAPI schema URL
         docs_url="/docs",  # Swagger UI path
         # redoc_url="/redoc",  # Explicitly set the ReDoc URL
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     # Add API key middleware
@@ -293,6 +333,9 @@ def start_server(host: str = "0.0.0.0", port: int = 8766, local_dev: bool = Fals
         host,
         "--port",
         str(port),
+        # Audio frames don't compress, so skip permessage-deflate on the WebSockets
+        "--ws-per-message-deflate",
+        "false",
     ]
 
     if local_dev:
@@ -1,9 +1,15 @@
 """Data models for the Speaking Meeting Bot API."""
 
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from typing import Annotated, Any, Dict, List, Literal, Optional, Sequence, Union
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    with_config,
+)
+from typing_extensions import TypedDict
 
 
 class PersonaBase(BaseModel):
@@ -14,19 +20,31 @@ class PersonaBase(BaseModel):
     image: Optional[str] = None
 
 
-class PersonaCreate(PersonaBase):
-    pass
-
-
-class PersonaUpdate(PersonaBase):
-    pass
+# Create and update bodies are structurally identical, so they share one
+# validator and serializer instead of each building its own core schema
+PersonaCreate = PersonaBase
+PersonaUpdate = PersonaBase
 
 
 class Persona(PersonaBase):
     id: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# OpenAPI example for BotRequest, built once at import
+_BOT_REQUEST_EXAMPLE: Dict[str, Any] = {
+    "meeting_url": "https://meet.google.com/abc-defg-hij",
+    "bot_name": "Meeting Assistant",
+    "personas": ["helpful_assistant", "meeting_facilitator"],
+    "bot_image": "https://example.com/bot-avatar.png",
+    "entry_message": "Hello! I'm here to assist with the meeting.",
+    "text_message": "Meeting Assistant has joined the meeting.",
+    "context_info": "This is a quarterly sales review meeting. We'll be discussing Q3 results and Q4 forecasts. The team missed their targets by 15%.",
+    "enable_tools": True,
+    "webhook_url": "https://example.com/meetingbaas/webhook",
+    "extra": {"company": "ACME Corp", "meeting_purpose": "Weekly sync"},
+}
 
 
 class BotRequest(BaseModel):
@@ -38,7 +56,7 @@ class BotRequest(BaseModel):
         description="URL of the Google Meet, Zoom or Microsoft Teams meeting to join",
     )
     bot_name: str = Field("", description="Name to display for the bot in the meeting")
-    personas: Optional[List[str]] = Field(
+    personas: Optional[Sequence[str]] = Field(
         None,
         description="List of persona names to use. The first available will be selected.",
     )
@@ -55,21 +73,7 @@ class BotRequest(BaseModel):
 
     # NOTE: streaming_audio_frequency is intentionally excluded and handled internally
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "meeting_url": "https://meet.google.com/abc-defg-hij",
-                "bot_name": "Meeting Assistant",
-                "personas": ["helpful_assistant", "meeting_facilitator"],
-                "bot_image": "https://example.com/bot-avatar.png",
-                "entry_message": "Hello! I'm here to assist with the meeting.",
-                "text_message": "Meeting Assistant has joined the meeting.",
-                "context_info": "This is a quarterly sales review meeting. We'll be discussing Q3 results and Q4 forecasts. The team missed their targets by 15%.",
-                "enable_tools": True,
-                "webhook_url": "https://example.com/meetingbaas/webhook",
-                "extra": {"company": "ACME Corp", "meeting_purpose": "Weekly sync"},
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _BOT_REQUEST_EXAMPLE})
 
 
 class JoinResponse(BaseModel):
@@ -80,12 +84,24 @@ class JoinResponse(BaseModel):
         description="The MeetingBaas bot ID used for API operations with MeetingBaas",
     )
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "JoinResponse":
+        """Build from internally generated data without running validation."""
+        return cls.model_construct(**data)
+
 
 class LeaveResponse(BaseModel):
     """Response model for a bot leaving a meeting"""
 
     ok: bool
 
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "LeaveResponse":
+        """Build from internally generated data without running validation."""
+        return cls.model_construct(**data)
+
 
 class LeaveBotRequest(BaseModel):
     """Request model for making a bot leave a meeting"""
@@ -105,48 +121,114 @@ class PersonaImageResponse(BaseModel):
     """Response model for generated persona images."""
     image_url: str = Field(..., description="URL of the generated image")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 # Models for MeetingBaas Webhook Responses
+# Words are TypedDicts rather than slotted dataclasses: validation already
+# yields plain dicts, the backend never builds words itself, and they are
+# written back to disk unchanged, so a dataclass copy would only add a
+# conversion pass (about as long as validation itself for 10k words).
 
-class WordItem(BaseModel):
+@with_config(ConfigDict(extra="ignore"))
+class WordItem(TypedDict):
     """Single word in meeting transcript with timing"""
     start: float
     end: float
     word: str
 
 
-class TranscriptSegment(BaseModel):
+class TranscriptSegment(TypedDict):
     """Segment of transcript by a single speaker"""
     speaker: str
     words: List[WordItem]
 
 
 class MeetingCompletedData(BaseModel):
-    """Data returned when a meeting is completed"""
+    """
+    Data returned when a meeting is completed.
+
+    Transcript segments and words are TypedDicts, so they are validated in the
+    same pass as this model and kept as plain dicts rather than one model
+    instance per word.
+    """
     bot_id: str
-    mp4: str  # Pre-signed S3 URL (valid for 2 hours)
+    # Pre-signed S3 URL (valid for 2 hours). Opaque to us and only handed to the
+    # downloader, so keep it a plain str rather than HttpUrl to skip URL parsing
+    mp4: str
     speakers: List[str]
     transcript: List[TranscriptSegment]
 
+    # Instances (e.g. from from_trusted) are treated as immutable once built, so
+    # wrapping one in a MeetingCompletedEvent must not copy the transcript again
+    model_config = ConfigDict(revalidate_instances="never")
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "MeetingCompletedData":
+        """Build from already-parsed webhook data without running validation."""
+        return cls.model_construct(**data)
+
 
 class MeetingFailedData(BaseModel):
     """Data returned when a meeting fails"""
     bot_id: str
     error: str
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class MeetingStatusData(BaseModel):
     """Data for status change events"""
     bot_id: str
     status: Dict[str, Any]
 
+    model_config = ConfigDict(defer_build=True)
+
+
+class MeetingCompletedEvent(BaseModel):
+    """Webhook event sent when a meeting is completed"""
+    event: Literal["complete"]
+    data: MeetingCompletedData
+
+
+class MeetingFailedEvent(BaseModel):
+    """Webhook event sent when a meeting fails"""
+    event: Literal["failed"]
+    data: MeetingFailedData
+
+
+class MeetingStatusEvent(BaseModel):
+    """Webhook event sent when a bot changes status"""
+    event: Literal["bot.status_change"]
+    data: MeetingStatusData
+
+
+# Webhook event from MeetingBaas, parsed in a single pass based on "event".
+# Unknown event types are rejected during validation.
+MeetingWebhookEvent = Annotated[
+    Union[MeetingCompletedEvent, MeetingFailedEvent, MeetingStatusEvent],
+    Field(discriminator="event"),
+]
+
+
+# Validates raw webhook bodies straight from JSON bytes. TypedDict keys in the
+# result are pydantic-core's interned field-name strings (the same objects as
+# the "start"/"words" literals), so extra sys.intern calls would be no-ops.
+WEBHOOK_EVENT_ADAPTER: TypeAdapter[MeetingWebhookEvent] = TypeAdapter(
+    MeetingWebhookEvent
+)
+
+
+# Prebuilt serializers for responses the routes return as raw JSON bytes
+JOIN_RESPONSE_ADAPTER: TypeAdapter[JoinResponse] = TypeAdapter(JoinResponse)
+PERSONA_IMAGE_RESPONSE_ADAPTER: TypeAdapter[PersonaImageResponse] = TypeAdapter(
+    PersonaImageResponse
+)
+
+
+def dump_join_response(response: JoinResponse) -> bytes:
+    """Serialize a JoinResponse to JSON bytes."""
+    return JOIN_RESPONSE_ADAPTER.dump_json(response)
+
 
-class MeetingWebhookEvent(BaseModel):
-    """Webhook event from MeetingBaas"""
-    event: str  # "complete", "failed", or "bot.status_change"
-    data: Dict[str, Any]  # Will parse this based on event type
+def dump_persona_image_response(response: PersonaImageResponse) -> bytes:
+    """Serialize a PersonaImageResponse to JSON bytes."""
+    return PERSONA_IMAGE_RESPONSE_ADAPTER.dump_json(response)
@@ -1,15 +1,26 @@
 """API routes for the Speaking Meeting Bot application."""
 
 import asyncio
+import os
+import random
+import subprocess
+import threading
 import uuid
 from datetime import datetime
-from io import BytesIO
 from typing import Any, Dict, List, Optional, Tuple
-import json
 from pathlib import Path
 
+import orjson
+from dotenv import load_dotenv
 from fastapi import APIRouter, HTTPException, Request, status
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+)
+from pydantic import ValidationError
 
 from app.models import (
     BotRequest,
@@ -20,21 +31,28 @@ from app.models import (
     Persona,
     PersonaCreate,
     PersonaUpdate,
-    MeetingWebhookEvent,
-    MeetingCompletedData,
-    MeetingFailedData,
-    MeetingStatusData,
+    WEBHOOK_EVENT_ADAPTER,
+    dump_join_response,
+    dump_persona_image_response,
 )
 from app.services.image_service import image_service
 from app.services.transcript_service import transcript_service
+from app.services.webhook_service import webhook_service
 from config.persona_utils import persona_manager
-from core.connection import MEETING_DETAILS, PIPECAT_PROCESSES, registry
+from core.connection import (
+    BAAS_TO_CLIENT,
+    MEETING_DETAILS,
+    PIPECAT_PROCESSES,
+    MeetingInfo,
+    registry,
+)
+from core.converter import converter
 from core.process import start_pipecat_process, terminate_process_gracefully
 from core.router import router as message_router
 
 # Import from the app module (will be defined in __init__.py)
 from meetingbaas_pipecat.utils.logger import logger
-from scripts.meetingbaas_api import create_meeting_bot, leave_meeting_bot
+from scripts.meetingbaas_api import create_meeting_bot_async, leave_meeting_bot_async
 from utils.ngrok import (
     LOCAL_DEV_MODE,
     determine_websocket_url,
@@ -45,36 +63,102 @@ from utils.ngrok import (
 
 router = APIRouter()
 
+# Read .env once at import instead of re-parsing it on every bot request
+load_dotenv()
+DEFAULT_WEBHOOK_URL = os.getenv("WEBHOOK_URL")
+# How long leave_bot lets a Pipecat process exit on its own after its
+# WebSocket closes before terminating it
+PIPECAT_EXIT_GRACE_SECONDS = 0.5
+
 # Persona Management Routes
-@router.get("/personas", response_model=List[Persona])
-async def list_personas():
+# Serialized GET /personas body, rebuilt lazily after any persona change
+_personas_cache: Optional[bytes] = None
+# Persona IDs used for random persona selection in join_meeting
+_persona_keys_cache: Optional[Tuple[str, ...]] = None
+# Bumped on every persona change. Sync routes run in the threadpool, so a
+# cache built from a snapshot is only stored if no change landed meanwhile.
+_personas_ver = 0
+_personas_lock = threading.Lock()
+
+
+def _invalidate_personas_cache() -> None:
+    """Drop cached persona data so it is rebuilt from the manager on next use."""
+    global _personas_cache, _persona_keys_cache, _personas_ver
+    with _personas_lock:
+        _personas_ver += 1
+        _personas_cache = None
+        _persona_keys_cache = None
+    persona_manager.clear_persona_cache()
+
+
+def _persona_keys() -> Tuple[str, ...]:
+    """Return the cached tuple of persona IDs, building it if needed."""
+    global _persona_keys_cache
+    keys = _persona_keys_cache
+    if keys is None:
+        version = _personas_ver
+        keys = tuple(persona_manager.personas)
+        with _personas_lock:
+            if version == _personas_ver:
+                _persona_keys_cache = keys
+    return keys
+
+
+@router.get(
+    "/personas",
+    response_class=Response,
+    responses={
+        200: {
+            "description": "List of available personas",
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": Persona.model_json_schema()}
+                }
+            },
+        }
+    },
+)
+def list_personas():
     """List all available personas."""
+    global _personas_cache
+    # Every Persona field stays in the list: PersonaCard, PersonaList and
+    # BotManager render image, description, personality and knowledge_base
+    # straight from this response. image is a short hosted URL (generated
+    # images are uploaded first), not inline base64.
     try:
-        personas = []
-        for name, data in persona_manager.personas.items():
-            persona = Persona(
-                id=name,
-                name=data.get("name", name),
-                description=data.get("description", ""),
-                personality=data.get("personality", ""),
-                knowledge_base=data.get("knowledge_base", ""),
-                image=data.get("image", ""),
-            )
-            personas.append(persona)
-        return personas
+        body = _personas_cache
+        if body is None:
+            version = _personas_ver
+            personas = [
+                {
+                    "id": name,
+                    "name": data.get("name", name),
+                    "description": data.get("description", ""),
+                    "personality": data.get("personality", ""),
+                    "knowledge_base": data.get("knowledge_base", ""),
+                    "image": data.get("image", ""),
+                }
+                for name, data in list(persona_manager.personas.items())
+            ]
+            body = orjson.dumps(personas)
+            with _personas_lock:
+                if version == _personas_ver:
+                    _personas_cache = body
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Error listing personas: {e}")
         raise HTTPException(status_code=500, detail="Failed to list personas")
 
 @router.get("/personas/{persona_id}", response_model=Persona)
-async def get_persona(persona_id: str):
+def get_persona(persona_id: str):
     """Get a specific persona by ID."""
     try:
         if persona_id not in persona_manager.personas:
             raise HTTPException(status_code=404, detail="Persona not found")
         
         data = persona_manager.personas[persona_id]
-        return Persona(
+        # Data comes from the in-memory persona store, so skip re-validation
+        return Persona.model_construct(
             id=persona_id,
             name=data.get("name", persona_id),
             description=data.get("description", ""),
@@ -89,27 +173,29 @@ async def get_persona(persona_id: str):
         raise HTTPException(status_code=500, detail="Failed to get persona")
 
 @router.post("/personas", response_model=Persona, status_code=status.HTTP_201_CREATED)
-async def create_persona(persona: PersonaCreate):
+def create_persona(persona: PersonaCreate):
     """Create a new persona."""
     try:
         persona_id = str(uuid.uuid4())
-        persona_data = persona.dict()
+        persona_data = persona.model_dump()
         persona_manager.personas[persona_id] = persona_data
-        return Persona(id=persona_id, **persona_data)
+        _invalidate_personas_cache()
+        return Persona.model_construct(id=persona_id, **persona_data)
     except Exception as e:
         logger.error(f"Error creating persona: {e}")
         raise HTTPException(status_code=500, detail="Failed to create persona")
 
 @router.put("/personas/{persona_id}", response_model=Persona)
-async def update_persona(persona_id: str, persona: PersonaUpdate):
+def update_persona(persona_id: str, persona: PersonaUpdate):
     """Update an existing persona."""
     try:
         if persona_id not in persona_manager.personas:
             raise HTTPException(status_code=404, detail="Persona not found")
         
-        persona_data = persona.dict()
+        persona_data = persona.model_dump()
         persona_manager.personas[persona_id].update(persona_data)
-        return Persona(id=persona_id, **persona_data)
+        _invalidate_personas_cache()
+        return Persona.model_construct(id=persona_id, **persona_data)
     except HTTPException:
         raise
     except Exception as e:
@@ -117,13 +203,14 @@ async def update_persona(persona_id: str, persona: PersonaUpdate):
         raise HTTPException(status_code=500, detail="Failed to update persona")
 
 @router.delete("/personas/{persona_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_persona(persona_id: str):
+def delete_persona(persona_id: str):
     """Delete a persona."""
     try:
         if persona_id not in persona_manager.personas:
             raise HTTPException(status_code=404, detail="Persona not found")
         
         del persona_manager.personas[persona_id]
+        _invalidate_personas_cache()
     except HTTPException:
         raise
     except Exception as e:
@@ -163,14 +250,7 @@ async def join_meeting(request: BotRequest, client_request: Request):
     # Get webhook URL from request or .env file
     webhook_url = request.webhook_url
     if not webhook_url:
-        # Try to get webhook URL from environment variables
-        import os
-        from dotenv import load_dotenv
-        
-        # Load .env file if it exists
-        load_dotenv()
-        
-        webhook_url = os.getenv("WEBHOOK_URL")
+        webhook_url = DEFAULT_WEBHOOK_URL
         if webhook_url:
             logger.info(f"Using webhook URL from .env file: {webhook_url}")
 
@@ -193,8 +273,6 @@ async def join_meeting(request: BotRequest, client_request: Request):
     logger.info(f"Using fixed streaming audio frequency: {streaming_audio_frequency}")
 
     # Set the converter sample rate based on our fixed streaming_audio_frequency
-    from core.converter import converter
-
     sample_rate = 16000  # Always 16000 Hz for 16khz audio
     converter.set_sample_rate(sample_rate)
     logger.info(
@@ -220,9 +298,7 @@ async def join_meeting(request: BotRequest, client_request: Request):
 
         # If the persona doesn't exist, try to use a random one
         if persona_name not in persona_manager.personas:
-            import random
-
-            available_personas = list(persona_manager.personas.keys())
+            available_personas = _persona_keys()
             if available_personas:
                 persona_name = random.choice(available_personas)
                 logger.info(f"Persona not found, using random persona: {persona_name}")
@@ -238,47 +314,32 @@ async def join_meeting(request: BotRequest, client_request: Request):
 
     # Store meeting details for when the WebSocket connects
     # Also store streaming_audio_frequency, entry_message and text_message
-    MEETING_DETAILS[bot_client_id] = (
-        request.meeting_url,
-        persona_name,
-        None,  # MeetingBaas bot ID will be set after creation
-        request.enable_tools,
-        streaming_audio_frequency,
-        request.entry_message,  # Store entry_message in MEETING_DETAILS
-        request.text_message,  # Store text_message in MEETING_DETAILS
+    MEETING_DETAILS[bot_client_id] = MeetingInfo(
+        meeting_url=request.meeting_url,
+        persona_name=persona_name,
+        meetingbaas_bot_id=None,  # MeetingBaas bot ID will be set after creation
+        enable_tools=request.enable_tools,
+        streaming_audio_frequency=streaming_audio_frequency,
+        entry_message=request.entry_message,
+        text_message=request.text_message,
     )
 
-    # Get image from persona if not specified in request
-    bot_image = request.bot_image
-    if not bot_image and persona.get("image"):
-        # Ensure the image is a string
-        try:
-            # Convert to string no matter what type it is
-            bot_image = str(persona.get("image"))
-            logger.info(f"Using persona image: {bot_image}")
-        except Exception as e:
-            logger.error(f"Error converting persona image to string: {e}")
-            bot_image = None
-
-    # Ensure the bot_image is definitely a string or None
-    if bot_image is not None:
-        try:
-            bot_image_str = str(bot_image)
-            logger.info(f"Final bot image URL: {bot_image_str}")
-        except Exception as e:
-            logger.error(f"Failed to convert bot image to string: {e}")
-            bot_image_str = None
-    else:
-        bot_image_str = None
+    # Get image from persona if not specified in request; str() is a no-op for
+    # the usual string value and covers anything else the persona file holds
+    raw_image = request.bot_image or persona.get("image")
+    bot_image_str = str(raw_image) if raw_image else None
+    if bot_image_str:
+        logger.debug(f"Final bot image URL: {bot_image_str}")
 
     # Prepare extra data with context_info if provided
-    extra_data = request.extra or {}
+    # Copied so adding context_info doesn't modify the request model's dict
+    extra_data = dict(request.extra or {})
     if request.context_info:
         extra_data["context_info"] = request.context_info
         logger.info(f"Added context info to bot: {request.context_info[:100]}...")
 
     # Create bot directly through MeetingBaas API
-    meetingbaas_bot_id = create_meeting_bot(
+    meetingbaas_bot_id = await create_meeting_bot_async(
         meeting_url=request.meeting_url,
         websocket_url=websocket_url,
         bot_id=bot_client_id,
@@ -293,23 +354,23 @@ async def join_meeting(request: BotRequest, client_request: Request):
     )
 
     if meetingbaas_bot_id:
-        # Update the meetingbaas_bot_id in MEETING_DETAILS
-        MEETING_DETAILS[bot_client_id] = (
-            request.meeting_url,
-            persona_name,
-            meetingbaas_bot_id,
-            request.enable_tools,
-            streaming_audio_frequency,
-            request.entry_message,  # Keep the entry_message
-            request.text_message,  # Keep the text_message
-        )
+        # Update the meetingbaas_bot_id in place on the stored MeetingInfo
+        MEETING_DETAILS[bot_client_id].meetingbaas_bot_id = meetingbaas_bot_id
+        BAAS_TO_CLIENT[meetingbaas_bot_id] = bot_client_id
 
         # Log the client_id for internal reference
         logger.info(f"Bot created with MeetingBaas bot_id: {meetingbaas_bot_id}")
         logger.info(f"Internal client_id for WebSocket connections: {bot_client_id}")
 
-        # Return only the bot_id in the response
-        return JoinResponse(bot_id=meetingbaas_bot_id)
+        # Return only the bot_id in the response, serialized with the prebuilt
+        # adapter so FastAPI doesn't re-validate it against response_model
+        return Response(
+            content=dump_join_response(
+                JoinResponse.from_trusted({"bot_id": meetingbaas_bot_id})
+            ),
+            media_type="application/json",
+            status_code=status.HTTP_201_CREATED,
+        )
     else:
         return JSONResponse(
             content={
@@ -362,33 +423,29 @@ async def leave_bot(
 
     # Use the path parameter bot_id if provided, otherwise use request.bot_id
     meetingbaas_bot_id = bot_id or request.bot_id
-    client_id = None
 
-    # Look through MEETING_DETAILS to find the client ID for this bot ID
-    for cid, details in MEETING_DETAILS.items():
-        # Check if the stored meetingbaas_bot_id matches
-        if len(details) >= 3 and details[2] == meetingbaas_bot_id:
-            client_id = cid
-            logger.info(f"Found client ID {client_id} for bot ID {meetingbaas_bot_id}")
-            break
-
-    if not client_id:
+    # Find the client ID for this bot ID via the reverse index
+    client_id = BAAS_TO_CLIENT.pop(meetingbaas_bot_id, None)
+    if client_id:
+        logger.info(f"Found client ID {client_id} for bot ID {meetingbaas_bot_id}")
+    else:
         logger.warning(f"No client ID found for bot ID {meetingbaas_bot_id}")
 
     success = True
 
+    # The MeetingBaas leave call and the WebSocket closes don't depend on each
+    # other, so run them concurrently and check the outcomes afterwards
+    teardown_steps = []
+
     # 1. Call MeetingBaas API to make the bot leave
     if meetingbaas_bot_id:
         logger.info(f"Removing bot with ID: {meetingbaas_bot_id} from MeetingBaas API")
-        result = leave_meeting_bot(
-            bot_id=meetingbaas_bot_id,
-            api_key=api_key,
-        )
-        if not result:
-            success = False
-            logger.error(
-                f"Failed to remove bot {meetingbaas_bot_id} from MeetingBaas API"
+        teardown_steps.append(
+            (
+                "meetingbaas",
+                leave_meeting_bot_async(bot_id=meetingbaas_bot_id, api_key=api_key),
             )
+        )
     else:
         logger.warning("No MeetingBaas bot ID or API key found, skipping API call")
 
@@ -397,33 +454,50 @@ async def leave_bot(
         # Mark the client as closing to prevent further messages
         message_router.mark_closing(client_id)
 
-        # Close Pipecat WebSocket first
         if client_id in registry.pipecat_connections:
-            try:
-                await registry.disconnect(client_id, is_pipecat=True)
-                logger.info(f"Closed Pipecat WebSocket for client {client_id}")
-            except Exception as e:
-                success = False
-                logger.error(f"Error closing Pipecat WebSocket: {e}")
-
-        # Then close client WebSocket if it exists
+            teardown_steps.append(
+                ("pipecat", registry.disconnect(client_id, is_pipecat=True))
+            )
         if client_id in registry.active_connections:
-            try:
-                await registry.disconnect(client_id, is_pipecat=False)
-                logger.info(f"Closed client WebSocket for client {client_id}")
-            except Exception as e:
-                success = False
-                logger.error(f"Error closing client WebSocket: {e}")
+            teardown_steps.append(
+                ("client", registry.disconnect(client_id, is_pipecat=False))
+            )
 
-        # Add a small delay to allow for clean disconnection
-        await asyncio.sleep(0.5)
+    results = await asyncio.gather(
+        *(step for _, step in teardown_steps), return_exceptions=True
+    )
+    for (name, _), result in zip(teardown_steps, results):
+        if name == "meetingbaas":
+            if isinstance(result, Exception) or not result:
+                success = False
+                logger.error(
+                    f"Failed to remove bot {meetingbaas_bot_id} from MeetingBaas API"
+                )
+        elif isinstance(result, Exception):
+            success = False
+            label = "Pipecat" if name == "pipecat" else "client"
+            logger.error(f"Error closing {label} WebSocket: {result}")
+        elif name == "pipecat":
+            logger.info(f"Closed Pipecat WebSocket for client {client_id}")
+        else:
+            logger.info(f"Closed client WebSocket for client {client_id}")
 
     # 3. Terminate the Pipecat process after WebSockets are closed
     if client_id and client_id in PIPECAT_PROCESSES:
         process = PIPECAT_PROCESSES[client_id]
+        if process and process.poll() is None:
+            # Its WebSocket was just closed; let the process wind down instead
+            # of signalling it mid-cleanup, but move on as soon as it exits
+            try:
+                await run_in_threadpool(process.wait, PIPECAT_EXIT_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                pass
         if process and process.poll() is None:  # If process is still running
             try:
-                if terminate_process_gracefully(process, timeout=3.0):
+                # Termination polls with time.sleep, so keep it off the event loop
+                if await run_in_threadpool(
+                    terminate_process_gracefully, process, timeout=3.0
+                ):
                     logger.info(
                         f"Gracefully terminated Pipecat process for client {client_id}"
                     )
@@ -494,7 +568,7 @@ async def stop_bot(
         400: {"description": "Invalid request data"},
     },
 )
-def generate_persona_image(request: PersonaImageRequest) -> PersonaImageResponse:
+def generate_persona_image(request: PersonaImageRequest):
     """Generate an image for a persona using Replicate."""
     try:
         # Build the prompt from available fields
@@ -521,10 +595,16 @@ def generate_persona_image(request: PersonaImageRequest) -> PersonaImageResponse
             name=name, prompt=prompt, style="realistic", size=(512, 512)
         )
 
-        return PersonaImageResponse(
-            name=name,
-            image_url=image_response,
-            generated_at=datetime.utcnow().isoformat(),
+        return Response(
+            content=dump_persona_image_response(
+                PersonaImageResponse(
+                    name=name,
+                    image_url=image_response,
+                    generated_at=datetime.utcnow().isoformat(),
+                )
+            ),
+            media_type="application/json",
+            status_code=status.HTTP_201_CREATED,
         )
 
     except Exception as e:
@@ -540,16 +620,53 @@ def generate_persona_image(request: PersonaImageRequest) -> PersonaImageResponse
             status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
         raise HTTPException(status_code=status_code, detail=str(e))
 
+# Response schemas for the bot list endpoints. They're documented here rather
+# than through response_model so the dicts aren't re-validated on every call.
+_BOT_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "name": {"type": "string"},
+        "meeting_url": {"type": "string"},
+        "personas": {"type": "array", "items": {"type": "string"}},
+    },
+}
+_ACTIVE_BOT_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        **_BOT_ITEM_SCHEMA["properties"],
+        "status": {"type": "string"},
+        "start_time": {"type": "string", "format": "date-time"},
+        "persona": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "name": {"type": "string"},
+                "description": {"type": "string"},
+                "image": {"type": "string"},
+            },
+        },
+    },
+}
+
+
 @router.get(
     "/bots",
     tags=["bots"],
-    response_model=List[Dict[str, Any]],
+    response_class=ORJSONResponse,
     responses={
-        200: {"description": "List of active bots"},
+        200: {
+            "description": "List of active bots",
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": _BOT_ITEM_SCHEMA}
+                }
+            },
+        },
         500: {"description": "Server error - Failed to list bots"},
     },
 )
-async def list_bots():
+def list_bots():
     """
     Get a list of all active bots.
     
@@ -561,17 +678,15 @@ async def list_bots():
     """
     try:
         bots = []
-        for client_id, details in MEETING_DETAILS.items():
-            if len(details) >= 3:  # Ensure we have all required details
-                meeting_url, persona_name, meetingbaas_bot_id = details[:3]
-                if meetingbaas_bot_id:  # Only include bots that have been created
-                    bots.append({
-                        "id": meetingbaas_bot_id,
-                        "name": persona_name,
-                        "meeting_url": meeting_url,
-                        "personas": [persona_name],  # Currently only one persona per bot
-                    })
-        return bots
+        for info in MEETING_DETAILS.values():
+            if info.meetingbaas_bot_id:  # Only include bots that have been created
+                bots.append({
+                    "id": info.meetingbaas_bot_id,
+                    "name": info.persona_name,
+                    "meeting_url": info.meeting_url,
+                    "personas": [info.persona_name],  # Currently only one persona per bot
+                })
+        return ORJSONResponse(content=bots)
     except Exception as e:
         logger.error(f"Error listing bots: {e}")
         raise HTTPException(status_code=500, detail="Failed to list bots")
@@ -579,13 +694,20 @@ async def list_bots():
 @router.get(
     "/active-bots",
     tags=["bots"],
-    response_model=List[Dict[str, Any]],
+    response_class=ORJSONResponse,
     responses={
-        200: {"description": "List of active bots"},
+        200: {
+            "description": "List of active bots",
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": _ACTIVE_BOT_ITEM_SCHEMA}
+                }
+            },
+        },
         500: {"description": "Server error - Failed to list active bots"},
     },
 )
-async def list_active_bots():
+def list_active_bots():
     """
     Get a list of all active bots with additional details.
     
@@ -599,30 +721,30 @@ async def list_active_bots():
     """
     try:
         bots = []
-        for client_id, details in MEETING_DETAILS.items():
-            if len(details) >= 3:  # Ensure we have all required details
-                meeting_url, persona_name, meetingbaas_bot_id = details[:3]
-                if meetingbaas_bot_id:  # Only include bots that have been created
-                    # Try to get the persona details
-                    persona_details = {}
-                    if persona_name in persona_manager.personas:
-                        persona_details = persona_manager.personas[persona_name]
-                    
-                    bots.append({
-                        "id": meetingbaas_bot_id,
-                        "name": persona_name,
-                        "meeting_url": meeting_url,
-                        "personas": [persona_name],  # Currently only one persona per bot
-                        "status": "active",  # Since it's in MEETING_DETAILS, it's active
-                        "start_time": datetime.utcnow().isoformat(),  # Approximate time
-                        "persona": {
-                            "id": persona_name,
-                            "name": persona_details.get("name", persona_name),
-                            "description": persona_details.get("description", ""),
-                            "image": persona_details.get("image", ""),
-                        }
-                    })
-        return bots
+        for info in MEETING_DETAILS.values():
+            if info.meetingbaas_bot_id:  # Only include bots that have been created
+                persona_name = info.persona_name
+
+                # Try to get the persona details
+                persona_details = {}
+                if persona_name in persona_manager.personas:
+                    persona_details = persona_manager.personas[persona_name]
+                
+                bots.append({
+                    "id": info.meetingbaas_bot_id,
+                    "name": persona_name,
+                    "meeting_url": info.meeting_url,
+                    "personas": [persona_name],  # Currently only one persona per bot
+                    "status": "active",  # Since it's in MEETING_DETAILS, it's active
+                    "start_time": info.started_at,  # Set when the bot was requested
+                    "persona": {
+                        "id": persona_name,
+                        "name": persona_details.get("name", persona_name),
+                        "description": persona_details.get("description", ""),
+                        "image": persona_details.get("image", ""),
+                    }
+                })
+        return ORJSONResponse(content=bots)
     except Exception as e:
         logger.error(f"Error listing active bots: {e}")
         raise HTTPException(status_code=500, detail="Failed to list active bots")
@@ -633,77 +755,69 @@ async def list_active_bots():
     response_model=Dict[str, Any],
     status_code=status.HTTP_200_OK,
     responses={
-        200: {"description": "Webhook data processed successfully"},
+        200: {"description": "Webhook event accepted for processing"},
         400: {"description": "Bad request - Invalid webhook data format"},
-        500: {"description": "Server error - Failed to process webhook data"},
+        503: {"description": "Webhook queue is full - Retry later"},
     },
 )
-async def meetingbaas_webhook(webhook_event: MeetingWebhookEvent):
+async def meetingbaas_webhook(request: Request):
     """
     Webhook endpoint for MeetingBaas to send meeting events.
     
     This endpoint receives event data when a meeting is completed, failed, or has a status change.
-    For completed meetings, it saves the transcript and initiates download of the recording.
+    Events are queued and processed in the background; for completed meetings the
+    worker saves the transcript and downloads the recording.
     """
+    # Validate straight from the raw bytes so large transcripts are not first
+    # materialized as Python dicts by json.loads
     try:
-        logger.info(f"Received MeetingBaas webhook event: {webhook_event.event}")
-        
-        if webhook_event.event == "complete":
-            # Parse the completed meeting data
-            meeting_data = MeetingCompletedData(**webhook_event.data)
-            bot_id = meeting_data.bot_id
-            
-            # Save the transcript and recording
-            meeting_id = await transcript_service.save_meeting_transcript(bot_id, meeting_data)
-            
-            logger.info(f"Meeting completed webhook processed. Meeting ID: {meeting_id}")
-            return {
-                "status": "success",
-                "message": "Meeting transcript saved",
-                "meeting_id": meeting_id,
-            }
-            
-        elif webhook_event.event == "failed":
-            # Parse the failed meeting data
-            failed_data = MeetingFailedData(**webhook_event.data)
-            logger.error(f"Meeting failed: {failed_data.error}")
-            
-            return {
-                "status": "error",
-                "message": "Meeting failed",
-                "error": failed_data.error,
-            }
-            
-        elif webhook_event.event == "bot.status_change":
-            # Parse the status change data
-            status_data = MeetingStatusData(**webhook_event.data)
-            logger.info(f"Bot status changed: {status_data.status}")
-            
-            return {
-                "status": "success",
-                "message": "Bot status change recorded",
-            }
-            
-        else:
-            logger.warning(f"Unknown webhook event: {webhook_event.event}")
-            return {
-                "status": "error",
-                "message": f"Unknown webhook event: {webhook_event.event}",
-            }
-            
-    except Exception as e:
-        logger.error(f"Error processing webhook: {str(e)}")
+        webhook_event = WEBHOOK_EVENT_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        logger.error(f"Invalid webhook data: {e}")
         raise HTTPException(
-            status_code=500,
-            detail=f"Failed to process webhook: {str(e)}",
+            status_code=400,
+            detail=f"Invalid webhook data: {e}",
         )
 
+    logger.info(f"Received MeetingBaas webhook event: {webhook_event.event}")
+
+    # Hand the event to the background worker so bursts of webhooks don't
+    # hold requests open while transcripts and recordings are saved
+    if not webhook_service.enqueue(webhook_event):
+        logger.error(f"Webhook queue unavailable, rejecting {webhook_event.event} event")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Webhook queue is full, please retry later",
+        )
+
+    response = {
+        "status": "accepted",
+        "message": "Webhook event queued for processing",
+    }
+    if webhook_event.event == "complete":
+        # Reported up front; the worker saves the transcript under this ID
+        response["meeting_id"] = transcript_service.meeting_id_for(
+            webhook_event.data.bot_id
+        )
+    return response
+
 # Add transcript management endpoints
 
+
+async def _stat_file(path: Optional[str]) -> Optional[os.stat_result]:
+    """Stat a stored file off the event loop, returning None if it doesn't exist."""
+    if not path:
+        return None
+    try:
+        return await asyncio.to_thread(os.stat, path)
+    except FileNotFoundError:
+        return None
+
 @router.get(
     "/transcripts",
     tags=["transcripts"],
     response_model=List[Dict[str, Any]],
+    response_class=ORJSONResponse,
     responses={
         200: {"description": "List of all available meeting transcripts"},
         500: {"description": "Server error - Failed to list transcripts"},
@@ -719,19 +833,21 @@ async def list_transcripts():
     try:
         transcripts = transcript_service.list_transcripts()
         
-        # Convert to serializable format
-        result = []
-        for t in transcripts:
-            result.append({
+        # Convert to serializable format; orjson encodes the datetimes itself,
+        # producing the same ISO 8601 strings as isoformat()
+        result = [
+            {
                 "meeting_id": t.meeting_id,
                 "bot_id": t.bot_id,
-                "timestamp": t.timestamp.isoformat(),
+                "timestamp": t.timestamp,
                 "duration": t.duration,
                 "num_speakers": t.num_speakers,
                 "has_recording": t.recording_path is not None,
-            })
-            
-        return result
+            }
+            for t in transcripts
+        ]
+
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Error listing transcripts: {str(e)}")
@@ -743,29 +859,47 @@ async def list_transcripts():
 @router.get(
     "/transcripts/{meeting_id}",
     tags=["transcripts"],
-    response_model=Dict[str, Any],
+    response_class=FileResponse,
     responses={
-        200: {"description": "Transcript data for the specified meeting"},
+        200: {
+            "description": "Transcript data for the specified meeting",
+            "content": {"application/json": {"schema": {"type": "object"}}},
+        },
+        304: {"description": "Transcript unchanged since the ETag in If-None-Match"},
         404: {"description": "Meeting transcript not found"},
         500: {"description": "Server error - Failed to retrieve transcript"},
     },
 )
-async def get_transcript(meeting_id: str):
+async def get_transcript(meeting_id: str, request: Request):
     """
     Get the transcript data for a specific meeting.
     
     Returns the full transcript including speaker segments and word-level timing.
     """
     try:
-        transcript_data = await transcript_service.get_transcript(meeting_id)
+        await transcript_service.ensure_loaded()
+        transcript_path = transcript_service.get_transcript_path(meeting_id)
+        stat_result = await _stat_file(transcript_path)
         
-        if not transcript_data:
+        if stat_result is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Transcript not found for meeting ID: {meeting_id}",
             )
             
-        return transcript_data
+        # The stored file is the transcript JSON, so send it as-is. FileResponse
+        # sets Content-Length and an mtime/size ETag from the stat result
+        # without reading the file.
+        response = FileResponse(
+            path=Path(transcript_path),
+            media_type="application/json",
+            stat_result=stat_result,
+        )
+        etag = response.headers["etag"]
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"etag": etag})
+        return response
         
     except HTTPException:
         raise
@@ -779,7 +913,7 @@ async def get_transcript(meeting_id: str):
 @router.get(
     "/transcripts/{meeting_id}/download",
     tags=["transcripts"],
-    response_class=StreamingResponse,
+    response_class=FileResponse,
     responses={
         200: {"description": "Transcript file download"},
         404: {"description": "Meeting transcript not found"},
@@ -791,27 +925,22 @@ async def download_transcript(meeting_id: str):
     Download the transcript for a specific meeting as a JSON file.
     """
     try:
-        transcript_data = await transcript_service.get_transcript(meeting_id)
+        transcript_path = transcript_service.get_transcript_path(meeting_id)
+        stat_result = await _stat_file(transcript_path)
         
-        if not transcript_data:
+        if stat_result is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Transcript not found for meeting ID: {meeting_id}",
             )
             
-        # Convert to JSON string
-        json_data = json.dumps(transcript_data, indent=2)
-        
-        # Create a byte stream
-        stream = BytesIO(json_data.encode())
-        
-        # Return as a downloadable JSON file
-        return StreamingResponse(
-            stream, 
+        # The stored file is already indented JSON, so hand it to the server
+        # to send (pathsend/sendfile) rather than re-encoding it in Python
+        return FileResponse(
+            path=Path(transcript_path),
             media_type="application/json",
-            headers={
-                "Content-Disposition": f"attachment; filename=transcript_{meeting_id}.json"
-            }
+            filename=f"transcript_{meeting_id}.json",
+            stat_result=stat_result,
         )
         
     except HTTPException:
@@ -826,7 +955,7 @@ async def download_transcript(meeting_id: str):
 @router.get(
     "/transcripts/{meeting_id}/recording",
     tags=["transcripts"],
-    response_class=StreamingResponse,
+    response_class=FileResponse,
     responses={
         200: {"description": "Meeting recording download"},
         404: {"description": "Meeting recording not found"},
@@ -839,28 +968,21 @@ async def download_recording(meeting_id: str):
     """
     try:
         recording_path = transcript_service.get_recording_path(meeting_id)
+        stat_result = await _stat_file(recording_path)
         
-        if not recording_path:
+        if stat_result is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Recording not found for meeting ID: {meeting_id}",
             )
             
-        # Open the file for streaming
-        file_path = Path(recording_path)
-        
-        def iterfile():
-            with open(file_path, "rb") as f:
-                while chunk := f.read(1024 * 1024):  # 1MB chunks
-                    yield chunk
-            
-        # Return as a downloadable MP4 file
-        return StreamingResponse(
-            iterfile(), 
+        # FileResponse lets the ASGI server hand the file to the socket itself
+        # (pathsend/sendfile) instead of copying it through a Python generator
+        return FileResponse(
+            path=Path(recording_path),
             media_type="video/mp4",
-            headers={
-                "Content-Disposition": f"attachment; filename=recording_{meeting_id}.mp4"
-            }
+            filename=f"recording_{meeting_id}.mp4",
+            stat_result=stat_result,
         )
         
     except HTTPException:
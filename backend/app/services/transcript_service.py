@@ -3,22 +3,79 @@
 import os
 import json
 import asyncio
+import tempfile
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 import aiohttp
 import aiofiles
+import orjson
 from fastapi import HTTPException
 from pydantic import BaseModel
 
-from app.models import MeetingCompletedData, MeetingFailedData, TranscriptSegment
+from app.models import MeetingCompletedData, MeetingFailedData
 from meetingbaas_pipecat.utils.logger import logger
 
 # Define where transcript data will be stored
 TRANSCRIPT_DIR = Path("data/transcripts")
 RECORDING_DIR = Path("data/recordings")
 
+# Bytes read per chunk when downloading recordings; larger chunks mean fewer
+# awaits and file writes per recording
+RECORDING_CHUNK_BYTES = int(os.getenv("RECORDING_CHUNK_BYTES", 8 * 1024 * 1024))
+
+# metadata.json is a snapshot of all transcript metadata; updates since the
+# last snapshot are appended to the log and folded back in on compaction
+METADATA_FILE = TRANSCRIPT_DIR / "metadata.json"
+METADATA_LOG = TRANSCRIPT_DIR / "metadata.log.jsonl"
+# Compact the log into a fresh snapshot after this many appended updates
+METADATA_COMPACT_EVERY = 500
+# How long the metadata writer waits to coalesce updates into one append
+METADATA_FLUSH_DELAY = 0.05
+
+
+def _write_json_sync(path: Path, obj: Dict) -> None:
+    """Serialize obj and write it to path in one blocking call."""
+    # orjson encodes straight to bytes, skipping the intermediate str
+    path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+
+def _append_lines_sync(path: Path, lines: List[bytes]) -> None:
+    """Append a batch of lines to path with a single write."""
+    # O_APPEND makes each write land atomically at the end of the file on POSIX
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, b"".join(lines))
+    finally:
+        os.close(fd)
+
+
+def _flush_and_drop_cache_sync(path: Path) -> None:
+    """Flush a finished download to disk and drop its pages from the page cache.
+
+    Best-effort: the download is complete either way, so failures are only logged.
+    """
+    try:
+        # Windows only fsyncs descriptors opened for writing
+        fd = os.open(path, os.O_RDWR)
+    except OSError as e:
+        logger.warning(f"Could not flush recording {path}: {e}")
+        return
+    try:
+        # Dirty pages can't be dropped, so flush first; this also makes the
+        # file durable before it is renamed into place. fdatasync is missing
+        # on some platforms (e.g. Windows), where fsync does the same job.
+        getattr(os, "fdatasync", os.fsync)(fd)
+        if hasattr(os, "posix_fadvise"):
+            # Recordings are written once and rarely re-read, so don't let
+            # them evict the transcript and metadata pages
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError as e:
+        logger.warning(f"Could not flush recording {path}: {e}")
+    finally:
+        os.close(fd)
+
 
 class TranscriptMetadata(BaseModel):
     """Metadata about a stored transcript"""
@@ -26,6 +83,8 @@ class TranscriptMetadata(BaseModel):
     meeting_id: str
     timestamp: datetime
     duration: Optional[float] = None
+    start_ts: Optional[float] = None
+    end_ts: Optional[float] = None
     num_speakers: int
     recording_path: Optional[str] = None
     transcript_path: str
@@ -40,44 +99,228 @@ class TranscriptService:
         TRANSCRIPT_DIR.mkdir(parents=True, exist_ok=True)
         RECORDING_DIR.mkdir(parents=True, exist_ok=True)
         
-        # In-memory cache of transcript metadata
+        # In-memory cache of transcript metadata. This is the full index, not
+        # a bounded cache: list_transcripts and the compacted metadata.json are
+        # both built from it, so an evicted entry would vanish from both.
         self._metadata_cache: Dict[str, TranscriptMetadata] = {}
-        self._load_existing_transcripts()
+        # Updates appended to the metadata log since the last snapshot
+        self._log_entries = 0
+        # False when metadata.json couldn't be read at load; the log is then
+        # never compacted, since that would overwrite the snapshot and delete
+        # the only copy of the updates in it
+        self._snapshot_readable = True
+        # Metadata updates waiting for the single writer task, which appends
+        # them to the log in batches and runs compaction between batches
+        self._pending_lines: List[bytes] = []
+        self._pending_waiters: List[asyncio.Future] = []
+        self._dirty = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._closing = False
+        # Saves by bot ID, kept until the recording download finishes so a
+        # retried webhook awaits the same meeting instead of saving it twice
+        self._saves: Dict[str, asyncio.Task] = {}
+        # Meeting ID each of those bots' transcript is saved under, assigned
+        # when the webhook is accepted so the response can report it
+        self._meeting_ids: Dict[str, str] = {}
+        # In-flight recording downloads by bot ID
+        self._download_tasks: Dict[str, asyncio.Task] = {}
+        # Shared HTTP session for recording downloads, created on first use
+        # because there's no running event loop at import time
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Metadata is loaded on startup (or first use) rather than at import
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def ensure_loaded(self) -> None:
+        """Load existing transcript metadata once, off the event loop."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if not self._loaded:
+                await asyncio.to_thread(self._load_existing_transcripts)
+                self._loaded = True
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared download session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32, ttl_dns_cache=300, keepalive_timeout=60
+                ),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Finish recording downloads, flush pending metadata and close the download session."""
+        # Downloads use the session and append metadata, so let them finish first
+        if self._download_tasks:
+            logger.info(
+                f"Waiting for {len(self._download_tasks)} recording downloads before shutdown"
+            )
+            await asyncio.gather(*self._download_tasks.values(), return_exceptions=True)
+
+        self._closing = True
+        if self._writer_task is not None:
+            # Wake the writer so it flushes what's pending and exits
+            self._dirty.set()
+            await self._writer_task
+            self._writer_task = None
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _add_metadata(self, meta: Dict) -> None:
+        """Add a raw metadata dict to the cache."""
+        # Convert string timestamps to datetime objects
+        if isinstance(meta.get("timestamp"), str):
+            meta["timestamp"] = datetime.fromisoformat(meta["timestamp"])
+        self._metadata_cache[meta["meeting_id"]] = TranscriptMetadata(**meta)
+
     def _load_existing_transcripts(self) -> None:
         """Load metadata for existing transcripts."""
         try:
-            metadata_file = TRANSCRIPT_DIR / "metadata.json"
-            if metadata_file.exists():
-                with open(metadata_file, "r") as f:
+            if METADATA_FILE.exists():
+                with open(METADATA_FILE, "r") as f:
                     data = json.load(f)
-                    for meeting_id, meta in data.items():
-                        # Convert string timestamps to datetime objects
-                        if isinstance(meta.get("timestamp"), str):
-                            meta["timestamp"] = datetime.fromisoformat(meta["timestamp"])
-                        self._metadata_cache[meeting_id] = TranscriptMetadata(**meta)
-                logger.info(f"Loaded metadata for {len(self._metadata_cache)} transcripts")
+                for meta in data.values():
+                    self._add_metadata(meta)
+        except Exception as e:
+            # Keep the snapshot and the log as they are so nothing more is
+            # lost; compacting now would replace the snapshot with only the
+            # entries the log happens to hold
+            self._snapshot_readable = False
+            logger.error(
+                f"Error loading transcript metadata snapshot {METADATA_FILE}, "
+                f"metadata log compaction is disabled until it is repaired: {e}"
+            )
+
+        try:
+            # Replay updates logged since the snapshot; later entries win
+            if METADATA_LOG.exists():
+                with open(METADATA_LOG, "rb") as f:
+                    for line in f:
+                        try:
+                            self._add_metadata(orjson.loads(line))
+                        except Exception as e:
+                            # A crash mid-append can leave a partial last line
+                            logger.warning(f"Skipping bad metadata log entry: {e}")
+                # Fold the replayed log into a fresh snapshot. This runs under
+                # ensure_loaded's lock, and _append_metadata waits for
+                # ensure_loaded, so the writer task can't be appending yet.
+                if self._snapshot_readable:
+                    self._save_metadata_sync(list(self._metadata_cache.values()))
+
+            logger.info(f"Loaded metadata for {len(self._metadata_cache)} transcripts")
         except Exception as e:
             logger.error(f"Error loading transcript metadata: {e}")
     
-    def _save_metadata(self) -> bool:
-        """Save the metadata cache to disk."""
+    def _save_metadata_sync(self, entries: List[TranscriptMetadata]) -> bool:
+        """Snapshot the given metadata to disk and truncate the update log."""
         try:
-            metadata_file = TRANSCRIPT_DIR / "metadata.json"
-            # Convert metadata objects to dictionaries with ISO format timestamps
+            # mode="json" emits ISO 8601 timestamps directly from pydantic-core
             data = {
-                meeting_id: {
-                    **meta.dict(),
-                    "timestamp": meta.timestamp.isoformat()
-                }
-                for meeting_id, meta in self._metadata_cache.items()
+                meta.meeting_id: meta.model_dump(mode="json") for meta in entries
             }
-            with open(metadata_file, "w") as f:
-                json.dump(data, f, indent=2)
+            # Write through a temp file so a crash mid-write leaves the old
+            # snapshot, and the log that extends it, intact
+            tmp = tempfile.NamedTemporaryFile(
+                "wb", dir=METADATA_FILE.parent, suffix=".tmp", delete=False
+            )
+            try:
+                with tmp:
+                    tmp.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+                os.replace(tmp.name, METADATA_FILE)
+            except BaseException:
+                Path(tmp.name).unlink(missing_ok=True)
+                raise
+            METADATA_LOG.unlink(missing_ok=True)
             return True
         except Exception as e:
             logger.error(f"Error saving transcript metadata: {e}")
             return False
+
+    async def _save_metadata(self) -> bool:
+        """Snapshot the metadata cache without blocking the event loop."""
+        # Copy the entries here so the worker thread never iterates the live dict
+        entries = list(self._metadata_cache.values())
+        saved = await asyncio.to_thread(self._save_metadata_sync, entries)
+        if saved:
+            self._log_entries = 0
+        return saved
+
+    async def _append_metadata(self, metadata: TranscriptMetadata) -> bool:
+        """
+        Persist one metadata update by appending it to the metadata log.
+
+        The update is handed to the writer task, which coalesces updates that
+        arrive close together into a single append.
+
+        Args:
+            metadata: The updated metadata entry
+
+        Returns:
+            True if the update was written, False otherwise
+        """
+        # The load compacts the log, so nothing may be appended before it
+        await self.ensure_loaded()
+        try:
+            line = orjson.dumps(metadata.model_dump(mode="json")) + b"\n"
+        except Exception as e:
+            logger.error(f"Error appending transcript metadata: {e}")
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._pending_lines.append(line)
+        self._pending_waiters.append(waiter)
+
+        if self._closing:
+            # The writer has already exited, so write this one directly
+            await self._flush_pending()
+        else:
+            if self._writer_task is None or self._writer_task.done():
+                self._writer_task = asyncio.create_task(self._writer_loop())
+            self._dirty.set()
+        return await waiter
+
+    async def _writer_loop(self) -> None:
+        """Append queued metadata updates in batches until the service closes."""
+        while not self._closing:
+            await self._dirty.wait()
+            if not self._closing:
+                await asyncio.sleep(METADATA_FLUSH_DELAY)
+            await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        """Append all pending metadata lines and wake their callers."""
+        self._dirty.clear()
+        lines, waiters = self._pending_lines, self._pending_waiters
+        self._pending_lines, self._pending_waiters = [], []
+        if not lines:
+            return
+
+        try:
+            await asyncio.to_thread(_append_lines_sync, METADATA_LOG, lines)
+            written = True
+        except Exception as e:
+            logger.error(f"Error appending transcript metadata: {e}")
+            written = False
+
+        if written:
+            self._log_entries += len(lines)
+            # Only this task appends, so compacting here can't drop an update
+            # that lands in the log after the snapshot is taken
+            if (
+                self._log_entries >= METADATA_COMPACT_EVERY
+                and self._snapshot_readable
+            ):
+                await self._save_metadata()
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(written)
     
     async def save_meeting_transcript(self, 
                                bot_id: str, 
@@ -92,27 +335,58 @@ class TranscriptService:
         Returns:
             The meeting ID (which can be used to retrieve the transcript later)
         """
-        # Generate a unique meeting ID based on timestamp
-        meeting_id = f"{bot_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        await self.ensure_loaded()
+
+        task = self._saves.get(bot_id)
+        if task is None:
+            task = asyncio.create_task(self._save_transcript(bot_id, meeting_data))
+            self._saves[bot_id] = task
+        # Shielded so one caller going away doesn't cancel the save for the rest
+        return await asyncio.shield(task)
+
+    def meeting_id_for(self, bot_id: str) -> str:
+        """
+        Get the meeting ID a bot's transcript is, or will be, saved under.
+
+        Args:
+            bot_id: The ID of the bot that participated in the meeting
+
+        Returns:
+            The ID of the bot's in-flight save, or a new timestamp-based ID
+        """
+        meeting_id = self._meeting_ids.get(bot_id)
+        if meeting_id is None:
+            meeting_id = f"{bot_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            self._meeting_ids[bot_id] = meeting_id
+        return meeting_id
+
+    def _release(self, bot_id: str) -> None:
+        """Forget a bot's finished save so its next meeting gets a new ID."""
+        self._saves.pop(bot_id, None)
+        self._meeting_ids.pop(bot_id, None)
+
+    async def _save_transcript(self, bot_id: str, meeting_data: MeetingCompletedData) -> str:
+        """Write the transcript and its metadata, then start the recording download."""
+        meeting_id = self.meeting_id_for(bot_id)
         
         # Save the transcript as JSON
         transcript_path = TRANSCRIPT_DIR / f"{meeting_id}_transcript.json"
-        transcript_data = meeting_data.dict()
+        transcript_data = meeting_data.model_dump(mode="json")
         
         try:
-            async with aiofiles.open(transcript_path, "w") as f:
-                await f.write(json.dumps(transcript_data, indent=2))
+            # One thread hop for serialize + write instead of one per aiofiles call
+            await asyncio.to_thread(_write_json_sync, transcript_path, transcript_data)
             
-            # Calculate meeting duration if possible
-            duration = None
-            if meeting_data.transcript and len(meeting_data.transcript) > 0:
-                # Try to calculate duration from first and last word timestamps
-                first_segment = meeting_data.transcript[0]
-                last_segment = meeting_data.transcript[-1]
-                if first_segment.words and last_segment.words:
-                    start_time = first_segment.words[0].start
-                    end_time = last_segment.words[-1].end
-                    duration = end_time - start_time
+            # Calculate meeting duration from the first and last word timestamps,
+            # keeping the bounds so listings never need to reopen the JSON
+            start_ts = end_ts = duration = None
+            if meeting_data.transcript:
+                first_words = meeting_data.transcript[0]["words"]
+                last_words = meeting_data.transcript[-1]["words"]
+                if first_words and last_words:
+                    start_ts = first_words[0]["start"]
+                    end_ts = last_words[-1]["end"]
+                    duration = end_ts - start_ts
             
             # Save metadata
             metadata = TranscriptMetadata(
@@ -120,20 +394,26 @@ class TranscriptService:
                 meeting_id=meeting_id,
                 timestamp=datetime.now(),
                 duration=duration,
+                start_ts=start_ts,
+                end_ts=end_ts,
                 num_speakers=len(meeting_data.speakers),
                 transcript_path=str(transcript_path)
             )
             
-            # Start downloading the recording in the background
-            asyncio.create_task(self._download_recording(meeting_id, meeting_data.mp4, metadata))
+            # Start downloading the recording in the background; it releases
+            # this bot's entry in _saves when done
+            self._download_tasks[bot_id] = asyncio.create_task(
+                self._download_recording(meeting_id, meeting_data.mp4, metadata)
+            )
             
             # Update metadata cache
             self._metadata_cache[meeting_id] = metadata
-            self._save_metadata()
+            await self._append_metadata(metadata)
             
             return meeting_id
             
         except Exception as e:
+            self._release(bot_id)
             logger.error(f"Error saving meeting transcript: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to save transcript: {str(e)}")
     
@@ -147,58 +427,58 @@ class TranscriptService:
             metadata: The transcript metadata to update with the recording path
         """
         recording_path = RECORDING_DIR / f"{meeting_id}.mp4"
+        # Download to a side file and rename it into place once complete, so a
+        # crash or failed download never leaves a truncated recording behind
+        part_path = recording_path.with_suffix(".mp4.part")
         
         try:
             logger.info(f"Downloading recording for meeting {meeting_id}")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(mp4_url) as response:
-                    if response.status == 200:
-                        # Stream the file to disk
-                        async with aiofiles.open(recording_path, "wb") as f:
-                            while True:
-                                chunk = await response.content.read(1024 * 1024)  # 1MB chunks
-                                if not chunk:
-                                    break
-                                await f.write(chunk)
-                        
-                        # Update metadata with recording path
-                        metadata.recording_path = str(recording_path)
-                        self._metadata_cache[meeting_id] = metadata
-                        self._save_metadata()
-                        
-                        logger.info(f"Successfully downloaded recording for meeting {meeting_id}")
-                    else:
-                        logger.error(f"Failed to download recording: HTTP {response.status}")
+            async with self._get_session().get(mp4_url) as response:
+                if response.status == 200:
+                    # Stream the file to disk
+                    async with aiofiles.open(part_path, "wb") as f:
+                        if hasattr(os, "posix_fadvise"):
+                            os.posix_fadvise(
+                                f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL
+                            )
+                        async for chunk in response.content.iter_chunked(
+                            RECORDING_CHUNK_BYTES
+                        ):
+                            await f.write(chunk)
+                    await asyncio.to_thread(_flush_and_drop_cache_sync, part_path)
+                    os.replace(part_path, recording_path)
+                    
+                    # Update metadata with recording path in place
+                    metadata.recording_path = str(recording_path)
+                    await self._append_metadata(metadata)
+                    
+                    logger.info(f"Successfully downloaded recording for meeting {meeting_id}")
+                else:
+                    logger.error(f"Failed to download recording: HTTP {response.status}")
         except Exception as e:
             logger.error(f"Error downloading recording for meeting {meeting_id}: {e}")
+            part_path.unlink(missing_ok=True)
+        finally:
+            self._download_tasks.pop(metadata.bot_id, None)
+            self._release(metadata.bot_id)
     
-    async def get_transcript(self, meeting_id: str) -> Optional[Dict]:
+    def get_transcript_path(self, meeting_id: str) -> Optional[str]:
         """
-        Get the transcript data for a meeting.
+        Get the path to the stored transcript JSON file for a meeting.
         
         Args:
             meeting_id: The meeting ID
             
         Returns:
-            The transcript data as a dictionary
+            The path to the transcript file, or None for an unknown meeting.
+            Callers stat the file when sending it, which also checks it exists.
         """
         metadata = self._metadata_cache.get(meeting_id)
         if not metadata:
             return None
         
-        try:
-            transcript_path = Path(metadata.transcript_path)
-            if not transcript_path.exists():
-                logger.error(f"Transcript file not found: {transcript_path}")
-                return None
-            
-            async with aiofiles.open(transcript_path, "r") as f:
-                content = await f.read()
-                return json.loads(content)
-        except Exception as e:
-            logger.error(f"Error reading transcript file: {e}")
-            return None
+        return metadata.transcript_path
     
     def get_recording_path(self, meeting_id: str) -> Optional[str]:
         """
@@ -208,17 +488,14 @@ class TranscriptService:
             meeting_id: The meeting ID
             
         Returns:
-            The path to the recording file, or None if not available
+            The path to the recording file, or None if there is none yet.
+            Callers stat the file when sending it, which also checks it exists.
         """
         metadata = self._metadata_cache.get(meeting_id)
-        if not metadata or not metadata.recording_path:
-            return None
-        
-        recording_path = Path(metadata.recording_path)
-        if not recording_path.exists():
+        if not metadata:
             return None
         
-        return str(recording_path)
+        return metadata.recording_path
     
     def list_transcripts(self) -> List[TranscriptMetadata]:
         """
@@ -0,0 +1,125 @@
+"""Service for queueing and batch-processing MeetingBaas webhook events."""
+
+import asyncio
+from typing import List, Optional
+
+from app.models import MeetingWebhookEvent
+from app.services.transcript_service import transcript_service
+from meetingbaas_pipecat.utils.logger import logger
+
+# Maximum number of events waiting to be processed before the route pushes back
+WEBHOOK_QUEUE_SIZE = 10000
+# Events handled together once the worker wakes up
+WEBHOOK_BATCH_SIZE = 32
+# How long the worker waits to fill a batch after the first event arrives
+WEBHOOK_BATCH_WINDOW = 0.05
+
+
+class WebhookService:
+    """Service that accepts webhook events and processes them in the background"""
+
+    def __init__(self):
+        """Initialize the webhook service."""
+        # The queue is created in start() so it binds to the running event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Create the event queue and spawn the background worker."""
+        if self._worker is not None and not self._worker.done():
+            return
+        self._queue = asyncio.Queue(maxsize=WEBHOOK_QUEUE_SIZE)
+        self._worker = asyncio.create_task(self._run())
+        logger.info("Webhook worker started")
+
+    async def stop(self) -> None:
+        """Wait for every queued event, including the batch in flight, then stop the worker."""
+        if self._worker is not None:
+            if not self._worker.done():
+                if not self._queue.empty():
+                    logger.info(
+                        f"Processing {self._queue.qsize()} queued webhook events before shutdown"
+                    )
+                await self._queue.join()
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        # Later events are refused instead of sitting in a queue nobody reads
+        self._queue = None
+
+    def enqueue(self, event: MeetingWebhookEvent) -> bool:
+        """
+        Queue a webhook event for background processing.
+
+        Args:
+            event: The validated webhook event
+
+        Returns:
+            True if the event was queued, False if the worker isn't running or the queue is full
+        """
+        if self._queue is None:
+            return False
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def _run(self) -> None:
+        """Drain the queue in batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + WEBHOOK_BATCH_WINDOW
+
+            # Collect whatever else arrives within the batch window
+            while len(batch) < WEBHOOK_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._process_batch(batch)
+            except Exception as e:
+                logger.error(f"Error processing webhook batch: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _process_batch(self, batch: List[MeetingWebhookEvent]) -> None:
+        """Handle a batch of events, saving completed meeting transcripts concurrently."""
+        completed = []
+        for event in batch:
+            if event.event == "complete":
+                completed.append(event.data)
+            elif event.event == "failed":
+                logger.error(f"Meeting failed: {event.data.error}")
+            else:
+                logger.info(f"Bot status changed: {event.data.status}")
+
+        if not completed:
+            return
+
+        results = await asyncio.gather(
+            *(
+                transcript_service.save_meeting_transcript(data.bot_id, data)
+                for data in completed
+            ),
+            return_exceptions=True,
+        )
+        for data, result in zip(completed, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error saving transcript for bot {data.bot_id}: {result}")
+            else:
+                logger.info(f"Meeting completed webhook processed. Meeting ID: {result}")
+
+
+# Create a singleton instance
+webhook_service = WebhookService()
@@ -4,8 +4,14 @@ import asyncio
 import json
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-
-from core.connection import MEETING_DETAILS, PIPECAT_PROCESSES, registry
+from fastapi.concurrency import run_in_threadpool
+
+from core.connection import (
+    BAAS_TO_CLIENT,
+    MEETING_DETAILS,
+    PIPECAT_PROCESSES,
+    registry,
+)
 from core.process import start_pipecat_process, terminate_process_gracefully
 from core.router import router as message_router
 from meetingbaas_pipecat.utils.logger import logger
@@ -27,23 +33,16 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             await websocket.close(code=1008, reason="Missing meeting details")
             return
 
-        # Get stored meeting details with fallbacks to ensure compatibility
+        # Get stored meeting details
         meeting_details = MEETING_DETAILS[client_id]
-        meeting_url = meeting_details[0] if len(meeting_details) > 0 else None
-        persona_name = meeting_details[1] if len(meeting_details) > 1 else None
-        meetingbaas_bot_id = meeting_details[2] if len(meeting_details) > 2 else None
-        enable_tools = meeting_details[3] if len(meeting_details) > 3 else False
-
-        # Default to 16khz if not specified
-        streaming_audio_frequency = (
-            meeting_details[4] if len(meeting_details) > 4 else "16khz"
-        )
-        
-        # Get entry_message if specified
-        entry_message = meeting_details[5] if len(meeting_details) > 5 else None
-        
-        # Check if we have a text_message in MEETING_DETAILS
-        text_message = meeting_details[6] if len(meeting_details) > 6 else None
+        meeting_url = meeting_details.meeting_url
+        persona_name = meeting_details.persona_name
+        meetingbaas_bot_id = meeting_details.meetingbaas_bot_id
+        enable_tools = meeting_details.enable_tools
+        streaming_audio_frequency = meeting_details.streaming_audio_frequency
+        entry_message = meeting_details.entry_message
+        text_message = meeting_details.text_message
+
         if text_message:
             # Send the text message to the client as a chat message
             try:
@@ -106,7 +105,10 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             process = PIPECAT_PROCESSES[client_id]
             if process and process.poll() is None:  # If process is still running
                 try:
-                    if terminate_process_gracefully(process, timeout=3.0):
+                    # Termination polls with time.sleep, so keep it off the loop
+                    if await run_in_threadpool(
+                        terminate_process_gracefully, process, timeout=3.0
+                    ):
                         logger.info(
                             f"Gracefully terminated Pipecat process for client {client_id}"
                         )
@@ -119,8 +121,9 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             # Remove from our storage
             PIPECAT_PROCESSES.pop(client_id, None)
 
-        if client_id in MEETING_DETAILS:
-            MEETING_DETAILS.pop(client_id, None)
+        removed_details = MEETING_DETAILS.pop(client_id, None)
+        if removed_details and removed_details.meetingbaas_bot_id:
+            BAAS_TO_CLIENT.pop(removed_details.meetingbaas_bot_id, None)
 
         # Mark client as closing to prevent further message sending
         message_router.mark_closing(client_id)
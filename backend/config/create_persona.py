@@ -2,10 +2,10 @@ import argparse
 import asyncio
 import os
 import random
-import subprocess
 from pathlib import Path
 from typing import Dict, Optional
 
+import orjson
 from dotenv import load_dotenv
 from loguru import logger
 
@@ -63,8 +63,7 @@ def create_persona_structure(
     tts_params_dict = None
     if tts_params:
         try:
-            import json
-            tts_params_dict = json.loads(tts_params)
+            tts_params_dict = orjson.loads(tts_params)
             logger.info(f"Parsed TTS parameters: {tts_params_dict}")
         except Exception as e:
             logger.error(f"Failed to parse TTS parameters JSON: {e}")
@@ -85,27 +84,32 @@ def create_persona_structure(
     }
 
 
-def generate_persona_image(
+async def ainput(prompt: str = "") -> str:
+    """Read a line from stdin without blocking the event loop"""
+    return await asyncio.to_thread(input, prompt)
+
+
+async def generate_persona_image(
     persona_key: str, replicate_key: str, utfs_key: str, app_id: str
 ):
     """Generate and upload image for the persona"""
-    try:
-        cmd = [
-            "python",
-            "config/generate_images.py",
-            "--replicate-key",
-            replicate_key,
-            "--utfs-key",
-            utfs_key,
-            "--app-id",
-            app_id,
-        ]
-
-        subprocess.run(cmd, check=True)
-        logger.success(f"Generated and uploaded image for {persona_key}")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to generate image: {e}")
-        raise
+    # Run the generator as an async subprocess so the event loop isn't blocked
+    # while Replicate renders the image
+    proc = await asyncio.create_subprocess_exec(
+        "python",
+        "config/generate_images.py",
+        "--replicate-key",
+        replicate_key,
+        "--utfs-key",
+        utfs_key,
+        "--app-id",
+        app_id,
+    )
+    returncode = await proc.wait()
+    if returncode != 0:
+        logger.error(f"Failed to generate image: exit status {returncode}")
+        raise RuntimeError(f"generate_images.py exited with status {returncode}")
+    logger.success(f"Generated and uploaded image for {persona_key}")
 
 
 async def create_persona_cli():
@@ -173,14 +177,14 @@ If not provided via command line, you will be prompted to enter it.""",
             print("  • sales_specialist")
 
             while True:
-                key = input("\n🔑 Persona key: ").strip().lower()
+                key = (await ainput("\n🔑 Persona key: ")).strip().lower()
                 if key:
                     if " " in key:
                         print("Please use underscores instead of spaces")
                         continue
                     if key in persona_manager.personas:
                         print(f"Warning: Persona '{key}' already exists.")
-                        choice = input(
+                        choice = await ainput(
                             "Press Enter to overwrite or any key to choose another name > "
                         )
                         if choice.strip():
@@ -203,7 +207,7 @@ If not provided via command line, you will be prompted to enter it.""",
 
             prompt_lines = []
             while True:
-                line = input()
+                line = await ainput()
                 if not line and prompt_lines and not prompt_lines[-1]:
                     break
                 prompt_lines.append(line)
@@ -216,7 +220,9 @@ If not provided via command line, you will be prompted to enter it.""",
             default_name = args.key.replace("_", " ").title()
             name = (
                 args.name
-                or input(f"💭 Enter display name (default: {default_name}): ").strip()
+                or (
+                    await ainput(f"💭 Enter display name (default: {default_name}): ")
+                ).strip()
             )
             if not name:
                 name = default_name
@@ -226,7 +232,7 @@ If not provided via command line, you will be prompted to enter it.""",
             print(f"Default: {DEFAULT_ENTRY_MESSAGE}")
             entry_message = (
                 args.entry_message
-                or input("💬 Enter message: ").strip()
+                or (await ainput("💬 Enter message: ")).strip()
                 or DEFAULT_ENTRY_MESSAGE
             )
 
@@ -235,7 +241,7 @@ If not provided via command line, you will be prompted to enter it.""",
             print(f"Default: {DEFAULT_TEXT_MESSAGE}")
             text_message = (
                 args.text_message
-                or input("💬 Enter text message: ").strip()
+                or (await ainput("💬 Enter text message: ")).strip()
                 or DEFAULT_TEXT_MESSAGE
             )
 
@@ -248,7 +254,7 @@ If not provided via command line, you will be prompted to enter it.""",
 
             characteristics = []
             while True:
-                char = input("✨ > ").strip()
+                char = (await ainput("✨ > ")).strip()
                 if not char:
                     break
                 characteristics.append(char)
@@ -264,7 +270,7 @@ If not provided via command line, you will be prompted to enter it.""",
 
             tone_of_voice = []
             while True:
-                tone = input("🗣️ > ").strip()
+                tone = (await ainput("🗣️ > ")).strip()
                 if not tone:
                     break
                 tone_of_voice.append(tone)
@@ -278,13 +284,13 @@ If not provided via command line, you will be prompted to enter it.""",
                 print(f"  • {skin_tone}")
             print("\nEnter skin tone (empty for random):")
 
-            skin_tone = input("👩‍🦰 > ").strip()
+            skin_tone = (await ainput("👩‍🦰 > ")).strip()
 
             # Gender selection
             print("\n=== Gender ===")
             print("Options: MALE, FEMALE, NON-BINARY")
             print("Press Enter for random selection")
-            gender = input("🧑 > ").strip().upper()
+            gender = (await ainput("🧑 > ")).strip().upper()
             if gender and gender not in ["MALE", "FEMALE", "NON-BINARY"]:
                 print("Invalid gender, using random selection")
                 gender = None
@@ -294,7 +300,7 @@ If not provided via command line, you will be prompted to enter it.""",
             print("Enter links one per line (empty line to finish)")
             relevant_links = []
             while True:
-                link = input("🔗 > ").strip()
+                link = (await ainput("🔗 > ")).strip()
                 if not link:
                     break
                 relevant_links.append(link)
@@ -306,7 +312,7 @@ If not provided via command line, you will be prompted to enter it.""",
                 print("Enter section names (comma-separated), or press Enter for default:")
                 print("Default: Characteristics,Voice,Metadata")
                 
-                sections_input = input("> ").strip()
+                sections_input = (await ainput("> ")).strip()
                 if sections_input:
                     args.sections = sections_input
             
@@ -348,7 +354,11 @@ If not provided via command line, you will be prompted to enter it.""",
         if all([replicate_key, utfs_key, app_id]):
             try:
                 logger.info("Starting image generation...")
-                generate_persona_image(args.key, replicate_key, utfs_key, app_id)
+                # generate_images.py picks personas up from disk, so this has
+                # to run after save_persona has written the new one
+                await generate_persona_image(
+                    args.key, replicate_key, utfs_key, app_id
+                )
             except Exception as e:
                 logger.warning(f"Image generation failed: {e}")
                 logger.info(
@@ -1,15 +1,25 @@
 import asyncio
 import os
 import random
+import re
+import sys
+import tempfile
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import aiohttp
-import markdown
+import orjson
 from dotenv import load_dotenv
 from loguru import logger
 
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent cache writers may drop each other's entries
+    fcntl = None
+
 from config.prompts import (
     DEFAULT_CHARACTERISTICS,
     DEFAULT_ENTRY_MESSAGE,
@@ -20,47 +30,158 @@ from config.prompts import (
 # Load environment variables from .env file
 load_dotenv()
 
+# Bump when parse_readme/load_additional_content change so stale parses in the
+# on-disk persona cache are ignored
+PERSONA_CACHE_VERSION = 5
+# Version stored in the persona cache. Parses have defaults from config/prompts.py
+# filled in, so changing those defaults invalidates the cache as well.
+_PARSE_CACHE_VERSION = [PERSONA_CACHE_VERSION, DEFAULT_ENTRY_MESSAGE]
+
+# README layout save_persona writes when there is no existing README to follow
+DEFAULT_README_FORMAT = {
+    "has_characteristics": True,
+    "has_voice": True,
+    "metadata_section_name": "Metadata",
+    "characteristics_section_name": "Characteristics",
+    "voice_section_name": "Voice",
+    "metadata_format": "- key: value",
+}
+
+# "## Header" names save_persona recognizes, in order of preference
+README_METADATA_SECTION_NAMES = (
+    "Metadata",
+    "Info",
+    "Details",
+    "Configuration",
+    "Settings",
+    "Properties",
+)
+README_CHARACTER_SECTION_NAMES = ("Characteristics", "Traits", "Personality", "Character")
+README_VOICE_SECTION_NAMES = ("Voice", "Tone", "Speech", "Speaking Style")
+_SECTION_HEADER_RE = re.compile(r"^## (.+?)\s*$", re.MULTILINE)
+
+# Upper bound on threads used to parse persona directories in parallel
+PERSONA_LOAD_WORKERS = 32
+
+# "# Title" and "## Section" header lines in a persona README
+_HEADER_RE = re.compile(r"^(#{1,2}) (.*)\n?", re.MULTILINE)
+
+# README sections parse_readme reads metadata from besides "## Metadata", in
+# precedence order (a later section overrides an earlier one)
+ALTERNATIVE_METADATA_SECTIONS = ("info", "details", "configuration", "settings", "properties")
+# Alternative metadata keys mapped to the standard persona keys
+METADATA_KEY_ALIASES = {
+    "picture": "image",
+    "avatar": "image",
+    "greeting": "entry_message",
+    "message": "entry_message",
+    "voice": "cartesia_voice_id",
+    "voice_id": "cartesia_voice_id",
+    "links": "relevant_links",
+    "references": "relevant_links",
+    "urls": "relevant_links",
+}
+# README sections holding character traits and tone of voice bullet lists, in
+# the order their traits are collected
+CHARACTER_SECTIONS = ("characteristics", "traits", "personality", "character")
+VOICE_SECTIONS = ("voice", "tone", "speech", "speaking style")
+
 
 class PersonaManager:
     def __init__(self, personas_dir: Optional[Path] = None):
         """Initialize PersonaManager with optional custom personas directory"""
         self.personas_dir = personas_dir or Path(__file__).parent / "personas"
-        self.md = markdown.Markdown(extensions=["meta"])
-        self.personas = self.load_personas()
+        # Persona keys are discovered up front, but each README is only parsed
+        # when that persona is first needed (None until then)
+        self._personas: Dict[str, Optional[Dict]] = {
+            key: None for key in self._discover_keys()
+        }
+        self._all_loaded = False
+        # Resolved personas by requested name; cleared whenever personas change
+        self._persona_cache: Dict[str, Dict] = {}
+        # Word -> persona keys containing it, for get_persona's fuzzy match;
+        # rebuilt lazily after personas change
+        self._word_index: Optional[Dict[str, Set[str]]] = None
+        # Display name -> persona key for get_persona_by_name, rebuilt the same way
+        self._name_to_key: Optional[Dict[str, str]] = None
+        # Parsed personas from the on-disk cache, read once per manager
+        self._cache_file = self.personas_dir / ".cache" / "personas.json"
+        self._parse_cache: Optional[Dict] = None
+
+    @property
+    def personas(self) -> Dict:
+        """All personas by key, parsing any that haven't been loaded yet"""
+        if not self._all_loaded:
+            self._personas = self.load_personas()
+            self._all_loaded = True
+        return self._personas
+
+    @personas.setter
+    def personas(self, value: Dict) -> None:
+        self._personas = value
+        self._all_loaded = True
+        self.clear_persona_cache()
+
+    def _discover_keys(self) -> List[str]:
+        """List persona directory names without reading any persona files"""
+        keys = []
+        try:
+            with os.scandir(self.personas_dir) as it:
+                for entry in it:
+                    if not entry.is_dir() or entry.name.startswith("."):
+                        continue
+                    if not os.path.exists(os.path.join(entry.path, "README.md")):
+                        logger.warning(
+                            f"Skipping persona without README: {entry.name}"
+                        )
+                        continue
+                    keys.append(entry.name)
+        except Exception as e:
+            logger.error(f"Failed to discover personas: {e}")
+            raise
+        return keys
+
+    def _load_one(self, key: str) -> Dict:
+        """Return a single persona, parsing only its own files if needed"""
+        persona = self._personas.get(key)
+        if persona is None:
+            cache = self._get_parse_cache()
+            entry = self._parse_persona_dir(self.personas_dir / key, cache)
+            if cache.get(key) != entry:
+                cache[key] = entry
+                self._save_parse_cache({key: entry}, self._personas.keys())
+            persona = entry[1]
+            self._personas[key] = persona
+        return persona
 
     def parse_readme(self, content: str) -> Dict:
         """Parse README.md content to extract persona information with flexible format support"""
-        # Reset markdown instance for new content
-        self.md.reset()
-        html = self.md.convert(content)
-
-        # Split content by sections (supports both ## and ## headers)
-        sections = {}
+        # Split content into raw section bodies at "# " / "## " header lines;
+        # bodies are only split into lines for the sections read below
+        chunks: Dict[str, List[str]] = {}
+        title = None
         current_section = "main"
-        lines = content.split("\n")
-        
-        for line in lines:
-            if line.startswith("# "):
-                # This is the title
-                sections["title"] = line.replace("# ", "").strip()
-                continue
-            elif line.startswith("## "):
+        pos = 0
+        for match in _HEADER_RE.finditer(content):
+            chunks.setdefault(current_section, []).append(content[pos : match.start()])
+            pos = match.end()
+            if match.group(1) == "#":
+                # This is the title; following lines stay in the current section
+                title = match.group(2).strip()
+            else:
                 # This is a section header
-                current_section = line.replace("## ", "").strip().lower()
-                sections[current_section] = []
-                continue
-            
-            # Add line to current section
-            if current_section not in sections:
-                sections[current_section] = []
-            sections[current_section].append(line)
-        
+                # Interned so the section-name lookups below compare by identity
+                current_section = sys.intern(match.group(2).strip().lower())
+                chunks[current_section] = []
+        chunks.setdefault(current_section, []).append(content[pos:])
+        sections = {section: "".join(parts) for section, parts in chunks.items()}
+
         # Process sections into a cohesive structure
-        name = sections.get("title", "Unnamed Persona")
-        
+        name = title if title is not None else "Unnamed Persona"
+
         # Get prompt (main content after title, before first section)
-        prompt = "\n".join(sections.get("main", [])).strip()
-        
+        prompt = "\n".join(sections.get("main", "").splitlines()).strip()
+
         # Extract metadata from any section that might contain it
         metadata = {
             "image": "",
@@ -77,7 +198,7 @@ class PersonaManager:
 
         # Look for metadata in a dedicated metadata section first
         if "metadata" in sections:
-            for line in sections["metadata"]:
+            for line in sections["metadata"].splitlines():
                 if line.strip() and line.startswith("- "):
                     try:
                         key_value = line[2:].split(": ", 1)
@@ -94,10 +215,9 @@ class PersonaManager:
                         continue
         
         # Also check for alternative section names that might contain metadata
-        alternative_metadata_sections = ["info", "details", "configuration", "settings", "properties"]
-        for section_name in alternative_metadata_sections:
+        for section_name in ALTERNATIVE_METADATA_SECTIONS:
             if section_name in sections:
-                for i, line in enumerate(sections[section_name]):
+                for line in sections[section_name].splitlines():
                     if line.strip() and (line.startswith("- ") or ":" in line):
                         try:
                             # Process tts_params as a nested structure
@@ -154,20 +274,7 @@ class PersonaManager:
                                 key = key.strip().lower()
                                 
                                 # Map common alternative keys to our standard keys
-                                key_mapping = {
-                                    "picture": "image", 
-                                    "avatar": "image",
-                                    "greeting": "entry_message",
-                                    "message": "entry_message",
-                                    "voice": "cartesia_voice_id",
-                                    "voice_id": "cartesia_voice_id",
-                                    "links": "relevant_links",
-                                    "references": "relevant_links",
-                                    "urls": "relevant_links"
-                                }
-                                
-                                if key in key_mapping:
-                                    key = key_mapping[key]
+                                key = METADATA_KEY_ALIASES.get(key, key)
                                     
                                 if key in metadata:
                                     if key == "relevant_links":
@@ -186,20 +293,18 @@ class PersonaManager:
         tone_characteristics = []
         
         # Look for characteristics in different possible sections
-        character_sections = ["characteristics", "traits", "personality", "character"]
-        voice_sections = ["voice", "tone", "speech", "speaking style"]
-        
-        for section_type, section_names, target_list in [
-            ("character", character_sections, characteristics),
-            ("voice", voice_sections, tone_characteristics)
-        ]:
+        for section_names, target_list in (
+            (CHARACTER_SECTIONS, characteristics),
+            (VOICE_SECTIONS, tone_characteristics),
+        ):
             for section_name in section_names:
-                if section_name in sections:
-                    for line in sections[section_name]:
-                        if line.strip() and line.startswith("- "):
-                            trait = line[2:].strip()
-                            if trait and trait not in target_list:
-                                target_list.append(trait)
+                if section_name not in sections:
+                    continue
+                for line in sections[section_name].splitlines():
+                    if line.strip() and line.startswith("- "):
+                        trait = line[2:].strip()
+                        if trait and trait not in target_list:
+                            target_list.append(trait)
         
         # Build the final persona object
         persona = {
@@ -232,126 +337,218 @@ class PersonaManager:
         skip_files = {"README.md", ".DS_Store"}
 
         try:
-            for file_path in persona_dir.glob("*.md"):
-                if file_path.name not in skip_files:
-                    with open(file_path, "r", encoding="utf-8") as f:
+            # DirEntry caches the file type, so this avoids pathlib's extra stats
+            with os.scandir(persona_dir) as it:
+                for entry in it:
+                    if (
+                        not entry.name.endswith(".md")
+                        or entry.name in skip_files
+                        or not entry.is_file()
+                    ):
+                        continue
+                    with open(entry.path, "r", encoding="utf-8") as f:
                         content = f.read().strip()
                         if content:
                             additional_content.append(
-                                f"# Content from {file_path.name}\n\n{content}"
+                                f"# Content from {entry.name}\n\n{content}"
                             )
         except Exception as e:
             logger.error(f"Error loading additional content from {persona_dir}: {e}")
 
         return "\n\n".join(additional_content)
 
+    def _persona_files_key(self, persona_dir: Path) -> Tuple:
+        """Build a cache key from the name, mtime and size of a persona's .md files"""
+        key = []
+        with os.scandir(persona_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".md") and entry.is_file():
+                    stat = entry.stat()
+                    key.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(key))
+
+    def _get_parse_cache(self) -> Dict:
+        """Return the on-disk parse cache, reading it on first use only"""
+        if self._parse_cache is None:
+            self._parse_cache = self._load_parse_cache(self._cache_file)
+        return self._parse_cache
+
+    def _load_parse_cache(self, cache_file: Path) -> Dict:
+        """Load previously parsed personas, ignoring a missing or stale cache"""
+        try:
+            with open(cache_file, "rb") as f:
+                cached = orjson.loads(f.read())
+            if cached.get("version") == _PARSE_CACHE_VERSION:
+                # JSON has no tuples, so restore the files key for comparison
+                return {
+                    key: (tuple(tuple(item) for item in files_key), persona)
+                    for key, (files_key, persona) in cached["entries"].items()
+                }
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable persona cache: {e}")
+        return {}
+
+    def _save_parse_cache(self, updates: Dict, keys) -> None:
+        """Merge updated entries into the cache file, dropping personas not in keys
+
+        Several server processes can share one personas directory, so the file
+        is re-read under a lock and written through a unique temp file.
+        """
+        cache_file = self._cache_file
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            with open(cache_file.with_suffix(".lock"), "a") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                entries = self._load_parse_cache(cache_file)
+                entries.update(updates)
+                keys = set(keys)
+                entries = {key: entry for key, entry in entries.items() if key in keys}
+                tmp = tempfile.NamedTemporaryFile(
+                    "wb", dir=cache_file.parent, suffix=".tmp", delete=False
+                )
+                try:
+                    with tmp:
+                        tmp.write(
+                            orjson.dumps(
+                                {"version": _PARSE_CACHE_VERSION, "entries": entries}
+                            )
+                        )
+                    os.replace(tmp.name, cache_file)
+                except BaseException:
+                    # Don't leave temp files piling up in the cache directory
+                    Path(tmp.name).unlink(missing_ok=True)
+                    raise
+        except Exception as e:
+            logger.debug(f"Could not write persona cache: {e}")
+
+    def _parse_persona_dir(
+        self, persona_dir: Path, cache: Dict
+    ) -> Tuple[Tuple, Dict]:
+        """Parse one persona directory, reusing the cached parse if unchanged"""
+        files_key = self._persona_files_key(persona_dir)
+        cached = cache.get(persona_dir.name)
+        if cached and cached[0] == files_key:
+            return files_key, cached[1]
+
+        with open(persona_dir / "README.md", "r", encoding="utf-8") as f:
+            content = f.read()
+        persona_data = self.parse_readme(content)
+
+        # Load additional content
+        additional_content = self.load_additional_content(persona_dir)
+        if additional_content:
+            persona_data["additional_content"] = additional_content
+        return files_key, persona_data
+
     def load_personas(self) -> Dict:
         """Load personas from directory structure"""
         personas = {}
+        # Parsed personas keyed by directory name, reused while the files'
+        # (name, mtime, size) key is unchanged
+        cache = self._get_parse_cache()
         try:
-            for persona_dir in self.personas_dir.iterdir():
-                if not persona_dir.is_dir():
-                    continue
-
-                readme_file = persona_dir / "README.md"
-                if not readme_file.exists():
-                    logger.warning(
-                        f"Skipping persona without README: {persona_dir.name}"
+            keys = self._discover_keys()
+            # Reuse personas that were already parsed individually
+            to_parse = [key for key in keys if self._personas.get(key) is None]
+
+            # Persona reads are dominated by file I/O, which releases the GIL,
+            # so parse the directories concurrently
+            parsed = {}
+            if to_parse:
+                with ThreadPoolExecutor(
+                    max_workers=min(PERSONA_LOAD_WORKERS, len(to_parse))
+                ) as executor:
+                    results = executor.map(
+                        lambda key: self._parse_persona_dir(
+                            self.personas_dir / key, cache
+                        ),
+                        to_parse,
                     )
-                    continue
-
-                with open(readme_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    persona_data = self.parse_readme(content)
-
-                    # Load additional content
-                    additional_content = self.load_additional_content(persona_dir)
-                    if additional_content:
-                        persona_data["additional_content"] = additional_content
-
-                    personas[persona_dir.name] = persona_data
+                    parsed = dict(zip(to_parse, results))
+
+            updates = {}
+            for key in keys:
+                if key in parsed:
+                    if cache.get(key) != parsed[key]:
+                        updates[key] = cache[key] = parsed[key]
+                    personas[key] = parsed[key][1]
+                else:
+                    personas[key] = self._personas[key]
 
+            stale = cache.keys() - set(keys)
+            for key in stale:
+                del cache[key]
+            if updates or stale:
+                self._save_parse_cache(updates, keys)
             return personas
         except Exception as e:
             logger.error(f"Failed to load personas: {e}")
             raise
 
+    def _detect_readme_format(self, content: str) -> Dict:
+        """Detect section names and metadata style used by a README"""
+        readme_format = dict(DEFAULT_README_FORMAT)
+
+        # Collect every "## Header" once, then classify by set membership
+        headers = set(_SECTION_HEADER_RE.findall(content))
+
+        # Detect section names, keeping the first candidate in priority order
+        for format_key, candidates in (
+            ("metadata_section_name", README_METADATA_SECTION_NAMES),
+            ("characteristics_section_name", README_CHARACTER_SECTION_NAMES),
+            ("voice_section_name", README_VOICE_SECTION_NAMES),
+        ):
+            match = next((name for name in candidates if name in headers), None)
+            if match:
+                readme_format[format_key] = match
+
+        # Detect if it has characteristics and voice sections
+        readme_format["has_characteristics"] = not headers.isdisjoint(
+            README_CHARACTER_SECTION_NAMES
+        )
+        readme_format["has_voice"] = not headers.isdisjoint(README_VOICE_SECTION_NAMES)
+
+        # Detect metadata format (dash or no dash)
+        if "- image:" in content:
+            readme_format["metadata_format"] = "- key: value"
+        elif "image:" in content:
+            readme_format["metadata_format"] = "key: value"
+
+        return readme_format
+
     def save_persona(self, key: str, persona: Dict) -> bool:
         """Save a single persona's data while preserving existing format if possible"""
         try:
             persona_dir = self.personas_dir / key
             persona_dir.mkdir(exist_ok=True)
             
-            # Initialize with default format if no existing file
-            existing_format = {
-                "has_characteristics": True,
-                "has_voice": True,
-                "metadata_section_name": "Metadata",
-                "characteristics_section_name": "Characteristics",
-                "voice_section_name": "Voice",
-                "metadata_format": "- key: value"
-            }
-            
-            # Read existing README if it exists to preserve format and metadata
+            # Read the current README for its layout and metadata. Callers edit
+            # the in-memory persona before saving, so it can't tell us what's
+            # on disk.
             readme_file = persona_dir / "README.md"
-            existing_metadata = {}
-            
+            existing_persona = {}
+            existing_format = DEFAULT_README_FORMAT
             if readme_file.exists():
                 with open(readme_file, "r", encoding="utf-8") as f:
                     content = f.read()
-                    
-                    # Detect if it has characteristics and voice sections
-                    existing_format["has_characteristics"] = "## Characteristics" in content or any(
-                        f"## {name}" in content for name in ["Traits", "Personality", "Character"]
-                    )
-                    existing_format["has_voice"] = "## Voice" in content or any(
-                        f"## {name}" in content for name in ["Tone", "Speech", "Speaking Style"]
-                    )
-                    
-                    # Detect metadata section name
-                    metadata_matches = [
-                        section for section in ["Metadata", "Info", "Details", "Configuration", "Settings", "Properties"]
-                        if f"## {section}" in content
-                    ]
-                    if metadata_matches:
-                        existing_format["metadata_section_name"] = metadata_matches[0]
-                        
-                    # Detect characteristics section name
-                    char_matches = [
-                        section for section in ["Characteristics", "Traits", "Personality", "Character"]
-                        if f"## {section}" in content
-                    ]
-                    if char_matches:
-                        existing_format["characteristics_section_name"] = char_matches[0]
-                        
-                    # Detect voice section name
-                    voice_matches = [
-                        section for section in ["Voice", "Tone", "Speech", "Speaking Style"]
-                        if f"## {section}" in content
-                    ]
-                    if voice_matches:
-                        existing_format["voice_section_name"] = voice_matches[0]
-                    
-                    # Detect metadata format (dash or no dash)
-                    if "- image:" in content:
-                        existing_format["metadata_format"] = "- key: value"
-                    elif "image:" in content:
-                        existing_format["metadata_format"] = "key: value"
-                        
-                    # Get existing persona data
-                    existing_persona = self.parse_readme(content)
-                    # Preserve all existing metadata fields
-                    existing_metadata = {
-                        "image": existing_persona.get("image", ""),
-                        "entry_message": existing_persona.get(
-                            "entry_message", DEFAULT_ENTRY_MESSAGE
-                        ),
-                        "cartesia_voice_id": existing_persona.get(
-                            "cartesia_voice_id", ""
-                        ),
-                        "gender": existing_persona.get("gender", ""),
-                        "relevant_links": existing_persona.get("relevant_links", []),
-                    }
+                existing_persona = self.parse_readme(content)
+                existing_format = self._detect_readme_format(content)
+
+            existing_metadata = {}
+            if existing_persona:
+                # Preserve all existing metadata fields
+                existing_metadata = {
+                    "image": existing_persona.get("image", ""),
+                    "entry_message": existing_persona.get(
+                        "entry_message", DEFAULT_ENTRY_MESSAGE
+                    ),
+                    "cartesia_voice_id": existing_persona.get("cartesia_voice_id", ""),
+                    "gender": existing_persona.get("gender", ""),
+                    "relevant_links": existing_persona.get("relevant_links", []),
+                }
 
             # Merge existing metadata with new data, preferring new data when available
             metadata = {
@@ -419,6 +616,9 @@ class PersonaManager:
             with open(readme_file, "w", encoding="utf-8") as f:
                 f.write(readme_content)
 
+            # Callers edit personas in place before saving, so resolved copies
+            # handed out by get_persona are now stale
+            self.clear_persona_cache()
             return True
         except Exception as e:
             logger.error(f"Failed to save persona {key}: {e}")
@@ -435,17 +635,37 @@ class PersonaManager:
 
     def list_personas(self) -> List[str]:
         """Returns a sorted list of available persona names"""
-        return sorted(self.personas.keys())
+        return sorted(self._personas.keys())
+
+    def clear_persona_cache(self) -> None:
+        """Forget resolved personas after the persona set has changed"""
+        self._persona_cache.clear()
+        self._word_index = None
+        self._name_to_key = None
+
+    def _get_word_index(self) -> Dict[str, Set[str]]:
+        """Map each word of a persona key to the keys containing it"""
+        if self._word_index is None:
+            word_index = defaultdict(set)
+            for persona_key in self._personas:
+                for word in persona_key.split("_"):
+                    word_index[word].add(persona_key)
+            self._word_index = dict(word_index)
+        return self._word_index
 
     def get_persona(self, name: Optional[str] = None) -> Dict:
         """Get a persona by name or return a random one"""
+        if name and name in self._persona_cache:
+            # Hand out a copy so callers can't mutate the cached entry
+            return self._persona_cache[name].copy()
+
         if name:
             # Convert to folder name format
             folder_name = name.lower().replace(" ", "_")
 
             # First try exact folder match
-            if folder_name in self.personas:
-                persona = self.personas[folder_name].copy()
+            if folder_name in self._personas:
+                persona = self._load_one(folder_name).copy()
                 logger.info(f"Using specified persona folder: {folder_name}")
             else:
                 # Try to find the closest match among folder names
@@ -453,24 +673,34 @@ class PersonaManager:
                 closest_match = None
                 max_overlap = 0
 
-                for persona_key in self.personas.keys():
-                    persona_words = set(persona_key.split("_"))
-                    overlap = len(words & persona_words)
-                    if overlap > max_overlap:
-                        max_overlap = overlap
-                        closest_match = persona_key
+                word_index = self._get_word_index()
+                overlaps = Counter()
+                for word in words:
+                    overlaps.update(word_index.get(word, ()))
+                if overlaps:
+                    max_overlap = max(overlaps.values())
+                    # Ties go to the first persona in directory order, as before
+                    candidates = [
+                        key for key, count in overlaps.items() if count == max_overlap
+                    ]
+                    if len(candidates) == 1:
+                        closest_match = candidates[0]
+                    else:
+                        closest_match = next(
+                            key for key in self._personas if key in candidates
+                        )
 
                 if closest_match and max_overlap >= 1:  # At least 1 word matches
-                    persona = self.personas[closest_match].copy()
+                    persona = self._load_one(closest_match).copy()
                     logger.warning(
                         f"Using closest matching persona folder: {closest_match} (from: {name})"
                     )
                 else:
                     raise KeyError(
-                        f"Persona '{name}' not found. Valid options: {', '.join(self.personas.keys())}"
+                        f"Persona '{name}' not found. Valid options: {', '.join(self._personas.keys())}"
                     )
         else:
-            persona = random.choice(list(self.personas.values())).copy()
+            persona = self._load_one(random.choice(list(self._personas))).copy()
             logger.info(f"Randomly selected persona: {persona['name']}")
 
         # Only set default image if needed for display purposes
@@ -485,16 +715,26 @@ class PersonaManager:
             else persona["name"].lower().replace(" ", "_")
         )
         persona["path"] = os.path.join(self.personas_dir, persona_key)
+
+        if name:
+            self._persona_cache[name] = persona.copy()
         return persona
 
     def get_persona_by_name(self, name: str) -> Dict:
         """Get a specific persona by display name"""
-        for persona in self.personas.values():
-            if persona["name"] == name:
-                return persona.copy()
-        raise KeyError(
-            f"Persona '{name}' not found. Valid options: {', '.join(p['name'] for p in self.personas.values())}"
-        )
+        if self._name_to_key is None:
+            name_to_key = {}
+            for key, persona in self.personas.items():
+                # Keep the first persona for a duplicated name, like the old scan
+                name_to_key.setdefault(persona["name"], key)
+            self._name_to_key = name_to_key
+
+        key = self._name_to_key.get(name)
+        if key is None:
+            raise KeyError(
+                f"Persona '{name}' not found. Valid options: {', '.join(p['name'] for p in self.personas.values())}"
+            )
+        return self.personas[key].copy()
 
     def update_persona_image(self, key: str, image_path: Union[str, Path]) -> bool:
         """Update image path/URL for a specific persona"""
@@ -516,5 +756,6 @@ class PersonaManager:
         return not (current_url and domain in current_url)
 
 
-# Create global instance for easy access
+# Global instance for easy access. Construction only lists the personas
+# directory; READMEs are parsed when a persona is first needed.
 persona_manager = PersonaManager()
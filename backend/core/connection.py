@@ -1,16 +1,34 @@
 """Connection management for WebSocket clients and Pipecat processes."""
 
 import subprocess
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional
 
 from fastapi import WebSocket
 
 from meetingbaas_pipecat.utils.logger import logger
 
+
+@dataclass(slots=True)
+class MeetingInfo:
+    """Details of a bot's meeting, kept until its WebSocket connects and closes."""
+
+    meeting_url: str
+    persona_name: str
+    meetingbaas_bot_id: Optional[str]
+    enable_tools: bool
+    streaming_audio_frequency: str = "16khz"
+    entry_message: Optional[str] = None
+    text_message: Optional[str] = None
+    started_at: datetime = field(default_factory=datetime.utcnow)
+
+
 # Global dictionary to store meeting details for each client
-MEETING_DETAILS: Dict[
-    str, Tuple[str, str, Optional[str], bool, str]
-] = {}  # client_id -> (meeting_url, persona_name, meetingbaas_bot_id, enable_tools, streaming_audio_frequency)
+MEETING_DETAILS: Dict[str, MeetingInfo] = {}  # client_id -> MeetingInfo
+
+# Reverse index of MEETING_DETAILS so a bot can be found by its MeetingBaas ID
+BAAS_TO_CLIENT: Dict[str, str] = {}  # meetingbaas_bot_id -> client_id
 
 # Global dictionary to store Pipecat processes
 PIPECAT_PROCESSES: Dict[str, subprocess.Popen] = {}  # client_id -> process
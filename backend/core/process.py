@@ -1,15 +1,35 @@
 """Process management for Pipecat processes."""
 
+import json
 import os
 import subprocess
 import sys
+import threading
 import time
-from typing import Optional
+from typing import List, Optional
 
 from config.persona_utils import persona_manager
 from core.connection import MEETING_DETAILS
 from meetingbaas_pipecat.utils.logger import logger
 
+# The bot script each Pipecat process runs
+SCRIPT_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "meetingbaas.py")
+
+# Pipecat processes started ahead of time so a new client doesn't wait for
+# interpreter startup and pipecat imports; each one serves a single client.
+# A standby process loads .env when it starts, not when it gets a client, so
+# edits to .env only reach bots once the pool has been refilled (or the
+# server restarted).
+PIPECAT_STANDBY_PROCESSES = int(os.getenv("PIPECAT_STANDBY_PROCESSES", 2))
+_STANDBY_PROCESSES: List[subprocess.Popen] = []
+# Guards the pool, which is taken from request threads and refilled in the background
+_STANDBY_LOCK = threading.Lock()
+# Pool slots reserved by refills whose process is still being spawned; the
+# spawn itself runs outside the lock so takers never wait behind it
+_standby_spawning = 0
+# Set on shutdown so a late background refill doesn't start new processes
+_standby_closed = False
+
 
 def start_pipecat_process(
     client_id: str,
@@ -35,11 +55,6 @@ def start_pipecat_process(
     """
     logger.info(f"Starting Pipecat process for client {client_id}")
 
-    # Construct the command to run the meetingbaas.py script
-    script_path = os.path.join(
-        os.path.dirname(__file__), "..", "scripts", "meetingbaas.py"
-    )
-
     # Get the persona's custom entry message
     persona = persona_manager.get_persona(persona_name)
 
@@ -52,32 +67,27 @@ def start_pipecat_process(
         logger.info(f"Using custom speech rate from persona: {speech_rate}")
     
     # Check if we have custom entry_message for this client in MEETING_DETAILS
-    # MEETING_DETAILS format: (meeting_url, persona_name, meetingbaas_bot_id, enable_tools, streaming_audio_frequency, entry_message, text_message)
     custom_entry_message = None
     initial_speech = None
     
-    if client_id in MEETING_DETAILS:
-        meeting_details = MEETING_DETAILS[client_id]
+    meeting_details = MEETING_DETAILS.get(client_id)
+    if meeting_details:
         # Check for entry_message (chat text)
-        if len(meeting_details) > 5:
-            custom_entry_message = meeting_details[5]
-            if custom_entry_message:
-                logger.info(f"Using custom entry message from request: {custom_entry_message}")
+        custom_entry_message = meeting_details.entry_message
+        if custom_entry_message:
+            logger.info(f"Using custom entry message from request: {custom_entry_message}")
         
         # Check for text_message (speech)
-        if len(meeting_details) > 6:
-            initial_speech = meeting_details[6]
-            if initial_speech:
-                logger.info(f"Using custom speech message from request: {initial_speech}")
+        initial_speech = meeting_details.text_message
+        if initial_speech:
+            logger.info(f"Using custom speech message from request: {initial_speech}")
     
     # Use custom entry message if available, otherwise fall back to persona default
     entry_message = custom_entry_message if custom_entry_message else persona.get("entry_message", "")
     logger.info(f"Using entry message for chat: {entry_message}")
 
-    # Build command with all parameters
-    command = [
-        sys.executable,
-        script_path,
+    # Build command-line arguments with all parameters
+    args = [
         "--meeting-url",
         meeting_url,
         "--persona-name",
@@ -92,26 +102,107 @@ def start_pipecat_process(
     
     # Add initial speech if available
     if initial_speech:
-        command.extend(["--initial-speech", initial_speech])
+        args.extend(["--initial-speech", initial_speech])
         
     # Add speech rate if available
     if speech_rate:
-        command.extend(["--speech-rate", str(speech_rate)])
+        args.extend(["--speech-rate", str(speech_rate)])
 
     # Add optional flags
     if enable_tools:
-        command.append("--enable-tools")
+        args.append("--enable-tools")
+
+    # Prefer a standby process that has already imported pipecat and only
+    # needs its arguments; fall back to a cold start if none is ready
+    process = _take_standby_process()
+    if process is not None:
+        # Replace the standby process we just took without holding up this client
+        threading.Thread(
+            target=fill_standby_pool, name="pipecat-standby-refill", daemon=True
+        ).start()
+        try:
+            process.stdin.write((json.dumps(args) + "\n").encode("utf-8"))
+            process.stdin.close()
+            logger.info(f"Handed client {client_id} to standby Pipecat process")
+        except OSError as e:
+            logger.warning(f"Standby Pipecat process unusable, starting fresh: {e}")
+            process.kill()
+            process = None
 
-    # Start the process
-    process = subprocess.Popen(
-        command,
-        env=os.environ.copy(),  # Copy the current environment
-    )
+    if process is None:
+        process = _spawn([sys.executable, SCRIPT_PATH, *args])
 
     logger.info(f"Started Pipecat process with PID {process.pid}")
     return process
 
 
+def _spawn(command: List[str], **kwargs) -> subprocess.Popen:
+    """Start a process that inherits our environment without copying it."""
+    # Descriptors Python opens are non-inheritable (PEP 446), so the child
+    # doesn't need close_fds' per-fd close loop; leaving it off (and no
+    # preexec_fn/pass_fds/cwd) lets CPython spawn via posix_spawn
+    return subprocess.Popen(command, close_fds=False, **kwargs)
+
+
+def _take_standby_process() -> Optional[subprocess.Popen]:
+    """Pop a live standby process from the pool, if there is one."""
+    with _STANDBY_LOCK:
+        while _STANDBY_PROCESSES:
+            process = _STANDBY_PROCESSES.pop(0)
+            if process.poll() is None:
+                return process
+            logger.warning(f"Standby Pipecat process {process.pid} exited unused")
+    return None
+
+
+def fill_standby_pool() -> None:
+    """Start standby Pipecat processes until the pool is full."""
+    global _standby_spawning
+    while True:
+        with _STANDBY_LOCK:
+            if (
+                _standby_closed
+                or len(_STANDBY_PROCESSES) + _standby_spawning
+                >= PIPECAT_STANDBY_PROCESSES
+            ):
+                return
+            _standby_spawning += 1
+
+        try:
+            process = _spawn(
+                [sys.executable, SCRIPT_PATH, "--standby"], stdin=subprocess.PIPE
+            )
+        except Exception as e:
+            # Caught broadly so the reserved slot is always given back below
+            logger.error(f"Failed to start standby Pipecat process: {e}")
+            process = None
+
+        with _STANDBY_LOCK:
+            _standby_spawning -= 1
+            closed = _standby_closed
+            if process is not None and not closed:
+                _STANDBY_PROCESSES.append(process)
+
+        if process is None:
+            return
+        if closed:
+            # The pool shut down while this process was starting
+            terminate_process_gracefully(process, timeout=1.0)
+            return
+        logger.debug(f"Started standby Pipecat process with PID {process.pid}")
+
+
+def shutdown_standby_pool() -> None:
+    """Terminate any standby Pipecat processes that were never used."""
+    global _standby_closed
+    with _STANDBY_LOCK:
+        _standby_closed = True
+        processes = _STANDBY_PROCESSES[:]
+        _STANDBY_PROCESSES.clear()
+    for process in processes:
+        terminate_process_gracefully(process, timeout=1.0)
+
+
 def terminate_process_gracefully(
     process: subprocess.Popen, timeout: float = 2.0
 ) -> bool:
@@ -1,10 +1,17 @@
 import argparse
 import asyncio
+import json
+import math
 import os
 import os
+import random
+import re
+import sys
 import time
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 
 import aiohttp
 import numpy as np
@@ -13,11 +20,23 @@ from dotenv import load_dotenv
 from pipecat.adapters.schemas.function_schema import FunctionSchema
 from pipecat.adapters.schemas.tools_schema import ToolsSchema
 from pipecat.audio.vad.silero import SileroVADAnalyzer, VADParams
-from pipecat.frames.frames import LLMMessagesFrame, TTSSpeakFrame, Frame, AudioRawFrame
+from pipecat.frames.frames import (
+    AudioRawFrame,
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    Frame,
+    LLMMessagesFrame,
+    TTSSpeakFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
-from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.processors.aggregators.openai_llm_context import (
+    OpenAILLMContext,
+    OpenAILLMContextFrame,
+)
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.serializers.protobuf import ProtobufFrameSerializer
 from pipecat.services.cartesia.tts import CartesiaTTSService
@@ -39,6 +58,74 @@ load_dotenv(override=True)
 
 logger = configure_logger()
 
+# Audio RMS above which a user audio frame counts as speech (lowered from 300
+# for better detection), squared so frames can be checked without a sqrt
+SPEECH_RMS_THRESHOLD = 200
+SPEECH_RMS_THRESHOLD_SQ = SPEECH_RMS_THRESHOLD**2
+
+# Greetings generic enough to get persona context appended, and words that
+# already give a CXO greeting an executive tone. Matched as substrings of the
+# lowercased greeting in a single regex pass
+GENERIC_GREETING_RE = re.compile("hello|hi|greetings|meeting")
+EXECUTIVE_TONE_RE = re.compile("strategic|priority|results|team")
+
+# Conversation messages kept in the LLM context after the system prompt. Older
+# turns are dropped so long meetings don't resend an ever-growing history
+MAX_CONTEXT_MESSAGES = int(os.getenv("MAX_CONTEXT_MESSAGES", 40))
+
+# Seconds of silence before a bot checks in, when not set with
+# --silence-threshold. CXO personas wait a little longer before prompting
+CXO_SILENCE_THRESHOLD = 12.0
+DEFAULT_SILENCE_THRESHOLD = 8.0
+
+# Speech instructions appended to the system prompt of CXO personas
+CXO_SPEECH_INSTRUCTIONS = (
+    "\n\nIMPORTANT SPEECH INSTRUCTIONS:\n"
+    "1. SPEAK LIKE A C-SUITE EXECUTIVE. Use decisive, authoritative language that demonstrates leadership.\n"
+    "2. Use executive shorthand and business terminology (ROI, KPIs, EBITDA, etc.) when appropriate.\n"
+    "3. BE EXTREMELY BRIEF AND TO THE POINT. Executives value brevity - keep all responses under 3 sentences.\n"
+    "4. Maintain executive presence by focusing ONLY on strategic priorities rather than details.\n"
+    "5. Ask short, penetrating questions that drive accountability.\n"
+    "6. NEVER say phrases like 'How can I assist you' or 'I'm here to help'—these sound like a chatbot, not an executive.\n"
+    "7. EVERYTHING YOU SAY WILL BE SPOKEN OUT LOUD, so communicate naturally but concisely.\n"
+
+    # Add specific communication patterns from sample conversations
+    "\n\nUSE THESE EXECUTIVE COMMUNICATION PATTERNS:\n"
+    "1. Begin with direct framing: 'Let me be direct.' 'This is unacceptable.' 'This requires immediate action.'\n"
+    "2. Ask focused business questions: 'What are the key drivers?' 'Who's accountable?'\n"
+    "3. Give specific timelines: 'I need that analysis by Thursday.'\n"
+    "4. Structure responses briefly: 'First, assess impact. Second, identify solutions.'\n"
+    "5. End with accountability: 'Who owns this?' 'When will it be done?'\n"
+    "6. Use concise business language: 'P&L impact' 'competitive position' 'synergy targets'\n"
+    "7. Be decisive: 'Here's what we'll do:' followed by 1-2 concrete actions.\n"
+    "8. Frame issues strategically but briefly.\n"
+    "9. CRITICAL: Keep all responses under 15 seconds of speaking time - be ruthlessly concise.\n"
+    "10. NEVER use filler words or phrases like 'I believe', 'I think', or 'perhaps'.\n"
+    "11. Use short, declarative sentences with active voice.\n"
+    "12. Limit responses to 2-3 sentences maximum.\n"
+
+    # Add context-awareness and conversation tracking instructions for CXO
+    "\n\nCONTEXT AWARENESS AND CONVERSATION MANAGEMENT:\n"
+    "1. MAINTAIN FULL MEMORY of the conversation to ensure continuity and context-aware responses.\n"
+    "2. PROACTIVELY ASK RELEVANT QUESTIONS based on the meeting context - be specific, not generic.\n"
+    "3. TRACK ACCOUNTABLE PARTIES mentioned during the conversation and follow up on them.\n"
+    "4. REFER TO METRICS and KPIs discussed earlier in the conversation.\n"
+    "5. Show executive presence by staying LASER-FOCUSED ON THE MEETING OBJECTIVE at all times.\n"
+    "6. IF YOU DON'T KNOW specific details from the meeting context, ASK pointed questions rather than making assumptions.\n"
+    "7. CRITICAL: Always respond directly to what was just said rather than bringing up unrelated topics.\n"
+    "8. If someone mentions new information, INCORPORATE IT into your mental model of the meeting.\n"
+)
+
+# Speech instructions appended to the system prompt of all other personas
+GENERAL_SPEECH_INSTRUCTIONS = (
+    "\n\nIMPORTANT SPEECH INSTRUCTIONS:\n"
+    "1. BE EXTREMELY CONCISE. Keep your first response to 1-2 short sentences. Subsequent responses should be brief and to the point.\n"
+    "2. NEVER use special characters like *, #, -, or markdown formatting in your responses, as they will be spoken literally.\n"
+    "3. Avoid excessive punctuation, bullet points, or numbered lists.\n"
+    "4. Do not say 'I am here to help' or similar intro phrases - get straight to the content.\n"
+    "5. EVERYTHING YOU SAY WILL BE SPOKEN OUT LOUD, so communicate naturally as in a real conversation.\n"
+)
+
 
 class SilenceDetectionProcessor(FrameProcessor):
     """
@@ -46,16 +133,40 @@ class SilenceDetectionProcessor(FrameProcessor):
     Specifically designed for executive/CXO personas to maintain meeting flow.
     """
 
-    def __init__(self, persona_name: str = "", silence_threshold_seconds: float = 6.0, task=None):
+    def __init__(
+        self,
+        persona_name: str = "",
+        silence_threshold_seconds: float = 6.0,
+        task=None,
+        use_vad_events: bool = False,
+    ):
         super().__init__()
         self.persona_name = persona_name
         self.silence_threshold_seconds = silence_threshold_seconds
-        self.last_speech_time = time.time()
+        # With VAD on the input transport, user speech is tracked from its
+        # speaking events; otherwise fall back to measuring audio levels
+        self.use_vad_events = use_vad_events
+        self.user_speaking = False
+        self.next_audio_log_time = 0.0  # When the audio level is next logged
+        # Estimated end of the bot's current TTS speech; audio before then is
+        # the bot's own voice, so it isn't level-checked
+        self._bot_talking_until = float("-inf")
+        self._reset_handle: Optional[asyncio.TimerHandle] = None  # Pending silence flag reset
+        # Set while the output transport isn't playing bot audio
+        self._bot_quiet = asyncio.Event()
+        self._bot_quiet.set()
+        # Speech-tracking handlers per frame class, filled in by _frame_handlers_for
+        self._frame_handlers: Dict[type, Tuple[Any, ...]] = {}
+        # Identity and length of the last message list checked by _on_messages
+        self._last_messages_key: Optional[Tuple[int, int]] = None
+        # Timestamps use time.monotonic() so wall-clock adjustments can't
+        # fire or suppress silence responses
+        self.last_speech_time = time.monotonic()
         self.silence_triggered = False
         self.conversation_started = False
         self.initial_grace_period = 10.0  # Don't trigger in first 10 seconds
-        self.start_time = time.time()
-        self.last_silence_trigger_time = 0.0  # Track when we last triggered silence
+        self.start_time = time.monotonic()
+        self.last_silence_trigger_time = float("-inf")  # Track when we last triggered silence
         self.min_silence_interval = 30.0  # Minimum 30 seconds between silence triggers
         self.task = task  # Store reference to task for buffer flushing
         
@@ -81,70 +192,30 @@ class SilenceDetectionProcessor(FrameProcessor):
             "Are you still there? I don't hear anything."
         ]
 
+        # Cycle through a shuffled copy of this persona's responses so the same
+        # one is never used twice in a row
+        is_cxo = bool(persona_name and "cxo" in persona_name.lower())
+        self.response_label = "CXO" if is_cxo else "General"
+        responses = list(
+            self.cxo_silence_responses if is_cxo else self.general_silence_responses
+        )
+        random.shuffle(responses)
+        self.silence_responses = deque(responses)
+
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         """Process frames to detect speech and silence periods."""
         
         # Call the parent class method first (required by pipecat framework)
         await super().process_frame(frame, direction)
         
-        current_time = time.time()
+        current_time = time.monotonic()
         
-        # Track speech activity from multiple sources
+        # Track speech activity from every source this frame type carries;
+        # each handler runs even after one has detected speech
         speech_detected = False
-        
-        # Method 1: Check STT transcript frames (most reliable)
-        if hasattr(frame, 'text') and frame.text:
-            # If we get actual transcribed text, someone is definitely speaking
-            if len(frame.text.strip()) > 0:
-                speech_detected = True
-                logger.debug(f"Speech detected via STT: '{frame.text}'")
-        
-        # Method 2: Check for user message frames (from aggregator)
-        if hasattr(frame, 'messages') and frame.messages:
-            # If we get user messages, someone is communicating
-            for message in frame.messages:
-                if message.get('role') == 'user' and message.get('content', '').strip():
-                    speech_detected = True
-                    logger.debug(f"User activity detected: '{message.get('content', '')[:50]}...'")
-                    break
-        
-        # Method 3: Check for bot speech frames (TTSSpeakFrame)
-        if isinstance(frame, TTSSpeakFrame):
-            if frame.text and len(frame.text.strip()) > 0:
+        for handler in self._frame_handlers_for(frame):
+            if handler(frame, current_time):
                 speech_detected = True
-                
-                # Calculate estimated speech duration to properly reset timer
-                # Average speaking rate is about 150-200 words per minute
-                word_count = len(frame.text.split())
-                estimated_duration = max(2.0, word_count / 2.5)  # At least 2 seconds, ~150 WPM
-                
-                # Set the last_speech_time to current time + estimated duration
-                # This ensures silence detection doesn't trigger until AFTER the bot finishes speaking
-                self.last_speech_time = current_time + estimated_duration
-                logger.info(f"Bot speech detected: '{frame.text[:50]}...' (estimated {estimated_duration:.1f}s duration)")
-                logger.debug(f"Silence timer extended to: {self.last_speech_time:.1f}")
-        
-        # Method 4: Check audio frames with level detection
-        if isinstance(frame, AudioRawFrame):
-            if hasattr(frame, 'audio') and frame.audio is not None:
-                audio_data = frame.audio
-                if len(audio_data) > 0:
-                    try:
-                        # Calculate basic audio level (RMS)
-                        audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                        if len(audio_array) > 0:
-                            rms = np.sqrt(np.mean(audio_array.astype(np.float32) ** 2))
-                            # If audio level is above threshold, consider it speech
-                            if rms > 200:  # Lowered threshold from 300 to 200 for better detection
-                                speech_detected = True
-                                logger.debug(f"User speech detected via audio level: RMS={rms:.2f}")
-                            # Occasionally log audio levels for debugging
-                            if (current_time % 10) < 0.1:  # Log approximately every 10 seconds
-                                logger.debug(f"Current audio RMS level: {rms:.2f}")
-                    except Exception as e:
-                        # If numpy processing fails, just continue
-                        logger.warning(f"Error processing audio frame: {e}")
-                        pass
         
         # Update speech tracking
         if speech_detected:
@@ -159,50 +230,182 @@ class SilenceDetectionProcessor(FrameProcessor):
             self.conversation_started = True
             logger.debug("Speech activity detected, resetting silence timer")
 
-        # Check for extended silence
-        elapsed_since_start = current_time - self.start_time
+        # Check for extended silence; until the threshold is exceeded (the
+        # common case) none of the other trigger conditions matter
         silence_duration = current_time - self.last_speech_time
-        time_since_last_trigger = current_time - self.last_silence_trigger_time
-        
-        # Only trigger if:
-        # 1. Past initial grace period
-        # 2. Conversation has started (someone has spoken at least once)
-        # 3. Silence threshold exceeded
-        # 4. Haven't already triggered recently
-        # 5. Enough time has passed since last silence trigger
-        if (elapsed_since_start > self.initial_grace_period and
-            self.conversation_started and
-            silence_duration > self.silence_threshold_seconds and
-            not self.silence_triggered and
-            time_since_last_trigger > self.min_silence_interval):
-            
-            logger.info(f"Extended silence detected: {silence_duration:.1f}s since last speech, {time_since_last_trigger:.1f}s since last trigger")
-            self.silence_triggered = True
-            self.last_silence_trigger_time = current_time
-            await self._trigger_silence_response()
+        if silence_duration > self.silence_threshold_seconds:
+            elapsed_since_start = current_time - self.start_time
+            time_since_last_trigger = current_time - self.last_silence_trigger_time
+
+            # Only trigger if:
+            # 1. Past initial grace period
+            # 2. Conversation has started (someone has spoken at least once)
+            # 3. Silence threshold exceeded
+            # 4. Haven't already triggered recently
+            # 5. Enough time has passed since last silence trigger
+            # 6. The user isn't in the middle of speaking
+            if (elapsed_since_start > self.initial_grace_period and
+                self.conversation_started and
+                not self.user_speaking and
+                not self.silence_triggered and
+                time_since_last_trigger > self.min_silence_interval):
+
+                logger.info(f"Extended silence detected: {silence_duration:.1f}s since last speech, {time_since_last_trigger:.1f}s since last trigger")
+                self.silence_triggered = True
+                self.last_silence_trigger_time = current_time
+                await self._trigger_silence_response()
 
         # Pass the frame through
         await self.push_frame(frame, direction)
 
+    def _frame_handlers_for(self, frame: Frame) -> Tuple[Any, ...]:
+        """Return the speech-tracking handlers that apply to this frame's type."""
+        # Resolved with isinstance/hasattr the first time a frame class is
+        # seen, then a single dict lookup for every later frame of that class
+        handlers = self._frame_handlers.get(type(frame))
+        if handlers is None:
+            found = []
+            if hasattr(frame, "text"):
+                found.append(self._on_text)
+            if hasattr(frame, "messages"):
+                found.append(self._on_messages)
+            if isinstance(frame, TTSSpeakFrame):
+                found.append(self._on_bot_speech)
+            if isinstance(frame, BotStartedSpeakingFrame):
+                found.append(self._on_bot_started_speaking)
+            if isinstance(frame, BotStoppedSpeakingFrame):
+                found.append(self._on_bot_stopped_speaking)
+            if isinstance(frame, UserStartedSpeakingFrame):
+                found.append(self._on_user_started_speaking)
+            if isinstance(frame, UserStoppedSpeakingFrame):
+                found.append(self._on_user_stopped_speaking)
+            if isinstance(frame, AudioRawFrame) and not self.use_vad_events:
+                found.append(self._on_audio)
+            handlers = self._frame_handlers[type(frame)] = tuple(found)
+        return handlers
+
+    def _on_text(self, frame: Frame, current_time: float) -> bool:
+        """Method 1: Check STT transcript frames (most reliable)."""
+        if frame.text and len(frame.text.strip()) > 0:
+            # If we get actual transcribed text, someone is definitely speaking
+            logger.debug("Speech detected via STT: '{}'", frame.text)
+            return True
+        return False
+
+    def _on_messages(self, frame: Frame, current_time: float) -> bool:
+        """Method 2: Check for user message frames (from aggregator)."""
+        messages = frame.messages
+        if not messages:
+            return False
+
+        # The same list is often delivered again on later frames. New turns
+        # are appended, so the list's identity and length tell whether
+        # anything changed since the last frame
+        messages_key = (id(messages), len(messages))
+        if messages_key == self._last_messages_key:
+            return False
+        self._last_messages_key = messages_key
+
+        # If the newest message is the user's, someone is communicating
+        message = messages[-1]
+        if message.get('role') == 'user' and message.get('content', '').strip():
+            logger.debug("User activity detected: '{:.50}...'", message.get('content', ''))
+            return True
+        return False
+
+    def _on_bot_speech(self, frame: TTSSpeakFrame, current_time: float) -> bool:
+        """Method 3: Check for bot speech frames (TTSSpeakFrame)."""
+        if not frame.text or len(frame.text.strip()) == 0:
+            return False
+
+        # Calculate estimated speech duration to properly reset timer
+        # Average speaking rate is about 150-200 words per minute
+        # Counting spaces approximates the word count without building a list
+        # of words, which is plenty for a rough WPM estimate
+        word_count = frame.text.count(" ") + 1
+        estimated_duration = max(2.0, word_count / 2.5)  # At least 2 seconds, ~150 WPM
+
+        # Set the last_speech_time to current time + estimated duration
+        # This ensures silence detection doesn't trigger until AFTER the bot finishes speaking
+        self.last_speech_time = current_time + estimated_duration
+        self._bot_talking_until = self.last_speech_time
+        logger.info(f"Bot speech detected: '{frame.text[:50]}...' (estimated {estimated_duration:.1f}s duration)")
+        logger.debug("Silence timer extended to: {:.1f}", self.last_speech_time)
+        return True
+
+    def _on_bot_started_speaking(self, frame: Frame, current_time: float) -> bool:
+        """Track bot audio playback so silence responses don't talk over it."""
+        self._bot_quiet.clear()
+        return False
+
+    def _on_bot_stopped_speaking(self, frame: Frame, current_time: float) -> bool:
+        """The bot's audio output has drained."""
+        self._bot_quiet.set()
+        return False
+
+    def _on_user_started_speaking(self, frame: Frame, current_time: float) -> bool:
+        """Method 4: Use the transport's VAD events.
+
+        Silero already classifies every audio frame upstream, so the samples
+        don't need re-scanning.
+        """
+        self.user_speaking = True
+        logger.debug("User speech detected via VAD")
+        return True
+
+    def _on_user_stopped_speaking(self, frame: Frame, current_time: float) -> bool:
+        """Restart the silence timer from the end of the utterance."""
+        self.user_speaking = False
+        return True
+
+    def _on_audio(self, frame: AudioRawFrame, current_time: float) -> bool:
+        """Method 5: Check audio frames with level detection when VAD isn't available."""
+        if current_time < self._bot_talking_until:
+            # The silence timer already runs past the end of the bot's speech
+            return False
+
+        audio_data = frame.audio
+        if audio_data is None or len(audio_data) == 0:
+            return False
+
+        speech_detected = False
+        try:
+            # Calculate basic audio level (RMS) from the sum of squares. A
+            # float64 dot product runs as a single BLAS SIMD pass and is exact
+            # for int16 samples (frames would need ~8M samples to exceed 2^53)
+            audio_array = np.frombuffer(audio_data, dtype=np.int16)
+            samples = len(audio_array)
+            if samples > 0:
+                audio_float = audio_array.astype(np.float64)
+                sum_squares = float(np.dot(audio_float, audio_float))
+                # If audio level is above threshold, consider it speech;
+                # rms > T is the same test as sum_squares > T^2 * samples
+                if sum_squares > SPEECH_RMS_THRESHOLD_SQ * samples:
+                    speech_detected = True
+                    logger.debug("User speech detected via audio level: RMS={:.2f}", math.sqrt(sum_squares / samples))
+                # Occasionally log audio levels for debugging
+                if current_time >= self.next_audio_log_time:  # Log every 10 seconds
+                    logger.debug("Current audio RMS level: {:.2f}", math.sqrt(sum_squares / samples))
+                    self.next_audio_log_time = current_time + 10.0
+        except Exception as e:
+            # If numpy processing fails, just continue
+            logger.warning(f"Error processing audio frame: {e}")
+        return speech_detected
+
     async def _trigger_silence_response(self):
         """Trigger an appropriate silence response based on persona."""
         try:
-            # Choose response based on persona type
-            if self.persona_name and "cxo" in self.persona_name.lower():
-                import random
-                response_text = random.choice(self.cxo_silence_responses)
-                logger.info(f"CXO silence response triggered: '{response_text}'")
-            else:
-                import random
-                response_text = random.choice(self.general_silence_responses)
-                logger.info(f"General silence response triggered: '{response_text}'")
+            # Take the next response for this persona type
+            response_text = self.silence_responses[0]
+            self.silence_responses.rotate(-1)
+            logger.info(f"{self.response_label} silence response triggered: '{response_text}'")
             
             # Add a slight pause at the beginning for clearer notification
             # and speak slightly slower for better comprehension
             response = response_text
             
             # Calculate how long this silence response will take to speak
-            word_count = len(response.split())
+            word_count = response.count(" ") + 1
             estimated_duration = max(3.0, word_count / 2.0)  # Slightly slower than normal rate
             
             # Flush audio buffers if task is available to prevent stuttering
@@ -213,8 +416,12 @@ class SilenceDetectionProcessor(FrameProcessor):
                 except Exception as e:
                     logger.warning(f"Could not flush audio buffers: {e}")
             
-            # Add a small delay before speaking to allow audio buffers to clear
-            await asyncio.sleep(0.5)
+            # Let any bot audio still playing finish before speaking, waiting no
+            # longer than the old fixed 0.5s delay; no wait if output is idle
+            try:
+                await asyncio.wait_for(self._bot_quiet.wait(), timeout=0.5)
+            except asyncio.TimeoutError:
+                pass
             
             # Create and queue the response frame
             silence_frame = TTSSpeakFrame(response)
@@ -223,37 +430,102 @@ class SilenceDetectionProcessor(FrameProcessor):
             # Reset the silence timer to AFTER this response finishes speaking
             # This prevents the silence detector from triggering again immediately
             # Use a longer buffer time to prevent stuttering or rapid re-triggering
-            self.last_speech_time = time.time() + estimated_duration + 2.0  # Add 2.0s buffer (was 1.0s)
+            self.last_speech_time = time.monotonic() + estimated_duration + 2.0  # Add 2.0s buffer (was 1.0s)
             logger.debug(f"Set last_speech_time to {self.last_speech_time} (now + {estimated_duration + 2.0}s)")
             
-            # Allow re-triggering after another full silence period
-            async def reset_silence_flag():
-                try:
-                    await asyncio.sleep(3.0)  # Reduced from 5.0 to 3.0 seconds
-                    self.silence_triggered = False
-                    logger.info("Silence triggered flag reset after timeout")
-                except Exception as e:
-                    # Make sure we reset the flag even if there's an error
-                    self.silence_triggered = False
-                    logger.error(f"Error in reset_silence_flag: {e}")
-            
-            # Create task with error handling
+            # Allow re-triggering after another full silence period; a timer
+            # callback is enough here, no task is needed to flip the flag
+            if self._reset_handle is not None:
+                self._reset_handle.cancel()
             try:
-                asyncio.create_task(reset_silence_flag())
+                self._reset_handle = asyncio.get_running_loop().call_later(
+                    3.0, self._reset_silence_flag  # Reduced from 5.0 to 3.0 seconds
+                )
             except Exception as e:
-                # Immediate fallback if task creation fails
+                # Immediate fallback if the timer can't be scheduled
                 self.silence_triggered = False
-                logger.error(f"Failed to create reset_silence_flag task: {e}")
+                logger.error(f"Failed to schedule silence flag reset: {e}")
             
         except Exception as e:
             logger.error(f"Error in silence response: {e}")
 
+    def _reset_silence_flag(self):
+        """Allow silence responses again once the reset delay has passed."""
+        self._reset_handle = None
+        self.silence_triggered = False
+        logger.info("Silence triggered flag reset after timeout")
+
     def set_task(self, task):
         """Set the task reference for buffer flushing."""
         self.task = task
         logger.debug("Task reference set for silence detector")
 
 
+class ContextWindowProcessor(FrameProcessor):
+    """
+    Keeps the LLM context to the system prompt plus the most recent turns.
+    Sits between the user aggregator and the LLM so every request is bounded.
+    """
+
+    def __init__(self, max_messages: int = MAX_CONTEXT_MESSAGES):
+        super().__init__()
+        self.max_messages = max_messages
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        """Trim the context carried by LLM context frames, then pass them on."""
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, OpenAILLMContextFrame):
+            self._trim_context(frame.context)
+
+        await self.push_frame(frame, direction)
+
+    def _trim_context(self, context: OpenAILLMContext):
+        """Drop the oldest turns once the conversation exceeds max_messages."""
+        messages = context.messages
+
+        # Leading system messages hold the persona prompt and are always kept
+        start = 0
+        while start < len(messages) and messages[start].get("role") == "system":
+            start += 1
+
+        excess = len(messages) - start - self.max_messages
+        if excess <= 0:
+            return
+
+        # Cut at a user turn so tool calls stay paired with their results
+        cut = start + excess
+        while cut < len(messages) and messages[cut].get("role") != "user":
+            cut += 1
+        if cut >= len(messages):
+            return
+
+        context.set_messages(messages[:start] + messages[cut:])
+        logger.debug(f"Trimmed {cut - start} old messages from the LLM context")
+
+
+# Shared session so repeated tool calls reuse keep-alive connections
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+        )
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """Close the shared aiohttp session, if one was opened."""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
 # Function tool implementations
 async def get_weather(
     function_name, tool_call_id, arguments, llm, context, result_callback
@@ -267,17 +539,22 @@ async def get_weather(
 
     url = f"https://wttr.in/{location}?format=%t+%C&{unit}"
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            if response.status == 200:
-                weather_data = await response.text()
-                await result_callback(
-                    f"The weather in {location} is currently {weather_data} ({format.capitalize()})."
-                )
-            else:
-                await result_callback(
-                    f"Failed to fetch the weather data for {location}."
-                )
+    async with _get_http_session().get(url) as response:
+        if response.status == 200:
+            weather_data = await response.text()
+            await result_callback(
+                f"The weather in {location} is currently {weather_data} ({format.capitalize()})."
+            )
+        else:
+            await result_callback(
+                f"Failed to fetch the weather data for {location}."
+            )
+
+
+@lru_cache(maxsize=256)
+def _get_timezone(name: str):
+    """Look up a timezone once per name; unknown names still raise each time."""
+    return pytz.timezone(name)
 
 
 async def get_time(
@@ -288,7 +565,7 @@ async def get_time(
 
     # Set timezone based on the provided location
     try:
-        timezone = pytz.timezone(location)
+        timezone = _get_timezone(location)
         current_time = datetime.now(timezone)
         formatted_time = current_time.strftime("%Y-%m-%d %H:%M:%S")
         await result_callback(f"The current time in {location} is {formatted_time}.")
@@ -315,6 +592,29 @@ def _convert_speech_rate_to_speed(speech_rate):
     return None
 
 
+@lru_cache(maxsize=1)
+def _get_vad_analyzer() -> Optional[SileroVADAnalyzer]:
+    """Build the Silero VAD analyzer, loading its ONNX model once per process.
+
+    Its settings don't depend on the bot's arguments, so standby processes
+    create it before they are assigned a client. Returns None if the model
+    can't be loaded, in which case silence detection measures audio levels.
+    """
+    try:
+        return SileroVADAnalyzer(
+            sample_rate=16000,  # Must be either 8000 or 16000
+            params=VADParams(
+                threshold=0.5,  # Lowered threshold from 0.6 to 0.5 for better detection
+                min_speech_duration_ms=80,  # Faster response (reduced from 100ms)
+                min_silence_duration_ms=300,  # Shorter silence for responsiveness
+                min_volume=0.4,  # Lower volume threshold from 0.5 to 0.4 for better pickup
+            ),
+        )
+    except Exception as e:
+        logger.warning(f"Silero VAD unavailable, continuing without it: {e}")
+        return None
+
+
 async def main(
     meeting_url: str = "",
     persona_name: str = "Meeting Bot",
@@ -326,6 +626,7 @@ async def main(
     extra_data: Optional[Dict[str, Any]] = None,
     speech_rate: float = 0.85,
     enable_silence_detection: bool = True,
+    silence_threshold: Optional[float] = None,
 ):
     """
     Main function to run the meeting bot with voice capability.
@@ -346,6 +647,9 @@ async def main(
     bot_id = parts[-1] if len(parts) > 3 else "unknown"
     logger.info(f"Using bot ID: {bot_id}")
 
+    # CXO personas get executive speech settings, prompts and greetings
+    is_cxo = bool(persona_name and "cxo" in persona_name.lower())
+
     # Get persona configuration
     persona_manager = PersonaManager()
     persona = persona_manager.get_persona(persona_name)
@@ -376,7 +680,7 @@ async def main(
     persona_sample_rate = tts_params.get("sample_rate", 16000)
     
     # Force 16000 Hz sample rate for CXO persona to fix voice cracking issue
-    if persona_name and "cxo" in persona_name.lower():
+    if is_cxo:
         persona_sample_rate = 16000
         tts_params["sample_rate"] = 16000
         logger.info(f"Forcing 16kHz sample rate for CXO persona to prevent voice cracking")
@@ -410,6 +714,8 @@ async def main(
             # Continue without resampler if creation fails
             resampler = None
 
+    vad_analyzer = _get_vad_analyzer()
+
     # Set up the WebSocket transport with correct sample rates - use the full WebSocket URL directly
     transport = WebsocketClientTransport(
         uri=websocket_url,
@@ -417,16 +723,8 @@ async def main(
             audio_out_sample_rate=output_sample_rate,
             audio_out_enabled=True,
             add_wav_header=False,
-            vad_enabled=True,
-            vad_analyzer=SileroVADAnalyzer(
-                sample_rate=16000,  # Must be either 8000 or 16000
-                params=VADParams(
-                    threshold=0.5,  # Lowered threshold from 0.6 to 0.5 for better detection
-                    min_speech_duration_ms=80,  # Faster response (reduced from 100ms)
-                    min_silence_duration_ms=300,  # Shorter silence for responsiveness
-                    min_volume=0.4,  # Lower volume threshold from 0.5 to 0.4 for better pickup
-                ),
-            ),
+            vad_enabled=vad_analyzer is not None,
+            vad_analyzer=vad_analyzer,
             vad_audio_passthrough=True,
             serializer=ProtobufFrameSerializer(),
         ),
@@ -440,7 +738,7 @@ async def main(
     tts_params = persona.get("tts_params", {})
     
     # For CXO persona, ensure speech rate is appropriate for executive communication
-    if persona_name and "cxo" in persona_name.lower():
+    if is_cxo:
         # Use a more moderate speech rate for the CXO persona to prevent stuttering
         # 0.85 is good for executive communication - authoritative but clear
         tts_params["speech_rate"] = 0.85
@@ -453,7 +751,7 @@ async def main(
     tts_sample_rate = tts_params.get("sample_rate", output_sample_rate)
     
     # For CXO persona, always force 16000 Hz to fix voice cracking
-    if persona_name and "cxo" in persona_name.lower():
+    if is_cxo:
         tts_sample_rate = 16000
         output_sample_rate = 16000
         logger.info(f"Forcing consistent 16kHz sample rate for CXO bot to prevent voice cracking")
@@ -570,60 +868,22 @@ async def main(
     bot_name = persona_name or "Bot"
     logger.info(f"Using bot name: {bot_name}")
 
-    # Create a more comprehensive system prompt
-    system_content = persona["prompt"]
+    # Create a more comprehensive system prompt, joined once at the end
+    system_parts = [persona["prompt"]]
 
     # Add additional context if available
     if additional_content:
-        system_content += f"\n\nYou are {persona_name}\n\n{DEFAULT_SYSTEM_PROMPT}\n\n"
-        system_content += "You have the following additional context. USE IT TO INFORM YOUR RESPONSES:\n\n"
-        system_content += additional_content
-        
-    # Add special instructions to ensure concise and clean speech output
-    system_content += "\n\nIMPORTANT SPEECH INSTRUCTIONS:\n"
-    
-    # Check if this is the CXO persona and add executive-specific speech patterns
-    if persona_name and "cxo" in persona_name.lower():
-        system_content += "1. SPEAK LIKE A C-SUITE EXECUTIVE. Use decisive, authoritative language that demonstrates leadership.\n"
-        system_content += "2. Use executive shorthand and business terminology (ROI, KPIs, EBITDA, etc.) when appropriate.\n"
-        system_content += "3. BE EXTREMELY BRIEF AND TO THE POINT. Executives value brevity - keep all responses under 3 sentences.\n"
-        system_content += "4. Maintain executive presence by focusing ONLY on strategic priorities rather than details.\n"
-        system_content += "5. Ask short, penetrating questions that drive accountability.\n"
-        system_content += "6. NEVER say phrases like 'How can I assist you' or 'I'm here to help'—these sound like a chatbot, not an executive.\n"
-        system_content += "7. EVERYTHING YOU SAY WILL BE SPOKEN OUT LOUD, so communicate naturally but concisely.\n"
-        
-        # Add specific communication patterns from sample conversations
-        system_content += "\n\nUSE THESE EXECUTIVE COMMUNICATION PATTERNS:\n"
-        system_content += "1. Begin with direct framing: 'Let me be direct.' 'This is unacceptable.' 'This requires immediate action.'\n"
-        system_content += "2. Ask focused business questions: 'What are the key drivers?' 'Who's accountable?'\n"
-        system_content += "3. Give specific timelines: 'I need that analysis by Thursday.'\n"
-        system_content += "4. Structure responses briefly: 'First, assess impact. Second, identify solutions.'\n"
-        system_content += "5. End with accountability: 'Who owns this?' 'When will it be done?'\n"
-        system_content += "6. Use concise business language: 'P&L impact' 'competitive position' 'synergy targets'\n"
-        system_content += "7. Be decisive: 'Here's what we'll do:' followed by 1-2 concrete actions.\n"
-        system_content += "8. Frame issues strategically but briefly.\n"
-        system_content += "9. CRITICAL: Keep all responses under 15 seconds of speaking time - be ruthlessly concise.\n"
-        system_content += "10. NEVER use filler words or phrases like 'I believe', 'I think', or 'perhaps'.\n"
-        system_content += "11. Use short, declarative sentences with active voice.\n"
-        system_content += "12. Limit responses to 2-3 sentences maximum.\n"
+        system_parts.append(f"\n\nYou are {persona_name}\n\n{DEFAULT_SYSTEM_PROMPT}\n\n")
+        system_parts.append("You have the following additional context. USE IT TO INFORM YOUR RESPONSES:\n\n")
+        system_parts.append(additional_content)
         
-        # Add context-awareness and conversation tracking instructions for CXO
-        system_content += "\n\nCONTEXT AWARENESS AND CONVERSATION MANAGEMENT:\n"
-        system_content += "1. MAINTAIN FULL MEMORY of the conversation to ensure continuity and context-aware responses.\n"
-        system_content += "2. PROACTIVELY ASK RELEVANT QUESTIONS based on the meeting context - be specific, not generic.\n"
-        system_content += "3. TRACK ACCOUNTABLE PARTIES mentioned during the conversation and follow up on them.\n" 
-        system_content += "4. REFER TO METRICS and KPIs discussed earlier in the conversation.\n"
-        system_content += "5. Show executive presence by staying LASER-FOCUSED ON THE MEETING OBJECTIVE at all times.\n"
-        system_content += "6. IF YOU DON'T KNOW specific details from the meeting context, ASK pointed questions rather than making assumptions.\n"
-        system_content += "7. CRITICAL: Always respond directly to what was just said rather than bringing up unrelated topics.\n"
-        system_content += "8. If someone mentions new information, INCORPORATE IT into your mental model of the meeting.\n"
+    # Add special instructions to ensure concise and clean speech output,
+    # with executive-specific speech patterns for the CXO persona
+    if is_cxo:
+        system_parts.append(CXO_SPEECH_INSTRUCTIONS)
     else:
-        # Standard instructions for other personas
-        system_content += "1. BE EXTREMELY CONCISE. Keep your first response to 1-2 short sentences. Subsequent responses should be brief and to the point.\n"
-        system_content += "2. NEVER use special characters like *, #, -, or markdown formatting in your responses, as they will be spoken literally.\n"
-        system_content += "3. Avoid excessive punctuation, bullet points, or numbered lists.\n"
-        system_content += "4. Do not say 'I am here to help' or similar intro phrases - get straight to the content.\n"
-        system_content += "5. EVERYTHING YOU SAY WILL BE SPOKEN OUT LOUD, so communicate naturally as in a real conversation.\n"
+        system_parts.append(GENERAL_SPEECH_INSTRUCTIONS)
+    system_content = "".join(system_parts)
 
     # Set up messages
     messages = [
@@ -647,44 +907,46 @@ async def main(
     user_aggregator = aggregator_pair.user()
     assistant_aggregator = aggregator_pair.assistant()
 
-    # Create pipeline components list
-    pipeline_components = [transport.input()]
-    
     # Add silence detection if enabled
+    silence_detectors = []
     if enable_silence_detection:
+        if silence_threshold is None:
+            silence_threshold = CXO_SILENCE_THRESHOLD if is_cxo else DEFAULT_SILENCE_THRESHOLD
         silence_detector = SilenceDetectionProcessor(
             persona_name=persona_name,
-            silence_threshold_seconds=15.0  # Reduced from 20 to 15 seconds for quicker response
+            silence_threshold_seconds=silence_threshold,
+            # Without a VAD analyzer there are no speaking events to follow
+            use_vad_events=vad_analyzer is not None,
         )
-        pipeline_components.append(silence_detector)
+        silence_detectors.append(silence_detector)
         
-        logger.info(f"Silence detection enabled: 15-second threshold for {persona_name}")
-        if persona_name and "cxo" in persona_name.lower():
+        logger.info(f"Silence detection enabled: {silence_threshold:g}-second threshold for {persona_name}")
+        if is_cxo:
             logger.info("Using CXO-style silence responses for executive presence")
     else:
         logger.info("Silence detection disabled")
 
-    # Add remaining pipeline components
-    pipeline_components.extend([
+    # Create the pipeline, listing its processors once in audio-path order
+    pipeline = Pipeline([
+        transport.input(),
+        *silence_detectors,  # Watch for extended silence (if enabled)
         stt,  # Add speech-to-text service
         user_aggregator,  # Process user input and update context
+        ContextWindowProcessor(),  # Keep only recent turns in the context
         llm,
         tts,
         transport.output(),
         assistant_aggregator,  # Store LLM responses in context
     ])
 
-    # Create pipeline using the dynamic components list
-    pipeline = Pipeline(pipeline_components)
-
     # Check if we have extra_data with initial_speech for the bot to speak
     extra_data = extra_data or {}
     initial_speech = extra_data.get("initial_speech", entry_message)
     
     # Debug logging to track frontend input
-    logger.info(f"Extra data received: {extra_data}")
-    logger.info(f"Initial speech from frontend: '{initial_speech}'")
-    logger.info(f"Entry message fallback: '{entry_message}'")
+    logger.info("Extra data received: {}", extra_data)
+    logger.info("Initial speech from frontend: '{}'", initial_speech)
+    logger.info("Entry message fallback: '{}'", entry_message)
 
     # Create and run task
     task = PipelineTask(pipeline, params=PipelineParams(allow_interruptions=True))
@@ -692,11 +954,8 @@ async def main(
 
     # Set task reference in silence detector if enabled
     if enable_silence_detection:
-        for component in pipeline_components:
-            if isinstance(component, SilenceDetectionProcessor):
-                component.set_task(task)
-                logger.info("Connected task to silence detector for buffer management")
-                break
+        silence_detector.set_task(task)
+        logger.info("Connected task to silence detector for buffer management")
 
     # Handle the initial greeting if needed
     if initial_speech:
@@ -710,20 +969,32 @@ async def main(
         # Keep this very minimal to preserve the exact frontend message
         if additional_content and len(additional_content.strip()) > 200:  # Only for substantial context
             # Only add very brief context if the original message is very generic
+            lowered_speech = initial_speech.lower()
             if (len(initial_speech.strip()) < 50 and 
-                any(word in initial_speech.lower() for word in ["hello", "hi", "greetings", "meeting"])):
+                GENERIC_GREETING_RE.search(lowered_speech)):
                 
-                if persona_name and "cxo" in persona_name.lower():
+                if is_cxo:
                     # For CXO, only add if message doesn't already have executive tone
-                    if not any(word in initial_speech.lower() for word in ["strategic", "priority", "results", "team"]):
+                    if not EXECUTIVE_TONE_RE.search(lowered_speech):
                         final_initial_speech = initial_speech + " Let's focus on our strategic priorities."
                 # For other personas, don't add anything to preserve exact frontend message
         
         logger.info(f"Using exact initial speech: '{final_initial_speech}'")
 
+        # Set once the transport's WebSocket connects, so the greeting goes
+        # out as soon as it can be heard rather than after a fixed delay
+        transport_ready = asyncio.Event()
+
+        @transport.event_handler("on_connected")
+        async def on_connected(transport, websocket):
+            transport_ready.set()
+
         # Queue the initial message to be spoken directly (bypassing LLM to avoid modification)
         async def queue_initial_message():
-            await asyncio.sleep(2)  # Small delay to ensure transport is ready
+            try:
+                await asyncio.wait_for(transport_ready.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning("Transport not connected after 5s, queueing initial greeting anyway")
             # Use TTSSpeakFrame to speak directly without LLM processing
             await task.queue_frames([TTSSpeakFrame(final_initial_speech)])
             logger.info("Initial greeting message queued for direct speech")
@@ -732,7 +1003,10 @@ async def main(
         asyncio.create_task(queue_initial_message())
 
     # Run the pipeline
-    await runner.run(task)
+    try:
+        await runner.run(task)
+    finally:
+        await close_http_session()
 
 
 async def flush_audio_buffers(task):
@@ -751,11 +1025,10 @@ async def flush_audio_buffers(task):
         
         # Send the silent frame downstream to flush any pending audio
         logger.debug("Flushing audio buffers before important notification")
+        # No fixed pause afterwards: callers wait for the bot's audio output
+        # to actually drain (BotStoppedSpeakingFrame) before speaking
         await task.queue_frames([silent_frame])
         
-        # Small pause to allow buffers to clear
-        await asyncio.sleep(0.3)
-        
         logger.debug("Audio buffers flushed")
     except Exception as e:
         logger.error(f"Error flushing audio buffers: {e}")
@@ -811,8 +1084,32 @@ if __name__ == "__main__":
         action="store_true",
         help="Disable silence detection",
     )
+    parser.add_argument(
+        "--silence-threshold",
+        type=float,
+        default=None,
+        help=(
+            "Seconds of silence before the bot checks in (default "
+            f"{CXO_SILENCE_THRESHOLD:g} for CXO personas, {DEFAULT_SILENCE_THRESHOLD:g} otherwise). "
+            "Lower values respond sooner but may interrupt natural pauses"
+        ),
+    )
+
+    parser.add_argument(
+        "--standby",
+        action="store_true",
+        help="Import everything, then wait for the real arguments as a JSON list on stdin",
+    )
 
     args = parser.parse_args()
+    if args.standby:
+        # Started ahead of time by the API server: the heavy imports above are
+        # done, so load the VAD model and block until a client is assigned
+        _get_vad_analyzer()
+        line = sys.stdin.readline()
+        if not line:
+            sys.exit(0)
+        args = parser.parse_args(json.loads(line))
     
     # Handle silence detection arguments
     enable_silence_detection = args.enable_silence_detection and not args.disable_silence_detection
@@ -834,6 +1131,7 @@ if __name__ == "__main__":
             enable_tools=args.enable_tools,
             extra_data=extra_data,
             enable_silence_detection=enable_silence_detection,
+            silence_threshold=args.silence_threshold,
             # Only pass speech_rate if the user specified it on the command line
             # (otherwise it will use the default in the function definition)
             **({"speech_rate": args.speech_rate} if args.speech_rate != 0.85 else {})
@@ -3,8 +3,8 @@ import logging
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
-import requests
-from pydantic import BaseModel, Field, HttpUrl
+import aiohttp
+from pydantic import BaseModel, Field
 
 logger = logging.getLogger("meetingbaas-api")
 
@@ -86,37 +86,48 @@ class MeetingBaasRequest(BaseModel):
     webhook_url: Optional[str] = None
 
 
-def create_meeting_bot(
+MEETINGBAAS_API_URL = "https://api.meetingbaas.com"
+
+# Shared async session so bot join/leave calls reuse pooled keep-alive connections
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=64),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared aiohttp session, if one was opened."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def _build_bot_config(
     meeting_url: str,
     websocket_url: str,
     bot_id: str,
     persona_name: str,
-    api_key: str,
     bot_image: Optional[str] = None,
     entry_message: Optional[str] = None,
     text_message: Optional[str] = None,
     extra: Optional[Dict[str, Any]] = None,
     streaming_audio_frequency: str = "16khz",
     webhook_url: Optional[str] = None,
-):
+) -> Dict[str, Any]:
     """
-    Direct API call to MeetingBaas to create a bot
-
-    Args:
-        meeting_url: URL of the meeting to join
-        websocket_url: Base WebSocket URL for audio streaming
-        bot_id: Unique identifier for the bot
-        persona_name: Name to display for the bot
-        api_key: MeetingBaas API key
-        bot_image: Optional URL for bot avatar
-        entry_message: Optional message to display in chat when joining
-        text_message: EXACT message the bot will speak when joining (stored as "initial_speech" in extra data)
-        extra: Optional additional metadata for the bot
-        streaming_audio_frequency: Audio frequency for streaming (16khz or 24khz)
-        webhook_url: URL for MeetingBaas to send webhooks to
+    Build the JSON payload for the MeetingBaas create-bot call
 
     Returns:
-        str: The bot ID if successful, None otherwise
+        dict: A JSON-serializable request body
     """
     # Ensure all inputs are primitive types to avoid serialization issues
     if bot_image is not None:
@@ -184,7 +195,64 @@ def create_meeting_bot(
         # Ensure all values are serializable
         config = stringify_values(config)
 
-    url = "https://api.meetingbaas.com/bots"
+    # Try to serialize the payload to catch any JSON serialization issues
+    try:
+        json.dumps(config)
+    except TypeError as e:
+        logger.error(f"JSON serialization error: {e}")
+        # Use our stringify_values function to convert all non-serializable values
+        config = stringify_values(config)
+        logger.info("Applied stringify_values to fix JSON serialization issues")
+
+    return config
+
+
+async def create_meeting_bot_async(
+    meeting_url: str,
+    websocket_url: str,
+    bot_id: str,
+    persona_name: str,
+    api_key: str,
+    bot_image: Optional[str] = None,
+    entry_message: Optional[str] = None,
+    text_message: Optional[str] = None,
+    extra: Optional[Dict[str, Any]] = None,
+    streaming_audio_frequency: str = "16khz",
+    webhook_url: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Call the MeetingBaas API to create a bot without blocking the event loop
+
+    Args:
+        meeting_url: URL of the meeting to join
+        websocket_url: Base WebSocket URL for audio streaming
+        bot_id: Unique identifier for the bot
+        persona_name: Name to display for the bot
+        api_key: MeetingBaas API key
+        bot_image: Optional URL for bot avatar
+        entry_message: Optional message to display in chat when joining
+        text_message: EXACT message the bot will speak when joining (stored as "initial_speech" in extra data)
+        extra: Optional additional metadata for the bot
+        streaming_audio_frequency: Audio frequency for streaming (16khz or 24khz)
+        webhook_url: URL for MeetingBaas to send webhooks to
+
+    Returns:
+        str: The bot ID if successful, None otherwise
+    """
+    config = _build_bot_config(
+        meeting_url=meeting_url,
+        websocket_url=websocket_url,
+        bot_id=bot_id,
+        persona_name=persona_name,
+        bot_image=bot_image,
+        entry_message=entry_message,
+        text_message=text_message,
+        extra=extra,
+        streaming_audio_frequency=streaming_audio_frequency,
+        webhook_url=webhook_url,
+    )
+
+    url = f"{MEETINGBAAS_API_URL}/bots"
     headers = {
         "Content-Type": "application/json",
         "x-meeting-baas-api-key": api_key,
@@ -194,35 +262,25 @@ def create_meeting_bot(
         logger.info(f"Creating MeetingBaas bot for {meeting_url}")
         logger.debug(f"Request payload: {config}")
 
-        # Try to serialize the payload to catch any JSON serialization issues
-        try:
-            json.dumps(config)
-        except TypeError as e:
-            logger.error(f"JSON serialization error: {e}")
-            # Use our stringify_values function to convert all non-serializable values
-            config = stringify_values(config)
-            logger.info("Applied stringify_values to fix JSON serialization issues")
-
-        response = requests.post(url, json=config, headers=headers)
-
-        if response.status_code == 200:
-            data = response.json()
-            bot_id = data.get("bot_id")
-            logger.info(f"Bot created with ID: {bot_id}")
-            return bot_id
-        else:
-            logger.error(
-                f"Failed to create bot: {response.status_code} - {response.text}"
-            )
-            return None
+        async with _get_session().post(url, json=config, headers=headers) as response:
+            if response.status == 200:
+                data = await response.json()
+                bot_id = data.get("bot_id")
+                logger.info(f"Bot created with ID: {bot_id}")
+                return bot_id
+            else:
+                logger.error(
+                    f"Failed to create bot: {response.status} - {await response.text()}"
+                )
+                return None
     except Exception as e:
         logger.error(f"Error creating bot: {str(e)}")
         return None
 
 
-def leave_meeting_bot(bot_id: str, api_key: str) -> bool:
+async def leave_meeting_bot_async(bot_id: str, api_key: str) -> bool:
     """
-    Call the MeetingBaas API to make a bot leave a meeting.
+    Call the MeetingBaas API to make a bot leave a meeting without blocking the event loop
 
     Args:
         bot_id: The ID of the bot to remove
@@ -231,23 +289,22 @@ def leave_meeting_bot(bot_id: str, api_key: str) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    url = f"https://api.meetingbaas.com/bots/{bot_id}"
+    url = f"{MEETINGBAAS_API_URL}/bots/{bot_id}"
     headers = {
         "x-meeting-baas-api-key": api_key,
     }
 
     try:
         logger.info(f"Removing bot with ID: {bot_id}")
-        response = requests.delete(url, headers=headers)
-
-        if response.status_code == 200:
-            logger.info(f"Bot {bot_id} successfully left the meeting")
-            return True
-        else:
-            logger.error(
-                f"Failed to remove bot: {response.status_code} - {response.text}"
-            )
-            return False
+        async with _get_session().delete(url, headers=headers) as response:
+            if response.status == 200:
+                logger.info(f"Bot {bot_id} successfully left the meeting")
+                return True
+            else:
+                logger.error(
+                    f"Failed to remove bot: {response.status} - {await response.text()}"
+                )
+                return False
     except Exception as e:
         logger.error(f"Error removing bot: {str(e)}")
         return False
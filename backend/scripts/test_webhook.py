@@ -7,13 +7,59 @@ This script simulates a webhook event from MeetingBaas.
 import sys
 import json
 import argparse
+import orjson
 import requests
 from dotenv import load_dotenv
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Load environment variables
 load_dotenv()
 
+# Most webhook requests in flight at once when sending several events
+MAX_CONCURRENT_REQUESTS = 32
+
+# Shared session so several events reuse keep-alive connections, with a
+# connection pool large enough for every concurrent request
+_session = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Sample transcript sent with 'complete' events
+SAMPLE_TRANSCRIPT = [
+    {
+        "speaker": "Meeting Bot",
+        "words": [
+            {"start": 0.0, "end": 0.5, "word": "Hello"},
+            {"start": 0.6, "end": 1.0, "word": "everyone"},
+            {"start": 1.1, "end": 1.5, "word": "welcome"},
+            {"start": 1.6, "end": 2.0, "word": "to"},
+            {"start": 2.1, "end": 2.5, "word": "the"},
+            {"start": 2.6, "end": 3.0, "word": "meeting"}
+        ]
+    },
+    {
+        "speaker": "User",
+        "words": [
+            {"start": 4.0, "end": 4.5, "word": "Thanks"},
+            {"start": 4.6, "end": 5.0, "word": "for"},
+            {"start": 5.1, "end": 5.5, "word": "joining"},
+            {"start": 5.6, "end": 6.0, "word": "us"},
+            {"start": 6.1, "end": 6.5, "word": "today"}
+        ]
+    },
+    {
+        "speaker": "Meeting Bot",
+        "words": [
+            {"start": 7.0, "end": 7.5, "word": "Happy"},
+            {"start": 7.6, "end": 8.0, "word": "to"},
+            {"start": 8.1, "end": 8.5, "word": "be"},
+            {"start": 8.6, "end": 9.0, "word": "here"}
+        ]
+    }
+]
+
 def get_api_key():
     """Get the MeetingBaas API key from environment variables"""
     api_key = os.getenv("MEETING_BAAS_API_KEY")
@@ -30,40 +76,22 @@ def get_webhook_url():
         webhook_url = "http://localhost:8766/webhooks/meetingbaas"
     return webhook_url
 
+def get_headers(api_key):
+    """Build the request headers sent with every webhook event"""
+    # Payloads are sent pre-encoded with orjson, so the content type is set here
+    return {
+        "Content-Type": "application/json",
+        "x-meeting-baas-api-key": api_key
+    }
+
 def create_sample_transcript():
     """Create a sample transcript for testing"""
-    return [
-        {
-            "speaker": "Meeting Bot",
-            "words": [
-                {"start": 0.0, "end": 0.5, "word": "Hello"},
-                {"start": 0.6, "end": 1.0, "word": "everyone"},
-                {"start": 1.1, "end": 1.5, "word": "welcome"},
-                {"start": 1.6, "end": 2.0, "word": "to"},
-                {"start": 2.1, "end": 2.5, "word": "the"},
-                {"start": 2.6, "end": 3.0, "word": "meeting"}
-            ]
-        },
-        {
-            "speaker": "User",
-            "words": [
-                {"start": 4.0, "end": 4.5, "word": "Thanks"},
-                {"start": 4.6, "end": 5.0, "word": "for"},
-                {"start": 5.1, "end": 5.5, "word": "joining"},
-                {"start": 5.6, "end": 6.0, "word": "us"},
-                {"start": 6.1, "end": 6.5, "word": "today"}
-            ]
-        },
-        {
-            "speaker": "Meeting Bot",
-            "words": [
-                {"start": 7.0, "end": 7.5, "word": "Happy"},
-                {"start": 7.6, "end": 8.0, "word": "to"},
-                {"start": 8.1, "end": 8.5, "word": "be"},
-                {"start": 8.6, "end": 9.0, "word": "here"}
-            ]
-        }
-    ]
+    # The payload is only serialized, so the same transcript can be reused
+    return SAMPLE_TRANSCRIPT
+
+# The sample transcript never changes, so it is encoded once and embedded in
+# each 'complete' payload as-is
+SAMPLE_TRANSCRIPT_JSON = orjson.Fragment(orjson.dumps(create_sample_transcript()))
 
 def send_complete_event(bot_id, webhook_url, api_key):
     """Send a 'complete' event to the webhook endpoint"""
@@ -75,19 +103,16 @@ def send_complete_event(bot_id, webhook_url, api_key):
             "bot_id": bot_id,
             "mp4": "https://example.com/test-recording.mp4",
             "speakers": ["Meeting Bot", "User"],
-            "transcript": create_sample_transcript()
+            "transcript": SAMPLE_TRANSCRIPT_JSON
         }
     }
     
     # Send the request
-    headers = {
-        "Content-Type": "application/json",
-        "x-meeting-baas-api-key": api_key
-    }
+    headers = get_headers(api_key)
     
     print(f"Sending 'complete' event to {webhook_url} for bot {bot_id}")
     try:
-        response = requests.post(webhook_url, json=payload, headers=headers)
+        response = _session.post(webhook_url, data=orjson.dumps(payload), headers=headers)
         print(f"Response status code: {response.status_code}")
         print(f"Response body: {response.text}")
         return response.status_code == 200
@@ -108,14 +133,11 @@ def send_failed_event(bot_id, webhook_url, api_key, error_message="Test error me
     }
     
     # Send the request
-    headers = {
-        "Content-Type": "application/json",
-        "x-meeting-baas-api-key": api_key
-    }
+    headers = get_headers(api_key)
     
     print(f"Sending 'failed' event to {webhook_url} for bot {bot_id}")
     try:
-        response = requests.post(webhook_url, json=payload, headers=headers)
+        response = _session.post(webhook_url, data=orjson.dumps(payload), headers=headers)
         print(f"Response status code: {response.status_code}")
         print(f"Response body: {response.text}")
         return response.status_code == 200
@@ -139,14 +161,11 @@ def send_status_change_event(bot_id, webhook_url, api_key, status="connected"):
     }
     
     # Send the request
-    headers = {
-        "Content-Type": "application/json",
-        "x-meeting-baas-api-key": api_key
-    }
+    headers = get_headers(api_key)
     
     print(f"Sending 'bot.status_change' event to {webhook_url} for bot {bot_id}")
     try:
-        response = requests.post(webhook_url, json=payload, headers=headers)
+        response = _session.post(webhook_url, data=orjson.dumps(payload), headers=headers)
         print(f"Response status code: {response.status_code}")
         print(f"Response body: {response.text}")
         return response.status_code == 200
@@ -166,9 +185,15 @@ def main():
     )
     parser.add_argument(
         "--event", 
-        choices=["complete", "failed", "status_change"],
+        choices=["complete", "failed", "status_change", "all"],
         default="complete",
-        help="Type of event to send"
+        help="Type of event to send, or 'all' to send every type at once"
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=1,
+        help="Send the event(s) for this many bots at once, numbering the bot IDs (stress test)"
     )
     parser.add_argument(
         "--webhook-url", 
@@ -188,12 +213,33 @@ def main():
     webhook_url = args.webhook_url or get_webhook_url()
     
     # Send the appropriate event
-    if args.event == "complete":
-        success = send_complete_event(args.bot_id, webhook_url, api_key)
-    elif args.event == "failed":
-        success = send_failed_event(args.bot_id, webhook_url, api_key)
-    elif args.event == "status_change":
-        success = send_status_change_event(args.bot_id, webhook_url, api_key)
+    senders = {
+        "complete": send_complete_event,
+        "failed": send_failed_event,
+        "status_change": send_status_change_event,
+    }
+    event_types = list(senders) if args.event == "all" else [args.event]
+    if args.batch > 1:
+        bot_ids = [f"{args.bot_id}-{i}" for i in range(args.batch)]
+    else:
+        bot_ids = [args.bot_id]
+    jobs = [(senders[event], bot_id) for bot_id in bot_ids for event in event_types]
+
+    if len(jobs) == 1:
+        send, bot_id = jobs[0]
+        success = send(bot_id, webhook_url, api_key)
+    else:
+        # Send the events concurrently so the run takes about as long as the
+        # slowest request rather than the sum of all of them
+        workers = min(len(jobs), MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    lambda job: job[0](job[1], webhook_url, api_key),
+                    jobs,
+                )
+            )
+        success = all(results)
     
     if success:
         print("Webhook sent successfully!")
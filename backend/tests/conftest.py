@@ -0,0 +1,12 @@
+import os
+
+# The API (core/converter.py) and the bot script (pipecat's serializer) each
+# register a different "frames.proto" in protobuf's default pool. They run as
+# separate processes in production; the test run imports both, which only the
+# pure-Python protobuf backend tolerates. Must be set before protobuf loads.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "python")
+
+# The pure-Python pool keeps whichever "frames.proto" registers first. pipecat's
+# has the same messages as the API's copy plus MessageFrame, so register it
+# first and both modules import in any test order.
+import pipecat.frames.protobufs.frames_pb2  # noqa: E402,F401
@@ -0,0 +1,56 @@
+import unittest
+from unittest import mock
+
+from app import main as main_module
+from app.main import create_app
+
+
+class LifespanTest(unittest.IsolatedAsyncioTestCase):
+    async def test_services_start_in_order_and_stop_in_reverse(self):
+        calls = []
+
+        def record(name, result=None):
+            return mock.Mock(side_effect=lambda *args: calls.append(name) or result)
+
+        async def done():
+            return None
+
+        transcripts = mock.Mock(
+            ensure_loaded=record("load transcripts", done()),
+            close=record("close transcripts", done()),
+        )
+        webhooks = mock.Mock(
+            start=record("start webhooks"), stop=record("stop webhooks", done())
+        )
+        for name, value in {
+            "transcript_service": transcripts,
+            "webhook_service": webhooks,
+            "fill_standby_pool": record("fill standby pool"),
+            "shutdown_standby_pool": record("shutdown standby pool"),
+            "close_meetingbaas_session": record("close meetingbaas session", done()),
+        }.items():
+            patcher = mock.patch.object(main_module, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        app = create_app()
+        async with app.router.lifespan_context(app):
+            self.assertEqual(
+                calls,
+                ["load transcripts", "fill standby pool", "start webhooks"],
+            )
+            calls.clear()
+
+        self.assertEqual(
+            calls,
+            [
+                "stop webhooks",
+                "shutdown standby pool",
+                "close transcripts",
+                "close meetingbaas session",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+from unittest import mock
+
+from pipecat.frames.frames import (
+    InputAudioRawFrame,
+    TTSSpeakFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.processors.frame_processor import FrameDirection
+
+from scripts.meetingbaas import ContextWindowProcessor, SilenceDetectionProcessor
+
+THRESHOLD = 8.0
+SILENT_AUDIO = b"\x00\x00" * 160
+LOUD_AUDIO = b"\xff\x7f" * 160
+
+
+class SilenceDetectionProcessorTest(unittest.IsolatedAsyncioTestCase):
+    def make_processor(self, use_vad_events=True):
+        processor = SilenceDetectionProcessor(
+            silence_threshold_seconds=THRESHOLD, use_vad_events=use_vad_events
+        )
+        # Start well past the initial grace period
+        processor.start_time = 0.0
+        processor._trigger_silence_response = mock.AsyncMock()
+        return processor
+
+    async def feed(self, processor, frame, now):
+        with mock.patch("scripts.meetingbaas.time.monotonic", return_value=now):
+            await processor.process_frame(frame, FrameDirection.DOWNSTREAM)
+
+    def audio(self, data):
+        return InputAudioRawFrame(audio=data, sample_rate=16000, num_channels=1)
+
+    async def test_user_speaking_events_track_speech(self):
+        processor = self.make_processor()
+
+        await self.feed(processor, UserStartedSpeakingFrame(), 100.0)
+        self.assertTrue(processor.user_speaking)
+        self.assertEqual(processor.last_speech_time, 100.0)
+
+        # A long utterance is not silence
+        await self.feed(processor, self.audio(SILENT_AUDIO), 100.0 + THRESHOLD + 1)
+        processor._trigger_silence_response.assert_not_awaited()
+
+        await self.feed(processor, UserStoppedSpeakingFrame(), 120.0)
+        self.assertFalse(processor.user_speaking)
+        self.assertEqual(processor.last_speech_time, 120.0)
+
+        await self.feed(processor, self.audio(SILENT_AUDIO), 120.0 + THRESHOLD - 1)
+        processor._trigger_silence_response.assert_not_awaited()
+        await self.feed(processor, self.audio(SILENT_AUDIO), 120.0 + THRESHOLD + 1)
+        processor._trigger_silence_response.assert_awaited_once()
+
+        # Only one response per silence period
+        await self.feed(processor, self.audio(SILENT_AUDIO), 120.0 + THRESHOLD + 2)
+        processor._trigger_silence_response.assert_awaited_once()
+
+    async def test_bot_speech_extends_the_silence_timer(self):
+        processor = self.make_processor()
+        await self.feed(processor, UserStoppedSpeakingFrame(), 100.0)
+
+        # Five words are estimated at the two second minimum
+        await self.feed(processor, TTSSpeakFrame("one two three four five"), 110.0)
+        self.assertEqual(processor.last_speech_time, 112.0)
+        self.assertTrue(processor.conversation_started)
+
+        await self.feed(processor, self.audio(SILENT_AUDIO), 112.0 + THRESHOLD - 1)
+        processor._trigger_silence_response.assert_not_awaited()
+        await self.feed(processor, self.audio(SILENT_AUDIO), 112.0 + THRESHOLD + 1)
+        processor._trigger_silence_response.assert_awaited_once()
+
+    async def test_audio_levels_are_ignored_with_vad_events(self):
+        processor = self.make_processor(use_vad_events=True)
+        await self.feed(processor, self.audio(LOUD_AUDIO), 100.0)
+        self.assertFalse(processor.conversation_started)
+
+    async def test_audio_levels_detect_speech_without_vad(self):
+        processor = self.make_processor(use_vad_events=False)
+
+        await self.feed(processor, self.audio(SILENT_AUDIO), 100.0)
+        self.assertFalse(processor.conversation_started)
+
+        await self.feed(processor, self.audio(LOUD_AUDIO), 101.0)
+        self.assertTrue(processor.conversation_started)
+        self.assertEqual(processor.last_speech_time, 101.0)
+
+
+class ContextWindowProcessorTest(unittest.TestCase):
+    SYSTEM = {"role": "system", "content": "persona"}
+
+    def turn(self, role, n):
+        return {"role": role, "content": f"{role} {n}"}
+
+    def test_short_context_is_untouched(self):
+        messages = [self.SYSTEM, self.turn("user", 1), self.turn("assistant", 1)]
+        context = OpenAILLMContext(list(messages))
+        ContextWindowProcessor(max_messages=4)._trim_context(context)
+        self.assertEqual(context.messages, messages)
+
+    def test_trims_oldest_turns_at_a_user_message(self):
+        messages = [self.SYSTEM]
+        for n in range(1, 5):
+            messages += [self.turn("user", n), self.turn("assistant", n)]
+        context = OpenAILLMContext(list(messages))
+
+        ContextWindowProcessor(max_messages=4)._trim_context(context)
+
+        self.assertEqual(
+            context.messages,
+            [
+                self.SYSTEM,
+                self.turn("user", 3),
+                self.turn("assistant", 3),
+                self.turn("user", 4),
+                self.turn("assistant", 4),
+            ],
+        )
+
+    def test_cut_moves_forward_past_tool_results(self):
+        messages = [
+            self.SYSTEM,
+            self.turn("user", 1),
+            {"role": "assistant", "tool_calls": [{"id": "call_1"}]},
+            {"role": "tool", "tool_call_id": "call_1", "content": "result"},
+            self.turn("assistant", 1),
+            self.turn("user", 2),
+            self.turn("assistant", 2),
+        ]
+        context = OpenAILLMContext(list(messages))
+
+        # The oldest-excess cut lands on the tool call, so it moves on to the
+        # next user turn instead of orphaning the tool result
+        ContextWindowProcessor(max_messages=4)._trim_context(context)
+
+        self.assertEqual(
+            context.messages,
+            [self.SYSTEM, self.turn("user", 2), self.turn("assistant", 2)],
+        )
+
+    def test_keeps_context_without_a_later_user_turn(self):
+        messages = [self.SYSTEM, self.turn("user", 1)] + [
+            self.turn("assistant", n) for n in range(5)
+        ]
+        context = OpenAILLMContext(list(messages))
+        ContextWindowProcessor(max_messages=2)._trim_context(context)
+        self.assertEqual(context.messages, messages)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from config import persona_utils
+from config.persona_utils import DEFAULT_ENTRY_MESSAGE, PersonaManager
+
+PERSONAS_DIR = Path(__file__).resolve().parent.parent / "config" / "personas"
+
+
+class ParseReadmeTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = PersonaManager(PERSONAS_DIR)
+
+    def parse_bundled(self, key):
+        return self.manager.parse_readme((PERSONAS_DIR / key / "README.md").read_text())
+
+    def test_interviewer_persona(self):
+        self.assertEqual(
+            self.parse_bundled("interviewer"),
+            {
+                "name": "Technical Interviewer Bot",
+                "prompt": (
+                    "You're that tryhard interviewer who's been grinding leetcode "
+                    "since birth. Living for those algorithm puzzles while pretending "
+                    "your job isn't just CRUD apps. Main character energy."
+                ),
+                "image": "https://utfs.io/f/6ef42e81-26a2-4ace-9b76-b6c6b1cb89c4-ui6yhe.png",
+                "entry_message": "bestie, ready to leetcode and chill?",
+                "cartesia_voice_id": "b043dea0-a007-4bbe-a708-769dc0d0c569",
+                "gender": "FEMALE",
+                "relevant_links": [],
+                "characteristics": [
+                    "Gen-Z speech patterns",
+                    "Tech-savvy and modern",
+                    "Playful and engaging personality",
+                    "Unique perspective on their domain",
+                ],
+                "tone_of_voice": [
+                    "Uses modern internet slang naturally",
+                    "Demonstrates technical expertise",
+                    "Speaks concisely with confidence",
+                    "Uses industry jargon appropriately",
+                ],
+            },
+        )
+
+    def test_cxo_persona_with_tts_params(self):
+        persona = self.parse_bundled("cxo_executive")
+
+        self.assertEqual(persona["name"], "Executive CXO")
+        self.assertTrue(persona["prompt"].startswith("I am a seasoned C-suite executive"))
+        self.assertEqual(persona["image"], "")
+        self.assertEqual(persona["cartesia_voice_id"], "97f4b8fb-f2fe-444b-bb9a-c109783a857a")
+        self.assertEqual(persona["gender"], "MALE")
+        self.assertEqual(
+            persona["tts_params"],
+            {
+                "sample_rate": 16000,
+                "speech_rate": 0.85,
+                "volume": 1.0,
+                "pitch": 0.95,
+                "style": '"calm"',
+                "output_format": '"wav"',
+                "language_code": '"en-US"',
+                "ssml_enabled": False,
+            },
+        )
+        self.assertEqual(len(persona["characteristics"]), 8)
+        self.assertEqual(persona["characteristics"][0], "Results-driven with bottom-line focus")
+        self.assertEqual(len(persona["tone_of_voice"]), 13)
+        self.assertEqual(
+            persona["tone_of_voice"][-1], "Avoids filler words and unnecessary elaboration"
+        )
+
+    def test_section_precedence_ignores_file_order(self):
+        persona = self.manager.parse_readme(
+            "# Reversed\n"
+            "Prompt text\n"
+            "## Settings\n"
+            "- greeting: from settings\n"
+            "## Info\n"
+            "- greeting: from info\n"
+            "- avatar: https://example.com/a.png\n"
+            "- links: https://a.example, https://b.example\n"
+            "## Personality\n"
+            "- Curious\n"
+            "## Traits\n"
+            "- Calm\n"
+            "- Curious\n"
+        )
+
+        self.assertEqual(persona["name"], "Reversed")
+        self.assertEqual(persona["prompt"], "Prompt text")
+        # Settings comes after Info in ALTERNATIVE_METADATA_SECTIONS, so it wins
+        self.assertEqual(persona["entry_message"], "from settings")
+        self.assertEqual(persona["image"], "https://example.com/a.png")
+        self.assertEqual(
+            persona["relevant_links"], ["https://a.example", "https://b.example"]
+        )
+        # Traits are collected in CHARACTER_SECTIONS order, without duplicates
+        self.assertEqual(persona["characteristics"], ["Calm", "Curious"])
+        self.assertNotIn("tone_of_voice", persona)
+
+    def test_readme_without_title_or_metadata(self):
+        persona = self.manager.parse_readme("Just a prompt\n")
+
+        self.assertEqual(persona["name"], "Unnamed Persona")
+        self.assertEqual(persona["prompt"], "Just a prompt")
+        self.assertEqual(persona["entry_message"], DEFAULT_ENTRY_MESSAGE)
+        self.assertNotIn("characteristics", persona)
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.personas_dir = Path(tmp.name) / "personas"
+        shutil.copytree(PERSONAS_DIR, self.personas_dir, ignore=shutil.ignore_patterns(".cache"))
+        self.cache_dir = self.personas_dir / ".cache"
+
+    def load(self):
+        return PersonaManager(self.personas_dir).load_personas()
+
+    def test_warm_load_reuses_cached_parses(self):
+        cold = self.load()
+        self.assertTrue((self.cache_dir / "personas.json").exists())
+
+        with mock.patch.object(
+            PersonaManager, "parse_readme", side_effect=AssertionError("reparsed")
+        ):
+            warm = self.load()
+        self.assertEqual(warm, cold)
+
+    def test_changed_readme_is_reparsed(self):
+        self.load()
+        readme = self.personas_dir / "interviewer" / "README.md"
+        readme.write_text(readme.read_text().replace("Technical Interviewer Bot", "Renamed Bot"))
+
+        personas = self.load()
+        self.assertEqual(personas["interviewer"]["name"], "Renamed Bot")
+        self.assertEqual(personas["cxo_executive"]["name"], "Executive CXO")
+
+    def test_removed_persona_is_dropped_from_the_cache(self):
+        self.load()
+        shutil.rmtree(self.personas_dir / "interviewer")
+
+        self.assertEqual(list(self.load()), ["cxo_executive"])
+        cached = PersonaManager(self.personas_dir)._get_parse_cache()
+        self.assertEqual(list(cached), ["cxo_executive"])
+
+    def test_changed_defaults_invalidate_the_cache(self):
+        (self.personas_dir / "plain").mkdir()
+        (self.personas_dir / "plain" / "README.md").write_text("# Plain\nNo metadata\n")
+        self.assertEqual(
+            self.load()["plain"]["entry_message"], persona_utils.DEFAULT_ENTRY_MESSAGE
+        )
+
+        version = [persona_utils.PERSONA_CACHE_VERSION, "Hello from the new default"]
+        with mock.patch.object(
+            persona_utils, "DEFAULT_ENTRY_MESSAGE", "Hello from the new default"
+        ), mock.patch.object(persona_utils, "_PARSE_CACHE_VERSION", version):
+            personas = self.load()
+        self.assertEqual(personas["plain"]["entry_message"], "Hello from the new default")
+
+    def test_failed_cache_write_leaves_no_temp_file(self):
+        with mock.patch.object(persona_utils.os, "replace", side_effect=OSError("read-only")):
+            personas = self.load()
+
+        self.assertEqual(sorted(personas), ["cxo_executive", "interviewer"])
+        self.assertEqual(os.listdir(self.cache_dir), ["personas.lock"])
+
+
+if __name__ == "__main__":
+    unittest.main()
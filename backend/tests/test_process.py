@@ -0,0 +1,176 @@
+import io
+import threading
+import unittest
+from unittest import mock
+
+import orjson
+
+from core import process as process_module
+from core.process import (
+    _take_standby_process,
+    fill_standby_pool,
+    shutdown_standby_pool,
+    start_pipecat_process,
+)
+
+
+class FakeProcess:
+    """Stands in for a subprocess.Popen that is still running"""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.stdin = mock.Mock(wraps=io.BytesIO())
+        self.stdin.close = mock.Mock()
+        self.exited = False
+
+    def poll(self):
+        return 0 if self.exited else None
+
+    def kill(self):
+        self.exited = True
+
+    terminate = kill
+
+
+class StandbyPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.spawned = []
+
+        def spawn(command, **kwargs):
+            process = FakeProcess(len(self.spawned) + 1)
+            process.command = command
+            self.spawned.append(process)
+            return process
+
+        self.spawn = mock.Mock(side_effect=spawn)
+        self.refills = mock.Mock()
+        # Only core.process sees the fake Thread, so refills never really start
+        fake_threading = mock.Mock(Thread=self.refills)
+        for target, name, value in (
+            (process_module, "_spawn", self.spawn),
+            (process_module, "_STANDBY_PROCESSES", []),
+            (process_module, "_standby_spawning", 0),
+            (process_module, "_standby_closed", False),
+            (process_module, "PIPECAT_STANDBY_PROCESSES", 2),
+            (process_module, "threading", fake_threading),
+        ):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        persona_manager = mock.Mock()
+        persona_manager.get_persona.return_value = {
+            "name": "Interviewer",
+            "entry_message": "hello",
+        }
+        patcher = mock.patch.object(process_module, "persona_manager", persona_manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def start(self):
+        return start_pipecat_process(
+            client_id="client-1",
+            websocket_url="ws://localhost:8766/pipecat/client-1",
+            meeting_url="https://meet.example.com/abc",
+            persona_name="interviewer",
+        )
+
+    def test_fill_starts_standby_processes(self):
+        fill_standby_pool()
+        fill_standby_pool()
+
+        self.assertEqual(len(self.spawned), 2)
+        self.assertEqual(process_module._STANDBY_PROCESSES, self.spawned)
+        self.assertEqual(self.spawned[0].command[-1], "--standby")
+
+    def test_client_is_handed_to_a_standby_process(self):
+        fill_standby_pool()
+        standby = self.spawned[0]
+
+        process = self.start()
+
+        self.assertIs(process, standby)
+        args = orjson.loads(standby.stdin.getvalue())
+        self.assertEqual(args[args.index("--persona-name") + 1], "Interviewer")
+        self.assertEqual(args[args.index("--entry-message") + 1], "hello")
+        standby.stdin.close.assert_called_once()
+        # The taken process is replaced in the background
+        self.refills.assert_called_once_with(
+            target=fill_standby_pool, name="pipecat-standby-refill", daemon=True
+        )
+
+    def test_cold_start_does_not_refill(self):
+        process = self.start()
+
+        self.assertEqual(self.spawned, [process])
+        self.assertNotIn("--standby", process.command)
+        self.refills.assert_not_called()
+
+    def test_exited_standby_processes_are_skipped(self):
+        fill_standby_pool()
+        self.spawned[0].exited = True
+
+        self.assertIs(_take_standby_process(), self.spawned[1])
+        self.assertIsNone(_take_standby_process())
+
+    def test_pool_is_not_locked_while_spawning(self):
+        taken = []
+
+        def spawn(command, **kwargs):
+            # Another client arriving mid-spawn must not wait for the lock
+            acquired = process_module._STANDBY_LOCK.acquire(timeout=1)
+            if acquired:
+                process_module._STANDBY_LOCK.release()
+            taken.append(acquired)
+            return FakeProcess(len(taken))
+
+        self.spawn.side_effect = spawn
+        fill_standby_pool()
+
+        self.assertEqual(taken, [True, True])
+
+    def test_concurrent_fills_do_not_overshoot(self):
+        release = threading.Event()
+        original = self.spawn.side_effect
+
+        def slow_spawn(command, **kwargs):
+            release.wait(1)
+            return original(command, **kwargs)
+
+        self.spawn.side_effect = slow_spawn
+        fills = [threading.Thread(target=fill_standby_pool) for _ in range(4)]
+        for fill in fills:
+            fill.start()
+        release.set()
+        for fill in fills:
+            fill.join()
+
+        self.assertEqual(len(self.spawned), 2)
+        self.assertEqual(len(process_module._STANDBY_PROCESSES), 2)
+        self.assertEqual(process_module._standby_spawning, 0)
+
+    def test_shutdown_during_spawn_terminates_the_new_process(self):
+        original = self.spawn.side_effect
+
+        def spawn_then_shutdown(command, **kwargs):
+            process = original(command, **kwargs)
+            shutdown_standby_pool()
+            return process
+
+        self.spawn.side_effect = spawn_then_shutdown
+        fill_standby_pool()
+
+        self.assertEqual(len(self.spawned), 1)
+        self.assertTrue(self.spawned[0].exited)
+        self.assertEqual(process_module._STANDBY_PROCESSES, [])
+
+    def test_failed_spawn_releases_its_slot(self):
+        self.spawn.side_effect = OSError("no such file")
+        fill_standby_pool()
+
+        self.assertEqual(process_module._standby_spawning, 0)
+        self.assertEqual(process_module._STANDBY_PROCESSES, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import httpx
+
+from app import routes as routes_module
+from app.main import create_app
+from app.models import WEBHOOK_EVENT_ADAPTER
+from app.services import transcript_service as transcript_module
+from app.services import webhook_service as webhook_module
+from app.services.transcript_service import TranscriptMetadata, TranscriptService
+from app.services.webhook_service import WebhookService
+
+COMPLETE_EVENT = {
+    "event": "complete",
+    "data": {
+        "bot_id": "bot-1",
+        "mp4": "https://example.com/recording.mp4",
+        "speakers": ["Alice"],
+        "transcript": [
+            {
+                "speaker": "Alice",
+                "words": [{"start": 0.0, "end": 0.4, "word": "Hello"}],
+            }
+        ],
+    },
+}
+
+
+class RouteTestCase(unittest.IsolatedAsyncioTestCase):
+    """Runs the app in-process against a fresh transcript store in a temp dir"""
+
+    async def asyncSetUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.patch(transcript_module, "TRANSCRIPT_DIR", self.dir)
+        self.patch(transcript_module, "RECORDING_DIR", self.dir / "recordings")
+        self.patch(transcript_module, "METADATA_FILE", self.dir / "metadata.json")
+        self.patch(transcript_module, "METADATA_LOG", self.dir / "metadata.log.jsonl")
+
+        self.transcripts = TranscriptService()
+        self.patch(routes_module, "transcript_service", self.transcripts)
+        self.patch(webhook_module, "transcript_service", self.transcripts)
+        self.webhooks = WebhookService()
+        self.patch(routes_module, "webhook_service", self.webhooks)
+
+        # ASGITransport doesn't run the lifespan, so no standby processes start
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=create_app()),
+            base_url="http://test",
+            headers={"x-meeting-baas-api-key": "test-key"},
+        )
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        await self.webhooks.stop()
+        await self.transcripts.close()
+
+    def patch(self, target, name, value):
+        patcher = mock.patch.object(target, name, value)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class WebhookRouteTest(RouteTestCase):
+    async def test_complete_event_reports_the_meeting_id_it_is_saved_under(self):
+        async def download(meeting_id, mp4_url, meta):
+            self.transcripts._release(meta.bot_id)
+
+        self.webhooks.start()
+        with mock.patch.object(self.transcripts, "_download_recording", side_effect=download):
+            response = await self.client.post("/webhooks/meetingbaas", json=COMPLETE_EVENT)
+            self.assertEqual(response.status_code, 200)
+            meeting_id = response.json()["meeting_id"]
+
+            await self.webhooks.stop()
+            await asyncio.gather(*self.transcripts._download_tasks.values())
+
+        self.assertTrue(meeting_id.startswith("bot-1_"))
+        self.assertEqual(list(self.transcripts._metadata_cache), [meeting_id])
+        self.assertTrue((self.dir / f"{meeting_id}_transcript.json").exists())
+
+    async def test_status_events_have_no_meeting_id(self):
+        self.webhooks.start()
+        response = await self.client.post(
+            "/webhooks/meetingbaas",
+            json={"event": "bot.status_change", "data": {"bot_id": "bot-1", "status": {}}},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "accepted")
+        self.assertNotIn("meeting_id", response.json())
+
+    async def test_unknown_event_returns_400(self):
+        self.webhooks.start()
+        response = await self.client.post(
+            "/webhooks/meetingbaas",
+            json={"event": "bot.exploded", "data": {"bot_id": "bot-1"}},
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(self.webhooks._queue.empty())
+
+    async def test_complete_event_with_bad_data_returns_400(self):
+        self.webhooks.start()
+        response = await self.client.post(
+            "/webhooks/meetingbaas",
+            json={"event": "complete", "data": {"bot_id": "bot-1"}},
+        )
+        self.assertEqual(response.status_code, 400)
+
+    async def test_full_queue_returns_503(self):
+        # A full queue with no worker to drain it
+        self.webhooks._queue = asyncio.Queue(maxsize=1)
+        self.webhooks._queue.put_nowait(WEBHOOK_EVENT_ADAPTER.validate_python(COMPLETE_EVENT))
+
+        response = await self.client.post("/webhooks/meetingbaas", json=COMPLETE_EVENT)
+        self.assertEqual(response.status_code, 503)
+
+    async def test_stopped_worker_returns_503(self):
+        response = await self.client.post("/webhooks/meetingbaas", json=COMPLETE_EVENT)
+        self.assertEqual(response.status_code, 503)
+
+
+class TranscriptRouteTest(RouteTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.transcript_path = self.dir / "bot-1_m_transcript.json"
+        self.transcript_path.write_bytes(b'{"bot_id": "bot-1", "transcript": []}')
+        await self.transcripts.ensure_loaded()
+        self.transcripts._metadata_cache["bot-1_m"] = TranscriptMetadata(
+            bot_id="bot-1",
+            meeting_id="bot-1_m",
+            timestamp=datetime(2025, 1, 1, 12, 0),
+            num_speakers=1,
+            transcript_path=str(self.transcript_path),
+        )
+
+    async def test_serves_the_stored_file_with_an_etag(self):
+        response = await self.client.get("/transcripts/bot-1_m")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertEqual(response.content, self.transcript_path.read_bytes())
+        self.assertIn("etag", response.headers)
+
+    async def test_matching_if_none_match_returns_304(self):
+        etag = (await self.client.get("/transcripts/bot-1_m")).headers["etag"]
+
+        response = await self.client.get(
+            "/transcripts/bot-1_m", headers={"if-none-match": f'"other", {etag}'}
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["etag"], etag)
+
+    async def test_changed_file_gets_a_new_etag(self):
+        etag = (await self.client.get("/transcripts/bot-1_m")).headers["etag"]
+        self.transcript_path.write_bytes(b'{"bot_id": "bot-1", "transcript": [{}]}')
+        stat = self.transcript_path.stat()
+        os.utime(self.transcript_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        response = await self.client.get(
+            "/transcripts/bot-1_m", headers={"if-none-match": etag}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], etag)
+
+    async def test_unknown_or_missing_transcript_returns_404(self):
+        self.assertEqual((await self.client.get("/transcripts/nope")).status_code, 404)
+        self.transcript_path.unlink()
+        self.assertEqual((await self.client.get("/transcripts/bot-1_m")).status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
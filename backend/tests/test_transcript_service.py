@@ -0,0 +1,278 @@
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import orjson
+
+from app.models import MeetingCompletedData
+from app.services import transcript_service as transcript_module
+from app.services.transcript_service import TranscriptMetadata, TranscriptService
+
+
+def metadata(meeting_id, **fields):
+    return TranscriptMetadata(
+        bot_id=meeting_id.split("_")[0],
+        meeting_id=meeting_id,
+        timestamp=datetime(2025, 1, 1, 12, 0),
+        num_speakers=2,
+        transcript_path=f"/data/{meeting_id}_transcript.json",
+        **fields,
+    )
+
+
+def log_line(meta):
+    return orjson.dumps(meta.model_dump(mode="json")) + b"\n"
+
+
+class FakeResponse:
+    """Stands in for an aiohttp response streaming a recording"""
+
+    status = 200
+
+    def __init__(self, body):
+        self.body = body
+        self.content = self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self.body), size):
+            yield self.body[start : start + size]
+
+
+class TranscriptServiceTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.metadata_file = self.dir / "metadata.json"
+        self.metadata_log = self.dir / "metadata.log.jsonl"
+        for name, value in {
+            "TRANSCRIPT_DIR": self.dir,
+            "RECORDING_DIR": self.dir / "recordings",
+            "METADATA_FILE": self.metadata_file,
+            "METADATA_LOG": self.metadata_log,
+        }.items():
+            patcher = mock.patch.object(transcript_module, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def write_snapshot(self, *entries):
+        self.metadata_file.write_bytes(
+            orjson.dumps({m.meeting_id: m.model_dump(mode="json") for m in entries})
+        )
+
+    def read_snapshot(self):
+        return orjson.loads(self.metadata_file.read_bytes())
+
+    async def append(self, service, *entries):
+        for meta in entries:
+            service._metadata_cache[meta.meeting_id] = meta
+            self.assertTrue(await service._append_metadata(meta))
+
+    def test_load_replays_the_log_over_the_snapshot(self):
+        self.write_snapshot(metadata("bot1_a"), metadata("bot2_b"))
+        self.metadata_log.write_bytes(
+            log_line(metadata("bot1_a", recording_path="/data/bot1_a.mp4"))
+            + log_line(metadata("bot3_c"))
+            # A crash mid-append leaves a partial last line
+            + log_line(metadata("bot4_d"))[:20]
+        )
+
+        service = TranscriptService()
+        service._load_existing_transcripts()
+
+        cache = service._metadata_cache
+        self.assertEqual(sorted(cache), ["bot1_a", "bot2_b", "bot3_c"])
+        self.assertEqual(cache["bot1_a"].recording_path, "/data/bot1_a.mp4")
+        self.assertIsInstance(cache["bot1_a"].timestamp, datetime)
+
+        # The replayed log is folded into the snapshot and removed
+        self.assertFalse(self.metadata_log.exists())
+        snapshot = self.read_snapshot()
+        self.assertEqual(sorted(snapshot), ["bot1_a", "bot2_b", "bot3_c"])
+        self.assertEqual(snapshot["bot1_a"]["recording_path"], "/data/bot1_a.mp4")
+
+    def test_load_without_files_starts_empty(self):
+        service = TranscriptService()
+        service._load_existing_transcripts()
+        self.assertEqual(service._metadata_cache, {})
+        self.assertFalse(self.metadata_file.exists())
+
+    async def test_appends_are_compacted_into_the_snapshot(self):
+        service = TranscriptService()
+        with mock.patch.object(transcript_module, "METADATA_COMPACT_EVERY", 3):
+            await self.append(service, metadata("bot0_m"), metadata("bot1_m"))
+            self.assertEqual(len(self.metadata_log.read_bytes().splitlines()), 2)
+            self.assertFalse(self.metadata_file.exists())
+
+            await self.append(service, metadata("bot2_m"))
+        await service.close()
+
+        self.assertFalse(self.metadata_log.exists())
+        self.assertEqual(service._log_entries, 0)
+        self.assertEqual(sorted(self.read_snapshot()), ["bot0_m", "bot1_m", "bot2_m"])
+        self.assertEqual(list(self.dir.glob("*.tmp")), [])
+
+        # A fresh service sees the same entries
+        reloaded = TranscriptService()
+        reloaded._load_existing_transcripts()
+        self.assertEqual(sorted(reloaded._metadata_cache), ["bot0_m", "bot1_m", "bot2_m"])
+
+    async def test_concurrent_updates_share_one_append(self):
+        service = TranscriptService()
+        entries = [metadata(f"bot{n}_m") for n in range(20)]
+
+        with mock.patch.object(
+            transcript_module, "_append_lines_sync", wraps=transcript_module._append_lines_sync
+        ) as append_lines:
+            await asyncio.gather(*(self.append(service, meta) for meta in entries))
+        await service.close()
+
+        append_lines.assert_called_once()
+        self.assertEqual(len(self.metadata_log.read_bytes().splitlines()), 20)
+        self.assertEqual(service._log_entries, 20)
+
+    async def test_updates_after_close_are_still_written(self):
+        service = TranscriptService()
+        await self.append(service, metadata("bot1_m"))
+        await service.close()
+
+        await self.append(service, metadata("bot2_m"))
+
+        self.assertEqual(len(self.metadata_log.read_bytes().splitlines()), 2)
+
+    async def test_close_waits_for_recording_downloads(self):
+        service = TranscriptService()
+        session = mock.Mock()
+        session.get.return_value = FakeResponse(b"mp4" * 1000)
+        meta = metadata("bot1_m")
+        service._metadata_cache[meta.meeting_id] = meta
+
+        with mock.patch.object(service, "_get_session", return_value=session):
+            service._download_tasks[meta.bot_id] = asyncio.create_task(
+                service._download_recording(meta.meeting_id, "https://example.com/r.mp4", meta)
+            )
+            await service.close()
+
+        self.assertEqual(service._download_tasks, {})
+        self.assertTrue((self.dir / "recordings" / "bot1_m.mp4").exists())
+        self.assertIn(b"bot1_m.mp4", self.metadata_log.read_bytes())
+
+    async def test_unreadable_snapshot_keeps_the_log(self):
+        self.write_snapshot(*(metadata(f"a{n}_m") for n in range(100)))
+        truncated = self.metadata_file.read_bytes()[:2000]
+        self.metadata_file.write_bytes(truncated)
+        self.metadata_log.write_bytes(log_line(metadata("b_200")))
+
+        service = TranscriptService()
+        service._load_existing_transcripts()
+        # The log is still replayed
+        self.assertEqual(list(service._metadata_cache), ["b_200"])
+
+        with mock.patch.object(transcript_module, "METADATA_COMPACT_EVERY", 1):
+            await self.append(service, metadata("b_300"))
+        await service.close()
+
+        # Neither the damaged snapshot nor any logged update is thrown away
+        self.assertEqual(self.metadata_file.read_bytes(), truncated)
+        self.assertEqual(
+            [orjson.loads(line)["meeting_id"] for line in self.metadata_log.read_bytes().splitlines()],
+            ["b_200", "b_300"],
+        )
+
+    def test_failed_snapshot_write_keeps_the_old_snapshot(self):
+        self.write_snapshot(metadata("bot1_a"))
+        self.metadata_log.write_bytes(log_line(metadata("bot2_b")))
+        before = self.metadata_file.read_bytes()
+
+        service = TranscriptService()
+        with mock.patch.object(transcript_module.os, "replace", side_effect=OSError("disk full")):
+            self.assertFalse(service._save_metadata_sync([metadata("bot2_b")]))
+
+        self.assertEqual(self.metadata_file.read_bytes(), before)
+        self.assertTrue(self.metadata_log.exists())
+        self.assertEqual(list(self.dir.glob("*.tmp")), [])
+
+    async def test_concurrent_saves_for_a_bot_share_one_meeting(self):
+        service = TranscriptService()
+        downloads = []
+
+        async def download(meeting_id, mp4_url, meta):
+            downloads.append(meeting_id)
+            await asyncio.sleep(0.01)
+            service._release(meta.bot_id)
+
+        data = MeetingCompletedData(
+            bot_id="bot1",
+            mp4="https://example.com/recording.mp4",
+            speakers=["Alice"],
+            transcript=[
+                {"speaker": "Alice", "words": [{"start": 1.0, "end": 2.5, "word": "Hi"}]}
+            ],
+        )
+        with mock.patch.object(service, "_download_recording", side_effect=download):
+            first, second = await asyncio.gather(
+                service.save_meeting_transcript("bot1", data),
+                service.save_meeting_transcript("bot1", data),
+            )
+            await asyncio.gather(*service._download_tasks.values())
+        await service.close()
+
+        self.assertEqual(first, second)
+        self.assertEqual(downloads, [first])
+        self.assertEqual(list(service._metadata_cache), [first])
+        self.assertEqual(service._metadata_cache[first].duration, 1.5)
+        self.assertEqual(len(list(self.dir.glob("*_transcript.json"))), 1)
+        self.assertEqual(service._saves, {})
+
+    async def download_recording(self, service):
+        meta = metadata("bot1_m")
+        session = mock.Mock()
+        session.get.return_value = FakeResponse(b"mp4" * 1000)
+        with mock.patch.object(service, "_get_session", return_value=session):
+            await service._download_recording(meta.meeting_id, "https://example.com/r.mp4", meta)
+        return meta
+
+    async def test_download_without_fdatasync_uses_fsync(self):
+        service = TranscriptService()
+        fdatasync = getattr(transcript_module.os, "fdatasync", None)
+        if fdatasync is not None:
+            del transcript_module.os.fdatasync
+            self.addCleanup(setattr, transcript_module.os, "fdatasync", fdatasync)
+
+        with mock.patch.object(
+            transcript_module.os, "fsync", wraps=transcript_module.os.fsync
+        ) as fsync:
+            meta = await self.download_recording(service)
+        await service.close()
+
+        fsync.assert_called_once()
+        recording = self.dir / "recordings" / "bot1_m.mp4"
+        self.assertEqual(meta.recording_path, str(recording))
+        self.assertEqual(recording.read_bytes(), b"mp4" * 1000)
+
+    async def test_failed_flush_keeps_the_download(self):
+        service = TranscriptService()
+        with mock.patch.object(
+            transcript_module.os, "fsync", side_effect=OSError("not supported")
+        ), mock.patch.object(
+            transcript_module.os, "fdatasync", side_effect=OSError("not supported"), create=True
+        ):
+            meta = await self.download_recording(service)
+        await service.close()
+
+        self.assertTrue((self.dir / "recordings" / "bot1_m.mp4").exists())
+        self.assertIsNotNone(meta.recording_path)
+        self.assertEqual(list((self.dir / "recordings").glob("*.part")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from app.models import WEBHOOK_EVENT_ADAPTER
+from app.services import webhook_service as webhook_module
+from app.services.webhook_service import WebhookService
+
+
+def complete_event(bot_id):
+    return WEBHOOK_EVENT_ADAPTER.validate_python(
+        {
+            "event": "complete",
+            "data": {
+                "bot_id": bot_id,
+                "mp4": "https://example.com/recording.mp4",
+                "speakers": ["Alice"],
+                "transcript": [
+                    {
+                        "speaker": "Alice",
+                        "words": [{"start": 0.0, "end": 0.4, "word": "Hello"}],
+                    }
+                ],
+            },
+        }
+    )
+
+
+class WebhookServiceTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.saved = []
+
+        async def save(bot_id, data):
+            await asyncio.sleep(0.01)
+            self.saved.append(bot_id)
+            return f"{bot_id}_meeting"
+
+        patcher = mock.patch.object(
+            webhook_module.transcript_service,
+            "save_meeting_transcript",
+            side_effect=save,
+        )
+        self.save = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = WebhookService()
+
+    async def asyncTearDown(self):
+        await self.service.stop()
+
+    async def test_enqueue_requires_a_running_worker(self):
+        self.assertFalse(self.service.enqueue(complete_event("bot-1")))
+
+    async def test_stop_processes_every_queued_event(self):
+        self.service.start()
+        for n in range(50):
+            self.assertTrue(self.service.enqueue(complete_event(f"bot-{n}")))
+
+        await self.service.stop()
+
+        self.assertEqual(sorted(self.saved), sorted(f"bot-{n}" for n in range(50)))
+        self.assertFalse(self.service.enqueue(complete_event("late")))
+
+    async def test_stop_waits_for_the_batch_in_flight(self):
+        self.service.start()
+        self.service.enqueue(complete_event("bot-1"))
+        # Let the worker take the event off the queue and start saving it
+        while not self.save.await_count:
+            await asyncio.sleep(0)
+        self.assertTrue(self.service._queue.empty())
+
+        await self.service.stop()
+
+        self.assertEqual(self.saved, ["bot-1"])
+
+    async def test_failed_save_does_not_stop_the_worker(self):
+        self.save.side_effect = [RuntimeError("disk full"), "bot-2_meeting"]
+        self.service.start()
+        self.service.enqueue(complete_event("bot-1"))
+        self.service.enqueue(complete_event("bot-2"))
+
+        await self.service.stop()
+
+        self.assertEqual(self.save.await_count, 2)
+
+    async def test_full_queue_rejects_events(self):
+        with mock.patch.object(webhook_module, "WEBHOOK_QUEUE_SIZE", 1):
+            self.service.start()
+        self.assertTrue(self.service.enqueue(complete_event("bot-1")))
+        self.assertFalse(self.service.enqueue(complete_event("bot-2")))
+
+
+if __name__ == "__main__":
+    unittest.main()